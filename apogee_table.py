@@ -0,0 +1,197 @@
+import os
+import numpy as np
+from rocket_simulation import ENGINES, simulation_fingerprint
+from batch_simulation import simulate_batch
+from field_geometry import FieldGeometry
+
+# Kept in the user's cache dir so read-only installs can still save it
+DEFAULT_TABLE_PATH = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+                                  "rocket_game", "apogee_table.npz")
+
+
+class ApogeeTable:
+    """Precomputed max altitude and landing x over (engine, wind speed, wind direction)
+
+    Built offline with the batch simulator and queried by bilinear
+    interpolation in wind speed and (periodic) wind direction. Landings are
+    classified by the FieldGeometry the table was built for (the default
+    site if None); field_key records that site so a table built for another
+    one counts as stale.
+    """
+
+    def __init__(self, engines, speeds, directions, max_altitude, landing_x, fingerprint,
+                 field=None, field_key=None, errors=None):
+        self.engines = list(engines)
+        self.speeds = np.asarray(speeds, dtype=float)
+        self.directions = np.asarray(directions, dtype=float)
+        self.max_altitude = np.asarray(max_altitude, dtype=float)
+        self.landing_x = np.asarray(landing_x, dtype=float)
+        self.fingerprint = fingerprint
+        self.field = field or FieldGeometry.default()
+        self.field_length = self.field.length
+        self.field_key = repr(self.field.key()) if field_key is None else field_key
+        self.errors = errors or {}
+
+        # Uniform grid spacing; nested lists make scalar lookups cheap
+        self._engine_index = {engine: i for i, engine in enumerate(self.engines)}
+        self._speed_origin = float(self.speeds[0])
+        self._speed_step = float(self.speeds[1] - self.speeds[0])
+        self._direction_step = float(self.directions[1] - self.directions[0])
+        self._altitude_rows = self.max_altitude.tolist()
+        self._landing_rows = self.landing_x.tolist()
+
+    @classmethod
+    def build(cls, speed_step=0.25, max_speed=10.0, direction_step=5.0, field=None):
+        """Simulate every grid point with the batch engine"""
+        field = field or FieldGeometry.default()
+        engines = list(ENGINES)
+        speeds = np.arange(0.0, max_speed + speed_step / 2, speed_step)
+        directions = np.arange(0.0, 360.0, direction_step)
+        grid_engines, grid_speeds, grid_directions = np.meshgrid(
+            engines, speeds, directions, indexing="ij")
+        results = simulate_batch(grid_engines, grid_speeds, grid_directions, field=field)
+        shape = grid_engines.shape
+        return cls(engines, speeds, directions,
+                   results["max_altitude"].reshape(shape),
+                   results["landing_x"].reshape(shape),
+                   simulation_fingerprint(), field)
+
+    @classmethod
+    def load(cls, path=DEFAULT_TABLE_PATH, field=None):
+        """Load a saved table to be used on `field` (the default site if None)"""
+        data = np.load(path)
+        errors = {key[len("error_"):]: float(data[key]) for key in data.files if key.startswith("error_")}
+        field_key = str(data["field_key"]) if "field_key" in data.files else ""  # Older tables: stale
+        return cls(data["engines"], data["speeds"], data["directions"], data["max_altitude"],
+                   data["landing_x"], str(data["fingerprint"]), field, field_key, errors)
+
+    @classmethod
+    def load_or_build(cls, path=DEFAULT_TABLE_PATH, field=None):
+        """Load the table from disk, rebuilding it if missing or stale
+
+        A rebuilt table that cannot be saved is still returned, and is
+        rebuilt again next time.
+        """
+        if os.path.exists(path):
+            table = cls.load(path, field)
+            if table.is_current():
+                return table
+        table = cls.build(field=field)
+        try:
+            table.save(path)
+        except OSError:
+            pass
+        return table
+
+    def save(self, path=DEFAULT_TABLE_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        errors = {f"error_{key}": value for key, value in self.errors.items()}
+        np.savez(path, engines=np.array(self.engines), speeds=self.speeds, directions=self.directions,
+                 max_altitude=self.max_altitude, landing_x=self.landing_x,
+                 fingerprint=self.fingerprint, field_key=self.field_key, **errors)
+
+    def is_current(self):
+        """True if the table was built from the current simulator parameters for its field"""
+        return self.fingerprint == simulation_fingerprint() and self.field_key == repr(self.field.key())
+
+    def query(self, engine_type, wind_speed, wind_direction):
+        """Interpolated (max_altitude, landing_x, landing_zone) for one flight"""
+        altitude_rows = self._altitude_rows[self._engine_index[engine_type]]
+        landing_rows = self._landing_rows[self._engine_index[engine_type]]
+
+        # Wind speed is clamped to the table range
+        last = len(altitude_rows) - 2
+        position = (wind_speed - self._speed_origin) / self._speed_step
+        i = min(max(int(position), 0), last)
+        ts = min(max(position - i, 0.0), 1.0)
+
+        # Wind direction wraps around
+        count = len(altitude_rows[0])
+        position = (wind_direction % 360.0) / self._direction_step
+        j = int(position) % count
+        j1 = (j + 1) % count
+        td = position - int(position)
+
+        def interpolate(rows):
+            low, high = rows[i], rows[i + 1]
+            return ((low[j] * (1 - td) + low[j1] * td) * (1 - ts) +
+                    (high[j] * (1 - td) + high[j1] * td) * ts)
+
+        landing_x = interpolate(landing_rows)
+        landing = "field" if self.field.in_field(landing_x) else "trees"
+        return interpolate(altitude_rows), landing_x, landing
+
+    def query_many(self, engine_types, wind_speeds, wind_directions):
+        """Vectorized query; returns arrays of max altitude, landing x and in-field flags"""
+        engine_types, wind_speeds, wind_directions = np.broadcast_arrays(
+            np.asarray(engine_types), np.asarray(wind_speeds, dtype=float),
+            np.asarray(wind_directions, dtype=float))
+        unknown = set(np.unique(engine_types).tolist()) - set(self._engine_index)
+        if unknown:
+            raise KeyError(", ".join(sorted(map(str, unknown))))  # As query() does for one engine
+        e = np.zeros(engine_types.shape, dtype=int)
+        for engine, index in self._engine_index.items():
+            e[engine_types == engine] = index
+
+        position = np.clip((wind_speeds - self._speed_origin) / self._speed_step, 0, len(self.speeds) - 1)
+        i = np.minimum(position.astype(int), len(self.speeds) - 2)
+        ts = position - i
+
+        count = len(self.directions)
+        position = (wind_directions % 360.0) / self._direction_step
+        j = position.astype(int) % count
+        j1 = (j + 1) % count
+        td = position - np.floor(position)
+
+        def interpolate(table):
+            return ((table[e, i, j] * (1 - td) + table[e, i, j1] * td) * (1 - ts) +
+                    (table[e, i + 1, j] * (1 - td) + table[e, i + 1, j1] * td) * ts)
+
+        landing_x = interpolate(self.landing_x)
+        in_field = self.field.in_field(landing_x)
+        return interpolate(self.max_altitude), landing_x, in_field
+
+    def measure_error(self, samples=5000, seed=0):
+        """Compare the table against direct simulation at random off-grid points"""
+        rng = np.random.default_rng(seed)
+        engines = rng.choice(self.engines, samples)
+        speeds = rng.uniform(self.speeds[0], self.speeds[-1], samples)
+        directions = rng.uniform(0, 360, samples)
+
+        altitude, landing_x, in_field = self.query_many(engines, speeds, directions)
+        direct = simulate_batch(engines, speeds, directions, field=self.field)
+        altitude_error = np.abs(altitude - direct["max_altitude"])
+        landing_error = np.abs(landing_x - direct["landing_x"])
+
+        self.errors = {
+            "altitude_max": float(np.max(altitude_error)),
+            "altitude_p99": float(np.percentile(altitude_error, 99)),
+            "landing_x_max": float(np.max(landing_error)),
+            "landing_x_p99": float(np.percentile(landing_error, 99)),
+            "zone_mismatch_rate": float(np.mean(in_field != direct["in_field"])),
+        }
+        return self.errors
+
+
+if __name__ == "__main__":
+    # Regenerate the table and report its error against direct simulation
+    import time
+
+    start = time.perf_counter()
+    table = ApogeeTable.build()
+    print(f"Built {table.max_altitude.size} grid points in {time.perf_counter() - start:.1f}s "
+          f"(fingerprint {table.fingerprint})")
+
+    errors = table.measure_error()
+    print(f"Max altitude error: {errors['altitude_max']:.3f}m (99th percentile {errors['altitude_p99']:.3f}m)")
+    print(f"Landing x error: {errors['landing_x_max']:.3f}m (99th percentile {errors['landing_x_p99']:.3f}m)")
+    print(f"Landing zone mismatches: {errors['zone_mismatch_rate']*100:.2f}%")
+
+    table.save()
+    print(f"Saved {DEFAULT_TABLE_PATH}")
+
+    queries = 100000
+    start = time.perf_counter()
+    for _ in range(queries):
+        table.query('B', 4.3, 217.0)
+    print(f"Query time: {(time.perf_counter() - start) / queries * 1e6:.2f}us")
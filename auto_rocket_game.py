@@ -3,6 +3,7 @@ import matplotlib.pyplot as plt
 import random
 import math
 from rocket_simulation import RocketSimulation, ENGINES
+from apogee_table import ApogeeTable
 
 def auto_flight_demo():
     """Run an automatic flight demonstration"""
@@ -89,6 +90,9 @@ def run_multiple_auto_flights(num_flights=3):
     total_score = 0
     engines = ['A', 'B', 'C']
     
+    # Scoring only needs altitude and landing zone, so use the lookup table
+    table = ApogeeTable.load_or_build()
+    
     for flight_num in range(1, num_flights + 1):
         print(f"\n--- AUTO FLIGHT {flight_num}/{num_flights} ---")
         
@@ -101,9 +105,8 @@ def run_multiple_auto_flights(num_flights=3):
         
         print(f"Engine: {engine}, Wind: {wind_speed:.1f} m/s")
         
-        # Simulate flight
-        sim = RocketSimulation(engine, wind_speed, wind_direction)
-        altitude, landing = sim.simulate_flight()
+        # Look up flight outcome
+        altitude, _, landing = table.query(engine, wind_speed, wind_direction)
         
         print(f"Altitude: {altitude:.0f}m ({altitude*3.28:.0f}ft), Landing: {landing}")
         
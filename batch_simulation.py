@@ -0,0 +1,143 @@
+import numpy as np
+from rocket_simulation import RocketSimulation, ENGINES
+
+
+def simulate_batch(engine_types, wind_speeds, wind_directions, dt=0.01, max_time=300, field=None):
+    """Integrate many rocket flights at once.
+
+    Uses the same explicit Euler model as RocketSimulation.step, but the rocket
+    state is held as NumPy arrays (one entry per flight) and rockets that have
+    landed (on the field, or in the branches outside it) are dropped from the
+    working set. Arguments are broadcast
+    against each other, so a single engine letter can be paired with arrays of
+    wind conditions. `field` is the FieldGeometry to land in (the default site
+    if None).
+
+    Returns a dict of per-flight arrays: max_altitude, apogee_time, landing_x,
+    in_field, landing_zone ("field" or "trees") and steps (integration steps
+    until landing).
+    """
+    engine_types, wind_speeds, wind_directions = np.broadcast_arrays(
+        np.asarray(engine_types), np.asarray(wind_speeds, dtype=float),
+        np.asarray(wind_directions, dtype=float))
+    engine_types = engine_types.ravel()
+    wind_speeds = wind_speeds.ravel()
+    wind_directions = wind_directions.ravel()
+    n = engine_types.size
+    unknown = set(np.unique(engine_types).tolist()) - set(ENGINES)
+    if unknown:
+        raise KeyError(", ".join(sorted(map(str, unknown))))  # As RocketSimulation does for one engine
+
+    # Physical constants come from a reference simulation so the two stay in sync
+    reference = RocketSimulation(field=field)
+    rocket = reference.rocket
+    drag_constant = 0.5 * reference.air_density * rocket.cd * rocket.area
+    field = reference.field
+
+    # Per-flight engine parameters
+    burn_time = np.zeros(n)
+    thrust = np.zeros(n)
+    for engine_type, engine in ENGINES.items():
+        selected = engine_types == engine_type
+        burn_time[selected] = engine.burn_time
+        thrust[selected] = engine.average_thrust
+
+    # Wind vectors (same convention as RocketSimulation)
+    wind_radians = np.radians(wind_directions)
+    wind_x = wind_speeds * np.cos(wind_radians)
+    wind_y = wind_speeds * np.sin(wind_radians)
+
+    # Structure-of-arrays state for the flights still in the air
+    active = np.arange(n)
+    x = np.full(n, reference.field_length / 2)  # Start at center of field
+    y = np.zeros(n)
+    vx = np.zeros(n)
+    vy = np.zeros(n)
+
+    max_altitude = np.zeros(n)
+    apogee_time = np.zeros(n)
+    landing_x = np.zeros(n)
+    steps = np.zeros(n, dtype=np.int64)
+
+    time = 0.0
+    step = 0
+    while active.size > 0:
+        # Drag relative to the wind
+        rx = vx - wind_x[active]
+        ry = vy - wind_y[active]
+        speed = np.sqrt(rx * rx + ry * ry)
+        moving = speed != 0
+        safe_speed = np.where(moving, speed, 1.0)
+        drag_magnitude = drag_constant * speed ** 2
+        drag_x = np.where(moving, drag_magnitude * (-rx / safe_speed), 0.0)
+        drag_y = np.where(moving, drag_magnitude * (-ry / safe_speed), 0.0)
+
+        thrust_y = np.where(time <= burn_time[active], thrust[active], 0.0)
+
+        # Propellant burns off linearly (same expression as RocketSimulation.mass_at)
+        mass = np.where(time >= burn_time[active], rocket.dry_mass,
+                        rocket.dry_mass + rocket.propellant_mass * (1 - time / burn_time[active]))
+
+        # Euler integration
+        vx += (drag_x / mass) * dt
+        vy += ((thrust_y + drag_y + -mass * reference.g) / mass) * dt
+        x += vx * dt
+        y += vy * dt
+        time += dt
+        step += 1
+
+        # Track maximum altitude
+        higher = y > max_altitude[active]
+        if higher.any():
+            max_altitude[active[higher]] = y[higher]
+            apogee_time[active[higher]] = time
+
+        # Drop rockets that reached the ground or the branches; only rockets
+        # below the tallest tree need their landing height looked up
+        low = np.flatnonzero(y <= field.max_height)
+        landed = np.zeros(active.size, dtype=bool)
+        if low.size:
+            landed[low] = y[low] <= field.landing_heights(x[low])
+        if landed.any():
+            landing_x[active[landed]] = x[landed]
+            steps[active[landed]] = step
+            flying = ~landed
+            active, x, y, vx, vy = active[flying], x[flying], y[flying], vx[flying], vy[flying]
+
+        # Safety check for runaway simulation
+        if time > max_time:
+            landing_x[active] = x
+            steps[active] = step
+            break
+
+    in_field = field.in_field(landing_x)
+    return {
+        "max_altitude": max_altitude,
+        "apogee_time": apogee_time,
+        "landing_x": landing_x,
+        "in_field": in_field,
+        "landing_zone": np.where(in_field, "field", "trees"),
+        "steps": steps,
+    }
+
+
+if __name__ == "__main__":
+    # Compare a batch of random flights against the single-flight simulator
+    import time
+
+    num_flights = 10000
+    rng = np.random.default_rng(0)
+    engines = rng.choice(list(ENGINES), num_flights)
+    speeds = rng.uniform(0, 8, num_flights)
+    directions = rng.uniform(0, 360, num_flights)
+
+    start = time.perf_counter()
+    results = simulate_batch(engines, speeds, directions)
+    elapsed = time.perf_counter() - start
+    print(f"{num_flights} flights in {elapsed:.2f}s ({num_flights/elapsed:.0f} flights/s)")
+
+    for i in range(5):
+        sim = RocketSimulation(engines[i], speeds[i], directions[i])
+        altitude, landing = sim.simulate_flight()
+        print(f"Engine {engines[i]}: batch {results['max_altitude'][i]:.3f}m {results['landing_zone'][i]}, "
+              f"single {altitude:.3f}m {landing}")
@@ -0,0 +1,242 @@
+import importlib.util
+import os
+import time
+import numpy as np
+from rocket_simulation import RocketSimulation
+
+GAME_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rocket_game_v2.0.py")
+
+
+def load_game():
+    """Import the v2.0 game module with SDL's dummy video and audio drivers"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    spec = importlib.util.spec_from_file_location("rocket_game", GAME_PATH)
+    game = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(game)
+    return game
+
+
+def time_call(function, repeat=5):
+    """Best wall time of several calls, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_kernels(engines="ABC", wind_speed=5, wind_direction=30):
+    """Compare per-flight wall time of the NumPy and scalar Euler kernels"""
+    print("\n=== Physics kernel: per-flight wall time ===")
+    for engine in engines:
+        timings = {}
+        results = {}
+        for kernel in ("numpy", "scalar"):
+            def flight():
+                sim = RocketSimulation(engine, wind_speed, wind_direction, kernel=kernel)
+                results[kernel] = (sim.simulate_flight(), sim.rocket.position.copy())
+            timings[kernel] = time_call(flight)
+
+        (altitude_a, landing_a), position_a = results["numpy"]
+        (altitude_b, landing_b), position_b = results["scalar"]
+        difference = max(abs(altitude_a - altitude_b), np.max(np.abs(position_a - position_b)))
+        print(f"Engine {engine}: numpy {timings['numpy']*1000:.1f}ms, scalar {timings['scalar']*1000:.1f}ms "
+              f"({timings['numpy']/timings['scalar']:.1f}x), max difference {difference:.1e}m, "
+              f"landing {landing_a}/{landing_b}")
+
+
+def _per_sample(duration, sample, sample_rate=22050):
+    """Reference synthesis: one Python call per sample, as the game used to do"""
+    frames = int(duration * sample_rate)
+    arr = np.zeros(frames)
+    for i in range(frames):
+        arr[i] = sample(float(i) / sample_rate, i, arr)
+    return arr
+
+
+def _time_travel_sample(t, i, arr):
+    freq = 200 + 800 * t
+    magic = 0.3 * np.sin(2 * np.pi * freq * t) * (1 - t/1.5)
+    if i > 1000:
+        magic += 0.1 * arr[i-1000]
+    return magic
+
+
+# The per-sample formulas the sound effects were originally built with
+REFERENCE_EFFECTS = {
+    'rocket_launch': (2.0, lambda t, i, arr: np.random.uniform(-0.3, 0.3)
+                      + 0.4 * np.sin(2 * np.pi * 80 * t) * np.exp(-t * 0.5)
+                      + 0.2 * np.sin(2 * np.pi * 400 * t) * np.exp(-t * 2.0)),
+    'countdown_beep': (0.3, lambda t, i, arr: 0.3 * np.sin(2 * np.pi * 800 * t) * np.exp(-t * 8)),
+    'collect_sound': (0.5, lambda t, i, arr: 0.4 * np.sin(2 * np.pi * 1200 * t) * np.exp(-t * 4)
+                      + 0.2 * np.sin(2 * np.pi * 1600 * t) * np.exp(-t * 6)),
+    'time_travel_sound': (1.5, _time_travel_sample),
+    'baseball_hit': (0.2, lambda t, i, arr: 0.5 * np.random.uniform(-1, 1) * np.exp(-t * 15)),
+    'parachute_deploy': (0.8, lambda t, i, arr: 0.2 * np.sin(2 * np.pi * 120 * t) * np.exp(-t * 2)),
+    'game_over_sound': (2.0, lambda t, i, arr: 0.4 * np.sin(2 * np.pi * 400 * np.exp(-t * 2) * t) * (1 - t/2.0)
+                        + 0.2 * np.sin(2 * np.pi * 400 * np.exp(-t * 2) * 0.7 * t) * (1 - t/2.0)),
+    'menu_click': (0.1, lambda t, i, arr: 0.3 * np.sin(2 * np.pi * 600 * t) * np.exp(-t * 20)),
+    'wind_ambient': (3.0, lambda t, i, arr: 0.1 * np.random.uniform(-1, 1) * np.sin(2 * np.pi * 0.5 * t)),
+    'dinosaur_roar': (1.5, lambda t, i, arr: 0.4 * np.sin(2 * np.pi * 120 * t) * np.exp(-t * 0.8)
+                      + 0.2 * np.sin(2 * np.pi * 240 * t) * np.exp(-t * 1.2)
+                      + 0.1 * np.random.uniform(-0.5, 0.5)),
+    'robot_beep': (0.4, lambda t, i, arr: 0.3 * np.sin(2 * np.pi * 880 * t) * np.exp(-t * 5)
+                   + 0.2 * np.sin(2 * np.pi * 1760 * t) * np.exp(-t * 8)),
+}
+
+
+def benchmark_sound_synthesis():
+    """Compare per-sample and vectorized sound-effect synthesis (startup cost)"""
+    game = load_game()
+    print("\n=== Sound effect synthesis ===")
+    total_reference = total_vectorized = 0.0
+    for name, (duration, sample) in REFERENCE_EFFECTS.items():
+        # Same seed for both, so the noise-based effects are comparable too
+        np.random.seed(0)
+        start = time.perf_counter()
+        reference = _per_sample(duration, sample)
+        reference_time = time.perf_counter() - start
+
+        np.random.seed(0)
+        start = time.perf_counter()
+        vectorized = game.synthesize(game.SOUND_EFFECTS[name][1], duration)
+        vectorized_time = time.perf_counter() - start
+
+        total_reference += reference_time
+        total_vectorized += vectorized_time
+        difference = np.max(np.abs(reference - vectorized))
+        print(f"{name:18s} {reference_time*1000:8.1f}ms -> {vectorized_time*1000:6.2f}ms, "
+              f"max difference {difference:.1e}")
+
+    print(f"{'total':18s} {total_reference*1000:8.1f}ms -> {total_vectorized*1000:6.2f}ms "
+          f"({total_reference/total_vectorized:.0f}x)")
+
+    # Cold start synthesizes and fills the disk cache; warm start only loads it
+    import tempfile
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for label in ("cold", "warm"):
+            start = time.perf_counter()
+            manager = game.SoundManager(cache_dir=cache_dir)
+            manager.create_background_music("flight")
+            print(f"SoundManager() + flight music, {label} cache: "
+                  f"{(time.perf_counter() - start)*1000:.1f}ms ({manager.synthesized_count} buffers synthesized)")
+
+
+def _run_flight_frames(game, dirty_rects, frames=300):
+    """Draw a countdown and flight with a fixed wind; returns CPU seconds per frame"""
+    import pygame
+    sim_game = game.VisualRocketGame(dirty_rects=dirty_rects)
+    sim_game.sound_manager.sounds_enabled = False
+    sim_game.sound_manager.music_enabled = False
+    sim_game.selected_engine = 'B'
+    sim_game.wind_speed = 4.0
+    sim_game.wind_direction = 90
+    sim_game.start_flight()
+    sim_game.countdown_start_time = pygame.time.get_ticks() - sim_game.countdown_duration + 500
+
+    frame_times = []
+    for _ in range(frames):
+        start = time.process_time()
+        sim_game.begin_frame()
+        if sim_game.state == "countdown":
+            sim_game.draw_countdown()
+        elif sim_game.state == "flying":
+            sim_game.update_simulation()
+            sim_game.draw_flight()
+        else:
+            break
+        sim_game.present_frame()
+        frame_times.append(time.process_time() - start)
+    return np.array(frame_times)
+
+
+def benchmark_dirty_rects():
+    """Compare CPU time per frame with full flips and with dirty-rectangle updates"""
+    game = load_game()
+    print("\n=== Flight rendering: CPU time per frame ===")
+    for dirty_rects in (False, True):
+        frame_times = _run_flight_frames(game, dirty_rects)
+        label = "dirty rects" if dirty_rects else "full flip"
+        print(f"{label:12s} mean {frame_times.mean()*1000:.2f}ms, "
+              f"95th percentile {np.percentile(frame_times, 95)*1000:.2f}ms over {frame_times.size} frames")
+
+
+class _ReferenceParticle:
+    """Reference particle: one object per particle, as the game used to do"""
+
+    def __init__(self, x, y, vx, vy, life, color):
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+        self.life = self.max_life = life
+        self.color = color
+
+    def update(self):
+        self.x += self.vx
+        self.y += self.vy
+        self.vy += 0.1
+        self.life -= 1
+        alpha = self.life / self.max_life
+        self.current_color = (int(self.color[0] * alpha), int(self.color[1] * alpha),
+                              int(self.color[2] * alpha))
+
+
+def _draw_circles(screen, particles):
+    """Reference particle drawing: one pygame.draw.circle call per particle"""
+    import pygame
+    for particle in particles:
+        pygame.draw.circle(screen, particle.current_color, (int(particle.x), int(particle.y)), int(particle.size))
+
+
+def benchmark_particles(counts=(1000, 5000), frames=50):
+    """Compare per-frame particle update and draw time for Particle objects and the NumPy pool"""
+    import pygame
+    game = load_game()
+    screen = pygame.display.set_mode((game.SCREEN_WIDTH, game.SCREEN_HEIGHT))
+    print("\n=== Particles: time per frame ===")
+    for count in counts:
+        rng = np.random.default_rng(0)
+        x, y = rng.uniform(0, game.SCREEN_WIDTH, count), rng.uniform(0, game.SCREEN_HEIGHT, count)
+        vx, vy = rng.uniform(-3, 3, count), rng.uniform(1, 8, count)
+        life = np.full(count, 10 ** 6)  # Long-lived, so every particle stays live
+        color = np.tile(game.WHITE, (count, 1))
+
+        particles = [_ReferenceParticle(*args, game.WHITE)
+                     for args in zip(x.tolist(), y.tolist(), vx.tolist(), vy.tolist(), life.tolist())]
+        for particle, size in zip(particles, rng.uniform(2, 5, count).tolist()):
+            particle.size = size
+
+        def update_objects():
+            nonlocal particles
+            for _ in range(frames):
+                particles = [p for p in particles if p.life > 0]
+                for particle in particles:
+                    particle.update()
+
+        pool = game.ParticlePool(capacity=count)
+        pool.spawn(x, y, vx, vy, life, color)
+
+        def update_pool():
+            for _ in range(frames):
+                pool.update()
+
+        objects_time = time_call(update_objects, repeat=3) / frames
+        pool_time = time_call(update_pool, repeat=3) / frames
+        print(f"{count:5d} particles, update: objects {objects_time*1000:.2f}ms, pool {pool_time*1000:.3f}ms "
+              f"({objects_time/pool_time:.0f}x)")
+
+        # Particles have left the screen by now; draw them from their spawn points
+        for particle, px, py in zip(particles, x.tolist(), y.tolist()):
+            particle.x, particle.y = px, py
+        pool.position[:, 0], pool.position[:, 1] = x, y
+        circles_time = time_call(lambda: _draw_circles(screen, particles))
+        atlas_time = time_call(lambda: pool.draw(screen))
+        print(f"{count:5d} particles, draw: circles {circles_time*1000:.2f}ms, atlas blits {atlas_time*1000:.2f}ms "
+              f"({circles_time/atlas_time:.1f}x); per 1000: {circles_time/count*1e6:.2f}ms -> "
+              f"{atlas_time/count*1e6:.2f}ms")
+
+if __name__ == "__main__":
+    benchmark_kernels()
+    benchmark_sound_synthesis()
+    benchmark_dirty_rects()
+    benchmark_particles()
@@ -0,0 +1,187 @@
+import os
+import numpy as np
+import matplotlib.pyplot as plt
+from rocket_simulation import ENGINES, simulation_fingerprint
+from batch_simulation import simulate_batch
+
+DEFAULT_MAP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dispersion_map.npz")
+
+
+def _simulate_in_field(engine_index, engines, speeds, directions):
+    """Field landings (bool) for flights given as parallel arrays, each distinct flight simulated once"""
+    keys = np.stack([engine_index.astype(float), speeds, directions], axis=1)
+    unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+    results = simulate_batch(np.asarray(engines)[unique[:, 0].astype(int)], unique[:, 1], unique[:, 2])
+    return results["in_field"][inverse.ravel()], len(unique)
+
+
+class DispersionMap:
+    """Probability of a field landing over (engine, wind speed, wind direction) cells
+
+    Each cell spans one wind speed step and one wind direction step, and its
+    probability is the fraction of the winds inside it (taken as uniformly
+    likely) that bring the rocket down on the field. Cells whose corners all
+    agree are taken to be all field or all trees. Cells that straddle the
+    field/tree boundary are split into quarters, again and again up to
+    max_depth, so only the boundary is sampled densely. Every refinement
+    level is one batch simulation.
+    """
+
+    def __init__(self, engines, speeds, directions, field_probability, depth, flights, fingerprint):
+        self.engines = list(engines)
+        self.speeds = np.asarray(speeds, dtype=float)  # Cell edges (m/s)
+        self.directions = np.asarray(directions, dtype=float)  # Cell edges (degrees, 0 to 360)
+        self.field_probability = np.asarray(field_probability, dtype=float)  # (engine, speed, direction)
+        self.depth = np.asarray(depth)  # Refinement depth reached in each cell
+        self.flights = int(flights)  # Flights simulated to build the map
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(cls, speed_step=0.5, max_speed=10.0, direction_step=10.0, max_depth=4):
+        """Simulate the cell corners, then refine the cells the boundary passes through"""
+        engines = list(ENGINES)
+        speeds = np.arange(0.0, max_speed + speed_step / 2, speed_step)
+        directions = np.arange(0.0, 360.0 + direction_step / 2, direction_step)
+        shape = (len(engines), len(speeds) - 1, len(directions) - 1)
+
+        # Corners of every cell (the 360 degree edge reuses the 0 degree flights)
+        grid_e, grid_s, grid_d = np.meshgrid(np.arange(len(engines)), speeds, directions[:-1], indexing="ij")
+        corners, flights = _simulate_in_field(grid_e.ravel(), engines, grid_s.ravel(), grid_d.ravel())
+        corners = np.concatenate([corners.reshape(grid_e.shape), corners.reshape(grid_e.shape)[:, :, :1]], axis=2)
+
+        # Sub-cells still to resolve, as parallel arrays: owning cell, bounds,
+        # share of the owning cell's area and corner outcomes
+        cell = np.arange(np.prod(shape))
+        e, i, j = np.unravel_index(cell, shape)
+        s0, s1 = speeds[i], speeds[i + 1]
+        d0, d1 = directions[j], directions[j + 1]
+        weight = np.ones(cell.size)
+        c00, c10, c01, c11 = corners[e, i, j], corners[e, i + 1, j], corners[e, i, j + 1], corners[e, i + 1, j + 1]
+
+        probability = np.zeros(cell.size)
+        depth = np.zeros(cell.size, dtype=np.int8)
+        for level in range(max_depth + 1):
+            field_corners = c00.astype(int) + c10 + c01 + c11
+            mixed = (field_corners > 0) & (field_corners < 4)
+            if level == max_depth:
+                # Finest level: the corners' field fraction stands for the sub-cell
+                np.add.at(probability, cell, weight * field_corners / 4)
+                break
+            np.add.at(probability, cell[~mixed], weight[~mixed] * (field_corners[~mixed] == 4))
+            if not mixed.any():
+                break
+            cell, e, s0, s1, d0, d1, weight, c00, c10, c01, c11 = (
+                a[mixed] for a in (cell, e, s0, s1, d0, d1, weight, c00, c10, c01, c11))
+            depth[cell] = level + 1
+
+            # Five new flights per split cell: the edge midpoints and the centre
+            sm, dm = (s0 + s1) / 2, (d0 + d1) / 2
+            new, count = _simulate_in_field(np.tile(e, 5), engines,
+                                            np.concatenate([sm, sm, s0, s1, sm]),
+                                            np.concatenate([d0, d1, dm, dm, dm]))
+            flights += count
+            m_d0, m_d1, m_s0, m_s1, centre = np.split(new, 5)
+
+            # Quarters: (low speed, low direction), (high, low), (low, high), (high, high)
+            cell, e = np.tile(cell, 4), np.tile(e, 4)
+            s0, s1 = np.concatenate([s0, sm, s0, sm]), np.concatenate([sm, s1, sm, s1])
+            d0, d1 = np.concatenate([d0, d0, dm, dm]), np.concatenate([dm, dm, d1, d1])
+            weight = np.tile(weight / 4, 4)
+            c00, c10, c01, c11 = (np.concatenate([c00, m_d0, m_s0, centre]),
+                                  np.concatenate([m_d0, c10, centre, m_s1]),
+                                  np.concatenate([m_s0, centre, c01, m_d1]),
+                                  np.concatenate([centre, m_s1, m_d1, c11]))
+
+        return cls(engines, speeds, directions, probability.reshape(shape), depth.reshape(shape),
+                   flights, simulation_fingerprint())
+
+    @classmethod
+    def load(cls, path=DEFAULT_MAP_PATH):
+        data = np.load(path)
+        return cls(data["engines"], data["speeds"], data["directions"], data["field_probability"],
+                   data["depth"], int(data["flights"]), str(data["fingerprint"]))
+
+    @classmethod
+    def load_or_build(cls, path=DEFAULT_MAP_PATH):
+        """Load the map from disk, rebuilding it if missing or stale"""
+        if os.path.exists(path):
+            dispersion = cls.load(path)
+            if dispersion.is_current():
+                return dispersion
+        dispersion = cls.build()
+        dispersion.save(path)
+        return dispersion
+
+    def save(self, path=DEFAULT_MAP_PATH):
+        np.savez(path, engines=np.array(self.engines), speeds=self.speeds, directions=self.directions,
+                 field_probability=self.field_probability, depth=self.depth, flights=self.flights,
+                 fingerprint=self.fingerprint)
+
+    def is_current(self):
+        """True if the map was built from the current simulator parameters"""
+        return self.fingerprint == simulation_fingerprint()
+
+    def probability(self, engine_type, wind_speed, wind_direction):
+        """Field-landing probability of the cell holding one wind condition"""
+        i = int(np.clip(np.searchsorted(self.speeds, wind_speed, side="right") - 1, 0, len(self.speeds) - 2))
+        j = int(np.searchsorted(self.directions, wind_direction % 360.0, side="right") - 1)
+        return float(self.field_probability[self.engines.index(engine_type), i, j])
+
+    def plot(self, path=None, show_depth=False):
+        """Polar heatmap per engine (direction around, speed outwards); saved to `path` or shown"""
+        figure, axes = plt.subplots(1, len(self.engines), figsize=(6 * len(self.engines), 6),
+                                    subplot_kw={"projection": "polar"}, gridspec_kw={"wspace": 0.35})
+        theta = np.radians(self.directions)
+        for axis, engine, probability, depth in zip(np.atleast_1d(axes), self.engines,
+                                                    self.field_probability, self.depth):
+            mesh = axis.pcolormesh(theta, self.speeds, probability, cmap="RdYlGn", vmin=0.0, vmax=1.0,
+                                   shading="flat")
+            if show_depth:
+                # Outline the cells that were refined
+                axis.contour(theta[:-1] + np.radians(self.directions[1] - self.directions[0]) / 2,
+                             (self.speeds[:-1] + self.speeds[1:]) / 2, depth, levels=[0.5],
+                             colors="black", linewidths=0.5)
+            axis.set_title(f"{ENGINES[engine].name}: field landing probability", pad=20)
+            axis.set_rlabel_position(90)
+        figure.colorbar(mesh, ax=axes, shrink=0.7, label="P(field landing)")
+        figure.text(0.5, 0.02, "Angle: wind direction (degrees); radius: wind speed (m/s)", ha="center")
+        if path:
+            figure.savefig(path, dpi=120)
+            plt.close(figure)
+        else:
+            plt.show()
+
+
+if __name__ == "__main__":
+    # Rebuild the map if it is stale, then render it from disk
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Field-landing probability map over wind speed and direction")
+    parser.add_argument("--output", default=DEFAULT_MAP_PATH, help="map file (.npz)")
+    parser.add_argument("--plot", default="dispersion_map.png", help="image to render ('-' to show a window)")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild even if the saved map is current")
+    parser.add_argument("--max-depth", type=int, default=4,
+                        help="refinement levels at the field/tree boundary (when building)")
+    parser.add_argument("--show-depth", action="store_true", help="outline the refined cells")
+    args = parser.parse_args()
+
+    dispersion = None
+    if not args.rebuild and os.path.exists(args.output):
+        dispersion = DispersionMap.load(args.output)
+        if not dispersion.is_current():
+            dispersion = None
+    if dispersion is None:
+        start = time.perf_counter()
+        dispersion = DispersionMap.build(max_depth=args.max_depth)
+        print(f"Built {dispersion.field_probability.size} cells from {dispersion.flights} flights "
+              f"in {time.perf_counter() - start:.1f}s (fingerprint {dispersion.fingerprint})")
+        dispersion.save(args.output)
+        print(f"Saved {args.output}")
+
+    for engine, probability in zip(dispersion.engines, dispersion.field_probability):
+        print(f"{ENGINES[engine].name}: field landings {probability.mean() * 100:.1f}% of winds, "
+              f"{np.count_nonzero((probability > 0) & (probability < 1))} boundary cells")
+    dispersion.plot(None if args.plot == "-" else args.plot, args.show_depth)
+    if args.plot != "-":
+        print(f"Rendered {args.plot}")
@@ -0,0 +1,250 @@
+import math
+import numpy as np
+
+TREE_HEIGHT = 6.0  # meters; branch height a rocket drifting over the trees catches at
+FIELD_LENGTH = 109.7  # meters (120 yards including end zones)
+FIELD_WIDTH = 48.8  # meters (53 yards)
+
+
+class Tree:
+    """A single tree: ground position (x along the field, z across it), height and canopy radius"""
+
+    def __init__(self, x, z, height=TREE_HEIGHT, canopy_radius=8.0):
+        self.x = x
+        self.z = z
+        self.height = height
+        self.canopy_radius = canopy_radius
+
+
+class TreeLine:
+    """A stretch of woods given as a ground-plane polygon of (x, z) vertices"""
+
+    def __init__(self, vertices, height=TREE_HEIGHT):
+        self.vertices = np.asarray(vertices, dtype=float)
+        self.height = height
+
+    def edges(self):
+        return zip(self.vertices, np.roll(self.vertices, -1, axis=0))
+
+    def contains(self, x, z):
+        """Even-odd point-in-polygon test for scalars or arrays"""
+        inside = np.zeros(np.broadcast(x, z).shape, dtype=bool)
+        for (x1, z1), (x2, z2) in self.edges():
+            if z1 == z2:
+                continue  # Horizontal edges never cross the ray
+            crosses = (z1 > z) != (z2 > z)
+            crossing_x = x1 + (z - z1) * (x2 - x1) / (z2 - z1)
+            inside ^= crosses & (x < crossing_x)
+        return inside
+
+
+class FieldGeometry:
+    """Ground-plane model of the launch site: a rectangular field among trees
+
+    x runs along the field (0 to length) and z across it (centred on 0).
+    Landings inside the field rectangle are on the "field" at height 0.
+    Everywhere else is "trees": the rocket catches in the branches at
+    default_height, or higher where a taller tree line (polygon) or tree
+    canopy covers the point.
+
+    A uniform grid over the site indexes the geometry. Cells that no
+    boundary passes through store their landing height directly; only
+    points in boundary cells are tested against the features, and only
+    against the trees listed for their cell.
+    """
+
+    _default = None
+
+    def __init__(self, length=FIELD_LENGTH, width=FIELD_WIDTH, tree_lines=(), trees=(),
+                 default_height=TREE_HEIGHT, cell_size=2.0):
+        self.length = length
+        self.width = width
+        self.tree_lines = list(tree_lines)
+        self.trees = list(trees)
+        self.default_height = default_height
+        self.cell_size = cell_size
+        self.max_height = max([default_height] + [line.height for line in self.tree_lines] +
+                              [tree.height for tree in self.trees])
+        self._build_index()
+
+    @classmethod
+    def default(cls):
+        """The standard site, shared by the simulators and the games
+
+        Woods 50 m deep all round the field, plus the rows of trees the
+        games draw behind each end zone, all TREE_HEIGHT tall.
+        """
+        if cls._default is None:
+            depth = 50.0
+            half = FIELD_WIDTH / 2
+            far = half + depth
+            tree_lines = [
+                TreeLine([(-depth, -far), (0, -far), (0, far), (-depth, far)]),  # Behind the west end zone
+                TreeLine([(FIELD_LENGTH, -far), (FIELD_LENGTH + depth, -far),
+                          (FIELD_LENGTH + depth, far), (FIELD_LENGTH, far)]),  # Behind the east end zone
+                TreeLine([(0, -far), (FIELD_LENGTH, -far), (FIELD_LENGTH, -half), (0, -half)]),  # South sideline
+                TreeLine([(0, half), (FIELD_LENGTH, half), (FIELD_LENGTH, far), (0, far)]),  # North sideline
+            ]
+            trees = [Tree(-12.0 - 24.0 * i, 0.0) for i in range(2)]
+            trees += [Tree(FIELD_LENGTH + 12.0 + 24.0 * i, 0.0) for i in range(2)]
+            cls._default = cls(tree_lines=tree_lines, trees=trees)
+        return cls._default
+
+    def key(self):
+        """Everything that affects classification, for simulation fingerprints"""
+        return (self.length, self.width, self.default_height,
+                tuple((tuple(map(tuple, line.vertices.tolist())), line.height) for line in self.tree_lines),
+                tuple((tree.x, tree.z, tree.height, tree.canopy_radius) for tree in self.trees))
+
+    def _build_index(self):
+        """Grid of per-cell landing heights (NaN where a boundary crosses the cell)"""
+        # Only features taller than the surrounding woods change anything
+        self._tree_lines = [line for line in self.tree_lines if line.height > self.default_height]
+        trees = [tree for tree in self.trees if tree.height > self.default_height]
+        self._tree_x = np.array([tree.x for tree in trees], dtype=float)
+        self._tree_z = np.array([tree.z for tree in trees], dtype=float)
+        self._tree_r2 = np.array([tree.canopy_radius ** 2 for tree in trees], dtype=float)
+        self._tree_height = np.array([tree.height for tree in trees], dtype=float)
+
+        # Bounds of every feature, padded so the outermost cells are plain woods;
+        # points beyond the grid are clamped onto them
+        half = self.width / 2
+        xs = [0.0, self.length] + [tree.x - tree.canopy_radius for tree in trees] + \
+             [tree.x + tree.canopy_radius for tree in trees]
+        zs = [-half, half] + [tree.z - tree.canopy_radius for tree in trees] + \
+             [tree.z + tree.canopy_radius for tree in trees]
+        for line in self._tree_lines:
+            xs.extend(line.vertices[:, 0])
+            zs.extend(line.vertices[:, 1])
+        size = self.cell_size
+        pad = 3 * size
+        self._x0 = min(xs) - pad
+        self._z0 = min(zs) - pad
+        self._nx = int(math.ceil((max(xs) + pad - self._x0) / size))
+        self._nz = int(math.ceil((max(zs) + pad - self._z0) / size))
+
+        # Mark every cell a boundary may pass through: sample each edge at half
+        # a cell and mark the cells around every sample
+        mixed = np.zeros((self._nz, self._nx), dtype=bool)
+        edges = [((0, -half), (self.length, -half)), ((self.length, -half), (self.length, half)),
+                 ((self.length, half), (0, half)), ((0, half), (0, -half))]
+        for line in self._tree_lines:
+            edges.extend(line.edges())
+        for (x1, z1), (x2, z2) in edges:
+            samples = int(math.ceil(math.hypot(x2 - x1, z2 - z1) / (size / 2))) + 1
+            t = np.linspace(0.0, 1.0, samples)
+            ix = ((x1 + (x2 - x1) * t - self._x0) // size).astype(np.int64)
+            iz = ((z1 + (z2 - z1) * t - self._z0) // size).astype(np.int64)
+            for dz in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    mixed[iz + dz, ix + dx] = True
+
+        # Trees mark (and are candidates for) every cell their canopy's box overlaps
+        candidates = {}
+        for index, tree in enumerate(trees):
+            r = tree.canopy_radius
+            ix1, iz1 = self._cell(tree.x - r, tree.z - r)
+            ix2, iz2 = self._cell(tree.x + r, tree.z + r)
+            mixed[iz1:iz2 + 1, ix1:ix2 + 1] = True
+            for iz in range(iz1, iz2 + 1):
+                for ix in range(ix1, ix2 + 1):
+                    candidates.setdefault(iz * self._nx + ix, []).append(index)
+
+        # Candidate trees per cell, padded with -1
+        width = max([1] + [len(cell) for cell in candidates.values()])
+        self._cell_trees = np.full((self._nz * self._nx, width), -1, dtype=np.int64)
+        for cell, indices in candidates.items():
+            self._cell_trees[cell, :len(indices)] = indices
+
+        # Cells no boundary touches have one landing height: take it at the centre
+        centre_x = self._x0 + (np.arange(self._nx) + 0.5) * size
+        centre_z = self._z0 + (np.arange(self._nz) + 0.5) * size
+        grid_x, grid_z = np.meshgrid(centre_x, centre_z)
+        self._cell_height = np.where(mixed.ravel(), np.nan, self._exact_heights(grid_x.ravel(), grid_z.ravel()))
+        self._cell_height_list = self._cell_height.tolist()  # Cheap scalar lookups
+
+    def _cell(self, x, z):
+        """Grid cell (ix, iz) of a point, clamped to the grid"""
+        ix = min(max(int((x - self._x0) // self.cell_size), 0), self._nx - 1)
+        iz = min(max(int((z - self._z0) // self.cell_size), 0), self._nz - 1)
+        return ix, iz
+
+    def _cells(self, x, z):
+        """Flat grid cell index of arrays of points, clamped to the grid"""
+        scale = 1.0 / self.cell_size
+        gx = x * scale
+        gx -= self._x0 * scale
+        gx = np.clip(gx, 0, self._nx - 1, out=gx if np.ndim(gx) else None)  # 0-d results are not writable
+        ix = gx.astype(np.int32)  # Much faster than converting to int64
+        if np.ndim(z) == 0:
+            ix += self._cell(0.0, z)[1] * self._nx
+            return ix
+        gz = z * scale
+        gz -= self._z0 * scale
+        gz = np.clip(gz, 0, self._nz - 1, out=gz if np.ndim(gz) else None)
+        iz = gz.astype(np.int32)
+        iz *= self._nx
+        iz += ix
+        return iz
+
+    def in_field(self, x, z=0.0):
+        """True where (x, z) is on the field (scalars or arrays)"""
+        half = self.width / 2
+        if np.ndim(x) == 0 and np.ndim(z) == 0:
+            return 0 <= x <= self.length and -half <= z <= half
+        in_field = (x >= 0) & (x <= self.length)
+        if np.ndim(z) == 0:
+            return in_field if -half <= z <= half else np.zeros_like(in_field)
+        return in_field & (z >= -half) & (z <= half)
+
+    def _exact_heights(self, x, z):
+        """Landing heights for arrays of points, testing every relevant feature"""
+        x, z = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(z, dtype=float))
+        heights = np.full(x.shape, self.default_height)
+        for line in self._tree_lines:
+            heights = np.where(line.contains(x, z), np.maximum(heights, line.height), heights)
+        if len(self._tree_x):
+            candidates = self._cell_trees[self._cells(x, z)]
+            valid = candidates >= 0
+            candidates = np.where(valid, candidates, 0)
+            dx = x[..., None] - self._tree_x[candidates]
+            dz = z[..., None] - self._tree_z[candidates]
+            under = valid & (dx * dx + dz * dz <= self._tree_r2[candidates])
+            heights = np.maximum(heights, np.where(under, self._tree_height[candidates], -np.inf).max(axis=-1))
+        return np.where(self.in_field(x, z), 0.0, heights)
+
+    def landing_height(self, x, z=0.0):
+        """Height a rocket coming down at (x, z) comes to rest at"""
+        if self.in_field(x, z):
+            return 0.0
+        ix, iz = self._cell(x, z)
+        height = self._cell_height_list[iz * self._nx + ix]
+        if height == height:  # Not NaN: the whole cell has this height
+            return height
+        return float(self._exact_heights(np.array([x]), np.array([z]))[0])
+
+    def landing_heights(self, x, z=0.0):
+        """Vectorized landing_height for arrays of points (x and z broadcast together)"""
+        x = np.asarray(x, dtype=float)
+        if np.ndim(z) != 0:
+            x, z = np.broadcast_arrays(x, np.asarray(z, dtype=float))
+            z = z.ravel()
+        shape = x.shape
+        x = x.ravel()
+        heights = self._cell_height[self._cells(x, z)]
+        boundary = np.flatnonzero(np.isnan(heights))
+        if len(boundary):
+            heights[boundary] = self._exact_heights(x[boundary], z if np.ndim(z) == 0 else z[boundary])
+        return heights.reshape(shape)
+
+    def classify(self, x, z=0.0):
+        """Landing zone ("field" or "trees") and rest height of one point"""
+        return ("field" if self.in_field(x, z) else "trees"), self.landing_height(x, z)
+
+    def classify_many(self, x, z=0.0):
+        """Vectorized classify: in-field flags and rest heights for arrays of points"""
+        heights = self.landing_heights(x, z)
+        in_field = self.in_field(np.asarray(x, dtype=float), z)
+        if np.shape(in_field) != heights.shape:
+            in_field = np.broadcast_to(in_field, heights.shape).copy()
+        return in_field, heights
@@ -0,0 +1,202 @@
+import hashlib
+import os
+from collections import OrderedDict
+import numpy as np
+from rocket_simulation import simulation_fingerprint
+from trajectory_store import NullTrajectoryStore
+
+# Opt-in on-disk tier shared by the scripts' sweeps and demos
+FLIGHT_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+                                "rocket_game", "flights")
+
+
+class CachedFlight:
+    def __init__(self, max_altitude, landing, position, velocity, step_count, parachute_deployed,
+                 apogee_time, time, landed, parachute_time, trajectory=None):
+        self.max_altitude = max_altitude
+        self.landing = landing
+        self.position = position
+        self.velocity = velocity
+        self.step_count = step_count
+        self.parachute_deployed = parachute_deployed
+        self.apogee_time = apogee_time
+        self.time = time  # Sim time at the end of the flight
+        self.landed = landed
+        self.parachute_time = parachute_time
+        self.trajectory = trajectory  # (times, positions, velocities) or None
+
+    @property
+    def trajectory_bytes(self):
+        if self.trajectory is None:
+            return 0
+        return sum(array.nbytes for array in self.trajectory)
+
+
+class FlightCache:
+    """Bounded LRU cache of flight results in front of RocketSimulation.simulate_flight
+
+    Entries are keyed on quantized wind inputs, the time step, integrator,
+    kernel, parachute and history settings, and a hash of the rocket and
+    engine parameters. Each
+    entry keeps a compact summary; full trajectories are also kept while their
+    total size fits in trajectory_budget bytes (oldest trajectories are dropped
+    first). An entry whose trajectory was not kept only serves simulations
+    that record no history; others re-simulate to get their trajectory.
+    With disk_dir set, entries are also written there as .npz files so later
+    processes can reuse them.
+    """
+
+    def __init__(self, max_entries=4096, trajectory_budget=0, disk_dir=None, resolution=1e-6):
+        self.max_entries = max_entries
+        self.trajectory_budget = trajectory_budget
+        self.disk_dir = disk_dir
+        self.resolution = resolution
+        self.entries = OrderedDict()
+        self.trajectory_bytes = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+
+        if disk_dir is not None:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def key(self, sim):
+        """Cache key for a simulation's inputs"""
+        return (
+            simulation_fingerprint(sim),
+            round(sim.wind_speed / self.resolution),
+            round(sim.wind_direction / self.resolution),
+            sim.dt, sim.integrator, sim.kernel, sim.rtol, sim.atol, sim.max_time, sim.auto_parachute,
+            self.history_mode(sim),
+        )
+
+    @staticmethod
+    def history_mode(sim):
+        """How much trajectory a simulation keeps: none, the newest N samples, or all of it"""
+        if isinstance(sim.trajectory, NullTrajectoryStore):
+            return "none"
+        if sim.trajectory.ring:
+            return f"last{sim.trajectory.capacity}"
+        return "full"
+
+    def lookup(self, sim):
+        """Return the cached (max_altitude, landing) and restore the rocket state, or None"""
+        key = self.key(sim)
+        needs_trajectory = self.history_mode(sim) != "none"
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        elif self.disk_dir is not None:
+            entry = self._read_disk(key)
+            if entry is not None and not (needs_trajectory and entry.trajectory is None):
+                self.disk_hits += 1
+                self._insert(key, entry)
+
+        if entry is None or (needs_trajectory and entry.trajectory is None):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        sim.rocket.position = entry.position.copy()
+        sim.rocket.velocity = entry.velocity.copy()
+        sim.rocket.mass = sim.rocket.dry_mass  # Propellant is spent by the end of a flight
+        sim.max_altitude = entry.max_altitude
+        sim.apogee_time = entry.apogee_time
+        sim.time = entry.time
+        sim.landed = entry.landed
+        sim.parachute_time = entry.parachute_time
+        sim.rocket.parachute_deployed = entry.parachute_deployed
+        if entry.parachute_deployed:
+            sim.rocket.flight_phase = "descent"
+        sim.step_count = entry.step_count
+        sim.trajectory.clear()
+        if needs_trajectory:
+            sim.trajectory.extend(*entry.trajectory)
+        return entry.max_altitude, entry.landing
+
+    def store(self, sim, result):
+        """Record the result of a finished simulate_flight call"""
+        max_altitude, landing = result
+        trajectory = None
+        trajectory_bytes = (sim.time_history.nbytes + sim.position_history.nbytes +
+                            sim.velocity_history.nbytes)
+        if len(sim.time_history) and trajectory_bytes <= self.trajectory_budget:
+            trajectory = (sim.time_history.copy(), sim.position_history.copy(),
+                          sim.velocity_history.copy())
+        entry = CachedFlight(max_altitude, landing, sim.rocket.position.copy(),
+                             sim.rocket.velocity.copy(), sim.step_count,
+                             sim.rocket.parachute_deployed, sim.apogee_time, sim.time, sim.landed,
+                             sim.parachute_time, trajectory)
+        key = self.key(sim)
+        self._insert(key, entry)
+        if self.disk_dir is not None:
+            self._write_disk(key, entry)
+
+    def _insert(self, key, entry):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.trajectory_bytes -= old.trajectory_bytes
+        self.entries[key] = entry
+        self.trajectory_bytes += entry.trajectory_bytes
+
+        while len(self.entries) > self.max_entries:
+            _, evicted = self.entries.popitem(last=False)
+            self.trajectory_bytes -= evicted.trajectory_bytes
+            self.evictions += 1
+
+        # Over the byte budget: keep the summaries, drop the oldest trajectories
+        if self.trajectory_bytes > self.trajectory_budget:
+            for cached in self.entries.values():
+                if self.trajectory_bytes <= self.trajectory_budget:
+                    break
+                self.trajectory_bytes -= cached.trajectory_bytes
+                cached.trajectory = None
+
+    def _disk_path(self, key):
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+        return os.path.join(self.disk_dir, f"{digest}.npz")
+
+    def _write_disk(self, key, entry):
+        arrays = {}
+        if entry.trajectory is not None:
+            arrays = dict(zip(("times", "positions", "velocities"), entry.trajectory))
+        # Write to a temporary name first so readers never see a partial file
+        path = self._disk_path(key)
+        temporary = path + ".tmp.npz"
+        np.savez(temporary, key=repr(key), max_altitude=entry.max_altitude, landing=entry.landing,
+                 position=entry.position, velocity=entry.velocity, step_count=entry.step_count,
+                 parachute_deployed=entry.parachute_deployed, apogee_time=entry.apogee_time,
+                 time=entry.time, landed=entry.landed, parachute_time=entry.parachute_time, **arrays)
+        os.replace(temporary, path)
+
+    def _read_disk(self, key):
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            if str(data["key"]) != repr(key) or "landed" not in data.files:
+                return None  # Another key, or written before the end-of-flight state was cached
+            trajectory = None
+            if "times" in data.files:
+                trajectory = (data["times"], data["positions"], data["velocities"])
+            return CachedFlight(data["max_altitude"][()], str(data["landing"]), data["position"],
+                                data["velocity"], int(data["step_count"]),
+                                bool(data["parachute_deployed"]), data["apogee_time"][()],
+                                data["time"][()], bool(data["landed"]), float(data["parachute_time"]),
+                                trajectory)
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "disk_hits": self.disk_hits,
+            "trajectory_bytes": self.trajectory_bytes,
+        }
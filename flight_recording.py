@@ -0,0 +1,180 @@
+import math
+import os
+import numpy as np
+
+MAGIC = b"RKTREC01"
+
+# Fixed 64-byte header in front of every recorded flight
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("engine", "S8"),  # Engine type key ('A', 'B' or 'C')
+    ("wind_speed", "<f8"),  # m/s
+    ("wind_direction", "<f8"),  # degrees
+    ("dt", "<f8"),  # Integration step in seconds
+    ("seed", "<i8"),  # -1 if the flight was not seeded
+    ("parachute_time", "<f8"),  # Sim time the parachute opened (NaN if never)
+    ("count", "<i8"),  # Records that follow
+])
+
+# Packed 20-byte sample: time, position and velocity
+RECORD_DTYPE = np.dtype([
+    ("time", "<f4"),
+    ("x", "<f4"),
+    ("y", "<f4"),
+    ("vx", "<f4"),
+    ("vy", "<f4"),
+])
+
+
+class FlightRecorder:
+    """Samples of one flight collected in a growing float32 buffer
+
+    RocketSimulation copies samples in from its trajectory in blocks while
+    recording, and save() writes the header and the packed records in one go.
+    """
+
+    def __init__(self, capacity=4096):
+        self.records = np.empty(capacity, RECORD_DTYPE)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def extend(self, times, positions, velocities):
+        """Record many samples at once from arrays"""
+        count = len(times)
+        while self.count + count > len(self.records):
+            self.records = np.resize(self.records, 2 * len(self.records))
+        block = self.records[self.count:self.count + count]
+        block["time"] = times
+        block["x"] = positions[:, 0]
+        block["y"] = positions[:, 1]
+        block["vx"] = velocities[:, 0]
+        block["vy"] = velocities[:, 1]
+        self.count += count
+
+    def save(self, path, engine, wind_speed, wind_direction, dt, seed=-1,
+             parachute_time=math.nan, append=True):
+        """Write the flight to `path`, after any flights already there unless append is False"""
+        header = np.zeros(1, HEADER_DTYPE)
+        header[0] = (MAGIC, engine.encode(), wind_speed, wind_direction, dt, seed,
+                     parachute_time, self.count)
+        with open(path, "ab" if append else "wb") as f:
+            f.write(header.tobytes())
+            f.write(self.records[:self.count].tobytes())
+
+
+class FlightRecording:
+    """One recorded flight; `records` is a read-only view into the archive's memory map"""
+
+    def __init__(self, header, records):
+        self.engine = header["engine"].decode()
+        self.wind_speed = float(header["wind_speed"])
+        self.wind_direction = float(header["wind_direction"])
+        self.dt = float(header["dt"])
+        self.seed = int(header["seed"])
+        self.parachute_time = float(header["parachute_time"])
+        self.records = records
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def times(self):
+        return self.records["time"]
+
+    @property
+    def duration(self):
+        return float(self.records["time"][-1]) if len(self.records) else 0.0
+
+    @property
+    def max_altitude(self):
+        return float(self.records["y"].max()) if len(self.records) else 0.0
+
+    def parachute_deployed(self, time):
+        return not math.isnan(self.parachute_time) and time >= self.parachute_time
+
+    def state_at(self, time):
+        """(x, y, vx, vy) at a sim time, interpolated between the neighbouring records"""
+        times = self.records["time"]
+        i = int(np.searchsorted(times, time))
+        if i <= 0:
+            r = self.records[0]
+            return float(r["x"]), float(r["y"]), float(r["vx"]), float(r["vy"])
+        if i >= len(times):
+            r = self.records[-1]
+            return float(r["x"]), float(r["y"]), float(r["vx"]), float(r["vy"])
+        a, b = self.records[i - 1], self.records[i]
+        span = float(b["time"] - a["time"])
+        t = (time - float(a["time"])) / span if span > 0 else 1.0
+        return tuple(float(a[name] + (b[name] - a[name]) * t) for name in ("x", "y", "vx", "vy"))
+
+
+class FlightArchive:
+    """Every flight recorded in a file, opened through a single np.memmap
+
+    Opening only walks the 64-byte headers; records are paged in by the OS
+    when a flight is read, so large archives open immediately. A flight
+    cut short by an interrupted write is ignored.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._offsets = []  # (header offset, record count) per flight
+        size = os.path.getsize(path)
+        self._data = np.memmap(path, dtype=np.uint8, mode="r") if size else np.empty(0, np.uint8)
+
+        offset = 0
+        while offset + HEADER_DTYPE.itemsize <= size:
+            header = self._data[offset:offset + HEADER_DTYPE.itemsize].view(HEADER_DTYPE)[0]
+            if header["magic"] != MAGIC:
+                raise ValueError(f"{path} is not a flight recording (bad header at byte {offset})")
+            start = offset + HEADER_DTYPE.itemsize
+            end = start + int(header["count"]) * RECORD_DTYPE.itemsize
+            if end > size:
+                break
+            self._offsets.append((offset, int(header["count"])))
+            offset = end
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        offset, count = self._offsets[index]
+        header = self._data[offset:offset + HEADER_DTYPE.itemsize].view(HEADER_DTYPE)[0]
+        start = offset + HEADER_DTYPE.itemsize
+        records = self._data[start:start + count * RECORD_DTYPE.itemsize].view(RECORD_DTYPE)
+        return FlightRecording(header, records)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+def trim_recordings(path, max_flights, slack=0):
+    """Drop the oldest flights from a recordings file so at most `max_flights` remain
+
+    Nothing is rewritten until the file holds more than max_flights + slack
+    flights, so appending to a full archive only pays for a rewrite every
+    `slack` flights. The kept flights are copied to a temporary file that
+    then replaces the original, so an interrupted trim never loses the
+    archive. Returns the number of flights dropped.
+    """
+    if not os.path.exists(path):
+        return 0
+    archive = FlightArchive(path)
+    if len(archive) <= max_flights + slack:
+        return 0
+    dropped = len(archive) - max_flights
+    start = archive._offsets[dropped][0] if max_flights > 0 else os.path.getsize(path)
+    end = archive._offsets[-1][0] + HEADER_DTYPE.itemsize + archive._offsets[-1][1] * RECORD_DTYPE.itemsize
+    kept = bytes(archive._data[start:end])
+    del archive  # Release the memory map before replacing the file
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(kept)
+    os.replace(temporary, path)
+    return dropped
@@ -0,0 +1,133 @@
+import zipfile
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional; .npz needs only NumPy
+    pa = None
+    pq = None
+
+# One row per flight: (column, dtype)
+COLUMNS = (
+    ("seed", np.int64),  # Master seed of the run (-1 if unseeded)
+    ("shard", np.int64),  # Shard of the run the flight was simulated in
+    ("engine", np.str_),
+    ("wind_speed", np.float64),  # m/s
+    ("wind_direction", np.float64),  # degrees
+    ("max_altitude", np.float64),  # m
+    ("apogee_time", np.float64),  # s
+    ("landing_x", np.float64),  # m
+    ("landing_zone", np.str_),  # "field" or "trees"
+    ("steps", np.int64),  # Integration steps until landing
+    ("wall_time", np.float64),  # s
+)
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+
+
+def _is_parquet(path):
+    return str(path).endswith(".parquet")
+
+
+class FlightResultWriter:
+    """Per-flight results table written to disk in chunks
+
+    Rows are buffered until `chunk_size` have accumulated and then written
+    as one chunk, so a sweep never holds more than a chunk in memory. Paths
+    ending in ".parquet" are written with pyarrow (one row group per chunk);
+    anything else is an .npz archive holding one "chunkNNNNNN/<column>" array
+    per column and chunk. Read either back with iter_flight_results or
+    load_flight_results.
+    """
+
+    def __init__(self, path, chunk_size=65536):
+        if _is_parquet(path) and pq is None:
+            raise ImportError("Writing .parquet results requires pyarrow (pip install pyarrow)")
+        self.path = path
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self.chunks = 0
+        self._pending = []
+        self._pending_rows = 0
+        self._parquet = None
+        self._zip = None if _is_parquet(path) else zipfile.ZipFile(path, "w", allowZip64=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, columns):
+        """Append rows given as a dict of equal-length arrays (one per column)"""
+        missing = set(COLUMN_NAMES) - set(columns)
+        if missing:
+            raise ValueError(f"Missing result columns: {', '.join(sorted(missing))}")
+        count = len(columns["steps"])
+        self._pending.append({name: np.broadcast_to(np.asarray(columns[name], dtype=dtype), (count,))
+                              for name, dtype in COLUMNS})
+        self._pending_rows += count
+        while self._pending_rows >= self.chunk_size:
+            self._write_chunk(self.chunk_size)
+
+    def flush(self):
+        """Write whatever rows are still buffered"""
+        if self._pending_rows:
+            self._write_chunk(self._pending_rows)
+
+    def close(self):
+        self.flush()
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+
+    def _write_chunk(self, count):
+        """Write the first `count` buffered rows as one chunk"""
+        if len(self._pending) == 1:
+            columns = self._pending[0]
+        else:
+            columns = {name: np.concatenate([block[name] for block in self._pending]) for name in COLUMN_NAMES}
+        rest = {name: column[count:] for name, column in columns.items()}
+        self._pending = [rest] if len(rest["steps"]) else []
+        self._pending_rows = len(rest["steps"])
+        chunk = {name: column[:count] for name, column in columns.items()}
+
+        if self._zip is not None:
+            for name, column in chunk.items():
+                with self._zip.open(f"chunk{self.chunks:06d}/{name}.npy", "w", force_zip64=True) as f:
+                    np.lib.format.write_array(f, np.ascontiguousarray(column))
+        else:
+            table = pa.table({name: pa.array(column) for name, column in chunk.items()})
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            self._parquet.write_table(table)
+        self.rows += count
+        self.chunks += 1
+
+
+def iter_flight_results(path, columns=None):
+    """Yield the results one chunk at a time, as dicts of column arrays"""
+    columns = list(columns or COLUMN_NAMES)
+    if _is_parquet(path):
+        if pq is None:
+            raise ImportError("Reading .parquet results requires pyarrow (pip install pyarrow)")
+        for batch in pq.ParquetFile(path).iter_batches(columns=columns):
+            yield {name: batch.column(name).to_numpy(zero_copy_only=False) for name in columns}
+        return
+
+    with np.load(path) as data:
+        chunk_names = sorted({key.split("/")[0] for key in data.files})
+        for chunk_name in chunk_names:
+            yield {name: data[f"{chunk_name}/{name}"] for name in columns}
+
+
+def load_flight_results(path, columns=None):
+    """Read the whole results table into a dict of column arrays"""
+    columns = list(columns or COLUMN_NAMES)
+    chunks = list(iter_flight_results(path, columns))
+    if not chunks:
+        return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS if name in columns}
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in columns}
@@ -0,0 +1,249 @@
+import argparse
+import cProfile
+import json
+import math
+import platform
+import pstats
+import os
+import random
+import tempfile
+import time
+import numpy as np
+import pygame
+from benchmark import load_game
+
+# Flights the scripted player launches: (engine, wind speed, wind direction).
+# The first drifts into the trees (an aimed baseball knocks it down, then
+# time travel), the second lands on the field (time travel, then results).
+FLIGHT_PLAN = [('B', 8.0, 0), ('B', 2.0, 0)]
+
+# Keys pressed in turn during the time-travel game: walk, jump, change era
+TIME_TRAVEL_KEYS = [pygame.K_d, pygame.K_d, pygame.K_SPACE, pygame.K_UP, pygame.K_d, pygame.K_4,
+                    pygame.K_SPACE, pygame.K_DOWN, pygame.K_DOWN, pygame.K_a, pygame.K_5, pygame.K_SPACE]
+
+# Every state the scripted session has to pass through for a complete report
+EXPECTED_STATES = {"menu", "countdown", "flying", "recovery", "throwing", "rocket_falling", "time_travel",
+                   "results", "replay"}
+
+
+class VirtualClock:
+    """Stand-in for pygame.time.Clock that never sleeps
+
+    Every tick advances a virtual millisecond counter by one frame at the
+    game's frame rate; pygame.time.get_ticks is pointed at the same counter
+    while the benchmark runs, so countdowns and animations play out in
+    frames rather than wall time.
+    """
+
+    def __init__(self, fps):
+        self.fps = fps
+        self.ticks = 0.0
+
+    def tick(self, framerate=0):
+        self.ticks += 1000.0 / self.fps
+        return 1000.0 / self.fps
+
+    def get_ticks(self):
+        return int(self.ticks)
+
+
+class ScriptedPlayer:
+    """Posts key events for whichever state the game is in"""
+
+    def __init__(self, game, flight_plan=FLIGHT_PLAN, menu_frames=60, recovery_frames=40,
+                 results_frames=60, time_travel_frames=600, last_time_travel_frames=100, replay_frames=300):
+        self.game = game
+        self.flight_plan = list(flight_plan)
+        self.menu_frames = menu_frames
+        self.recovery_frames = recovery_frames
+        self.results_frames = results_frames
+        self.time_travel_frames = time_travel_frames
+        self.last_time_travel_frames = last_time_travel_frames  # Then R to the results screen
+        self.replay_frames = replay_frames
+        self.flights_started = 0
+        self.replayed = False
+        self.state = None
+        self.frames_in_state = 0
+
+    @property
+    def finished(self):
+        return self.replayed and self.game.state == "menu"
+
+    def press(self, *keys):
+        for key in keys:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=""))
+
+    def before_frame(self):
+        game = self.game
+        if game.state != self.state:
+            self.state = game.state
+            self.frames_in_state = 0
+        self.frames_in_state += 1
+        frames = self.frames_in_state
+
+        if game.state == "menu" and frames == self.menu_frames and not self.finished:
+            if self.flights_started == len(self.flight_plan):
+                # Replay the recorded flights
+                self.press(pygame.K_p)
+                self.replayed = True
+                return
+            engine, wind_speed, wind_direction = self.flight_plan[self.flights_started]
+            game.wind_speed = wind_speed  # Set directly: the menu keys only nudge the wind
+            game.wind_direction = wind_direction
+            self.press(getattr(pygame, f"K_{engine.lower()}"), pygame.K_SPACE)
+            self.flights_started += 1
+        elif game.state == "flying":
+            # Open the parachute once the rocket starts to fall
+            rocket = game.simulation.rocket
+            if not rocket.parachute_deployed and rocket.velocity[1] < 0:
+                self.press(pygame.K_SPACE)
+        elif game.state == "recovery" and frames % self.recovery_frames == 0:
+            self.aim_throw()
+            self.press(pygame.K_SPACE)
+        elif game.state == "time_travel" and frames % 20 == 0:
+            if game.is_game_over:
+                self.press(pygame.K_SPACE)
+            elif game.player_won:
+                self.press(pygame.K_RETURN)
+            elif frames >= self.time_travel_frames or (self.flights_started == len(self.flight_plan) and
+                                                       frames >= self.last_time_travel_frames):
+                # The last flight leaves for the results screen before the game can end
+                self.press(pygame.K_r)
+            else:
+                self.press(TIME_TRAVEL_KEYS[frames // 20 % len(TIME_TRAVEL_KEYS)])
+        elif game.state == "results" and frames == self.results_frames:
+            self.press(pygame.K_SPACE)
+        elif game.state == "replay":
+            # Scrub forward, switch to the other flight, then leave
+            if frames == self.replay_frames:
+                self.press(pygame.K_ESCAPE)
+            elif frames == self.replay_frames // 2:
+                self.press(pygame.K_UP)
+            elif frames % 30 == 0:
+                self.press(pygame.K_RIGHT)
+
+
+    def aim_throw(self):
+        """Set the angle and power (on the arrow keys' steps) whose throw passes closest to the rocket
+
+        Each candidate is traced with the game's own baseball_position at the
+        frame times the throwing state will sample, so the throw hits.
+        """
+        game = self.game
+        rocket_x, rocket_y = game.stuck_rocket_position()
+        frame_ms = 1000.0 / game.max_fps
+        now = pygame.time.get_ticks()
+        saved_start = getattr(game, "throw_start_time", 0)
+        best = (math.inf, game.baseball_angle, game.baseball_power)
+        for angle in range(0, 91, 5):
+            for step in range(19):
+                power = 0.1 + 0.05 * step
+                game.baseball_angle, game.baseball_power = angle, power
+                frame = 0
+                while True:
+                    game.throw_start_time = now - frame * frame_ms
+                    ball = game.baseball_position()
+                    if ball is None:
+                        break
+                    best = min(best, (math.hypot(ball[0] - rocket_x, ball[1] - rocket_y), angle, power))
+                    frame += 1
+        game.throw_start_time = saved_start
+        _, game.baseball_angle, game.baseball_power = best
+
+
+def summarize(frame_times):
+    """Frame-time statistics in milliseconds"""
+    frame_times = np.asarray(frame_times) * 1000
+    return {
+        "frames": int(frame_times.size),
+        "mean_ms": float(frame_times.mean()),
+        "p50_ms": float(np.percentile(frame_times, 50)),
+        "p90_ms": float(np.percentile(frame_times, 90)),
+        "p99_ms": float(np.percentile(frame_times, 99)),
+        "max_ms": float(frame_times.max()),
+    }
+
+
+def profile_rows(profiler, top):
+    """The `top` functions by cumulative time, as plain dicts"""
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, name), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({"function": f"{filename}:{line}({name})", "calls": calls,
+                     "tottime_ms": tottime * 1000, "cumtime_ms": cumtime * 1000})
+    rows.sort(key=lambda row: row["cumtime_ms"], reverse=True)
+    return rows[:top]
+
+
+def run_benchmark(dirty_rects=False, max_frames=20000, seed=0, profile_top=30):
+    """Play the scripted session headless and return the report dict"""
+    random.seed(seed)
+    np.random.seed(seed)
+    game_module = load_game()
+    recordings = tempfile.TemporaryDirectory()
+    game = game_module.VisualRocketGame(dirty_rects=dirty_rects,
+                                        recordings_path=os.path.join(recordings.name, "flights.rkf"))
+    clock = VirtualClock(game_module.FPS)
+    game.clock = clock
+    player = ScriptedPlayer(game)
+
+    frame_times = {}
+    profiler = cProfile.Profile()
+    real_get_ticks = pygame.time.get_ticks
+    pygame.time.get_ticks = clock.get_ticks
+    try:
+        frame_time = 0.0
+        frames = 0
+        while frames < max_frames and not player.finished:
+            player.before_frame()
+            state = game.state
+            start = time.perf_counter()
+            profiler.enable()
+            running = game.run_frame(frame_time)
+            profiler.disable()
+            frame_times.setdefault(state, []).append(time.perf_counter() - start)
+            frame_time = clock.tick(game.max_fps) / 1000.0
+            frames += 1
+            if not running:
+                break
+    finally:
+        pygame.time.get_ticks = real_get_ticks
+        game.recordings = game.replay = None  # Release the memory map before deleting the file
+        recordings.cleanup()
+
+    missing = EXPECTED_STATES - frame_times.keys()
+    assert not missing, f"scripted session never reached: {', '.join(sorted(missing))}"
+
+    all_frames = [t for times in frame_times.values() for t in times]
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "dirty_rects": dirty_rects,
+        "seed": seed,
+        "completed": player.finished,
+        "virtual_seconds": clock.ticks / 1000,
+        "overall": summarize(all_frames),
+        "states": {state: summarize(times) for state, times in frame_times.items()},
+        "profile": profile_rows(profiler, profile_top),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless frame-time benchmark for rocket_game_v2.0")
+    parser.add_argument("--output", default="frame_benchmark.json", help="JSON report path ('-' for stdout)")
+    parser.add_argument("--dirty-rects", action="store_true", help="benchmark the dirty-rectangle mode")
+    parser.add_argument("--max-frames", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile-top", type=int, default=30, help="functions kept in the profile")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.dirty_rects, args.max_frames, args.seed, args.profile_top)
+    if args.output == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        for state, stats in report["states"].items():
+            print(f"{state:12s} {stats['frames']:6d} frames  p50 {stats['p50_ms']:6.2f}ms  "
+                  f"p90 {stats['p90_ms']:6.2f}ms  p99 {stats['p99_ms']:7.2f}ms  max {stats['max_ms']:7.2f}ms")
+        print(f"Report written to {args.output}")
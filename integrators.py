@@ -0,0 +1,70 @@
+import numpy as np
+
+# Dormand-Prince 5(4) tableau
+DP_C = (0.0, 1/5, 3/10, 4/5, 8/9, 1.0, 1.0)
+DP_A = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84),
+)
+DP_B5 = np.array([35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84, 0.0])
+DP_B4 = np.array([5179/57600, 0.0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+
+
+def rk4_step(f, t, y, h):
+    """Classic fourth-order Runge-Kutta step of dy/dt = f(t, y)"""
+    k1 = f(t, y)
+    k2 = f(t + h/2, y + h/2 * k1)
+    k3 = f(t + h/2, y + h/2 * k2)
+    k4 = f(t + h, y + h * k3)
+    return y + h/6 * (k1 + 2*k2 + 2*k3 + k4)
+
+
+def rk45_step(f, t, y, h):
+    """Dormand-Prince step; returns the 5th-order solution and an error estimate"""
+    k = []
+    for c, a in zip(DP_C, DP_A):
+        stage = y.copy()
+        for a_j, k_j in zip(a, k):
+            stage += h * a_j * k_j
+        k.append(f(t + c * h, stage))
+    k = np.array(k)
+    y5 = y + h * (DP_B5 @ k)
+    error = h * ((DP_B5 - DP_B4) @ k)
+    return y5, error
+
+
+def error_norm(error, y_old, y_new, rtol, atol):
+    """Largest error component relative to the mixed tolerance"""
+    scale = atol + rtol * np.maximum(np.abs(y_old), np.abs(y_new))
+    return np.max(np.abs(error) / scale)
+
+
+def find_root(g, a, b, g_a, g_b, tol=1e-10, max_iter=60):
+    """Locate g(h) = 0 in [a, b] by the Illinois variant of regula falsi
+
+    g(a) and g(b) must have opposite signs (or g(b) may be zero).
+    """
+    side = 0
+    for _ in range(max_iter):
+        if g_b == g_a:
+            break
+        c = (a * g_b - b * g_a) / (g_b - g_a)
+        g_c = g(c)
+        if abs(g_c) < tol or abs(b - a) < tol:
+            return c
+        if g_c * g_b > 0:
+            b, g_b = c, g_c
+            if side == -1:
+                g_a /= 2
+            side = -1
+        else:
+            a, g_a = c, g_c
+            if side == 1:
+                g_b /= 2
+            side = 1
+    return (a + b) / 2
@@ -0,0 +1,165 @@
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from batch_simulation import simulate_batch
+from flight_results import FlightResultWriter
+
+
+class MonteCarloResult:
+    def __init__(self, engine_type):
+        self.engine_type = engine_type
+        self.num_runs = 0
+        self.field = 0
+        self.trees = 0
+        self.altitude_sum = 0.0
+        self.altitude_sum_sq = 0.0
+        self.altitude_min = math.inf
+        self.altitude_max = -math.inf
+
+    @classmethod
+    def from_batch(cls, engine_type, results):
+        """Summarize the per-flight arrays returned by simulate_batch"""
+        result = cls(engine_type)
+        altitudes = results["max_altitude"]
+        result.num_runs = altitudes.size
+        result.field = int(np.count_nonzero(results["in_field"]))
+        result.trees = result.num_runs - result.field
+        if result.num_runs:
+            result.altitude_sum = float(np.sum(altitudes))
+            result.altitude_sum_sq = float(np.sum(altitudes * altitudes))
+            result.altitude_min = float(np.min(altitudes))
+            result.altitude_max = float(np.max(altitudes))
+        return result
+
+    def merge(self, other):
+        """Fold another shard's counts and altitude statistics into this one"""
+        self.num_runs += other.num_runs
+        self.field += other.field
+        self.trees += other.trees
+        self.altitude_sum += other.altitude_sum
+        self.altitude_sum_sq += other.altitude_sum_sq
+        self.altitude_min = min(self.altitude_min, other.altitude_min)
+        self.altitude_max = max(self.altitude_max, other.altitude_max)
+        return self
+
+    @property
+    def counts(self):
+        """Landing counts in the same form as run_multiple_simulations"""
+        return {"field": self.field, "trees": self.trees}
+
+    @property
+    def mean_altitude(self):
+        return self.altitude_sum / self.num_runs if self.num_runs else 0.0
+
+    @property
+    def std_altitude(self):
+        if not self.num_runs:
+            return 0.0
+        variance = self.altitude_sum_sq / self.num_runs - self.mean_altitude ** 2
+        return math.sqrt(max(variance, 0.0))
+
+    def print_summary(self):
+        print(f"\n=== Results for {self.num_runs} flights with Engine {self.engine_type} ===")
+        print(f"Landed on field: {self.field} ({self.field/self.num_runs*100:.1f}%)")
+        print(f"Stuck in trees: {self.trees} ({self.trees/self.num_runs*100:.1f}%)")
+        print(f"Average altitude: {self.mean_altitude:.1f}m ({self.mean_altitude*3.28:.0f}ft)")
+        print(f"Max altitude: {self.altitude_max:.1f}m ({self.altitude_max*3.28:.0f}ft)")
+
+
+def _run_shard(engine_type, num_flights, seed_sequence, keep_rows=False):
+    """Simulate one shard of flights with its own random stream
+
+    Returns the shard's MonteCarloResult, and with keep_rows its per-flight
+    result columns (see flight_results.COLUMNS) as well.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    wind_speeds = rng.uniform(0, 8, num_flights)  # 0-8 m/s wind
+    wind_directions = rng.uniform(0, 360, num_flights)  # random direction
+    start = time.perf_counter()
+    results = simulate_batch(engine_type, wind_speeds, wind_directions)
+    elapsed = time.perf_counter() - start
+    summary = MonteCarloResult.from_batch(engine_type, results)
+    if not keep_rows:
+        return summary
+
+    # The batch is timed as a whole; each flight is charged its share by step count
+    steps = results["steps"]
+    rows = {
+        "engine": np.full(num_flights, engine_type),
+        "wind_speed": wind_speeds,
+        "wind_direction": wind_directions,
+        "max_altitude": results["max_altitude"],
+        "apogee_time": results["apogee_time"],
+        "landing_x": results["landing_x"],
+        "landing_zone": results["landing_zone"],
+        "steps": steps,
+        "wall_time": elapsed * steps / max(int(steps.sum()), 1),
+    }
+    return summary, rows
+
+
+def _record_shard(writer, seed, index, shard):
+    """Write a shard's rows (if any) and return its MonteCarloResult"""
+    if writer is None:
+        return shard
+    summary, rows = shard
+    writer.write(dict(rows, seed=seed, shard=index))
+    return summary
+
+
+def run_parallel_simulations(engine_type='B', num_runs=100, seed=None, workers=None,
+                             shard_size=2000, verbose=True, results_path=None, chunk_size=65536):
+    """Run multiple simulations with random wind conditions across processes
+
+    Flights are split into fixed-size shards, and shard i always draws its
+    wind conditions from child i of the master seed, so a given seed produces
+    identical results whatever the number of workers.
+
+    With results_path, every flight's inputs and outcome are also written to
+    a columnar table (.npz, or .parquet with pyarrow) as the shards finish,
+    `chunk_size` rows at a time; see flight_results.
+    """
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy % 2**63)  # Drawn here so it can be recorded
+    num_shards = max(1, math.ceil(num_runs / shard_size))
+    seed_sequences = np.random.SeedSequence(seed).spawn(num_shards)
+    shard_sizes = [min(shard_size, num_runs - i * shard_size) for i in range(num_shards)]
+    engine_types = [engine_type] * num_shards
+    keep_rows = [results_path is not None] * num_shards
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    result = MonteCarloResult(engine_type)
+    writer = FlightResultWriter(results_path, chunk_size) if results_path is not None else None
+    try:
+        if workers <= 1 or num_shards == 1:
+            shards = map(_run_shard, engine_types, shard_sizes, seed_sequences, keep_rows)
+            for index, shard in enumerate(shards):
+                result.merge(_record_shard(writer, seed, index, shard))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, num_shards)) as executor:
+                # map() yields in submission order, so the merge order is fixed
+                shards = executor.map(_run_shard, engine_types, shard_sizes, seed_sequences, keep_rows)
+                for index, shard in enumerate(shards):
+                    result.merge(_record_shard(writer, seed, index, shard))
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if verbose:
+        result.print_summary()
+
+    return result
+
+
+if __name__ == "__main__":
+    num_runs = 100000
+    for workers in [1, os.cpu_count() or 1]:
+        start = time.perf_counter()
+        result = run_parallel_simulations('C', num_runs, seed=42, workers=workers, verbose=False)
+        elapsed = time.perf_counter() - start
+        print(f"{workers} worker(s): {num_runs} flights in {elapsed:.2f}s, "
+              f"field={result.field} trees={result.trees} mean altitude={result.mean_altitude:.6f}m")
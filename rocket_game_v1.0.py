@@ -11,6 +11,7 @@ pygame.init()
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
+HISTORY_LIMIT = 600  # Flight samples kept for the live display
 
 # Colors
 BLACK = (0, 0, 0)
@@ -174,6 +175,7 @@ class VisualRocketGame:
         
         # Landing variables
         self.landing_position = None
+        self.landing_zone = None  # "field" or "trees", classified once at landing
         self.landing_time = 0
         self.show_landing_marker = False
         
@@ -468,10 +470,8 @@ class VisualRocketGame:
             
             # Don't let rocket go below appropriate landing surface
             if self.simulation:
-                landing_zone = self.simulation.check_landing_location()
-                
-                if landing_zone == "trees" and current_pos[1] <= 6.1:  # Small buffer for tree height
-                    # Rocket is in trees and at/below tree height - clamp to tree height (make it more visible)
+                if self.landing_zone == "trees":
+                    # Rocket landed in the trees - clamp to tree height (make it more visible)
                     tree_screen_y = ground_level - 30  # Fixed 30 pixels above ground for visibility
                     screen_y = tree_screen_y
                 else:
@@ -520,9 +520,7 @@ class VisualRocketGame:
             pygame.draw.circle(self.screen, WHITE, (int(landing_screen_x), int(landing_screen_y)), 5)
             
             # Landing text and rocket positioning
-            field_start = 0
-            field_end = 109.7
-            is_in_field = field_start <= self.landing_position[0] <= field_end
+            is_in_field = self.landing_zone == "field"
             
             if is_in_field:
                 landing_text = "LANDED HERE!"
@@ -820,96 +818,41 @@ class VisualRocketGame:
     def start_flight(self):
         self.state = "countdown"
         self.countdown_start_time = pygame.time.get_ticks()
-        self.simulation = RocketSimulation(self.selected_engine, self.wind_speed, self.wind_direction)
+        self.simulation = RocketSimulation(self.selected_engine, self.wind_speed, self.wind_direction,
+                                           history_limit=HISTORY_LIMIT)
+        self.simulation.reset()
         self.rocket_sprite = RocketSprite(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
         self.sim_time = 0
         self.trajectory_points = []
         
         # Reset landing variables
         self.landing_position = None
+        self.landing_zone = None  # "field" or "trees", classified once at landing
         self.landing_time = 0
         self.show_landing_marker = False
-        
-        # Start simulation
-        self.simulation.rocket.position = np.array([54.85, 0.0])  # Center of field
-        self.simulation.rocket.velocity = np.array([0.0, 0.0])
-        self.simulation.rocket.mass = self.simulation.rocket.dry_mass + 0.012
     
     def update_simulation(self):
         if self.simulation and self.state == "flying":
-            # Run one physics step
-            time = self.sim_time
-            
-            # Check for parachute deployment
-            if (not self.simulation.rocket.parachute_deployed and 
-                time > self.simulation.engine.burn_time + self.simulation.engine.delay and
-                len(self.simulation.velocity_history) > 0 and
-                self.simulation.velocity_history[-1][1] <= 0):
-                self.simulation.rocket.parachute_deployed = True
-                self.simulation.rocket.flight_phase = "descent"
-            
-            # Calculate forces
-            thrust = self.simulation.thrust_force(time)
-            drag = self.simulation.drag_force(self.simulation.rocket.velocity)
-            gravity = np.array([0.0, -self.simulation.rocket.mass * self.simulation.g])
-            
-            # Add minimal wind force during parachute descent (horizontal only)
-            wind_force = np.array([0.0, 0.0])
-            if self.simulation.rocket.parachute_deployed:
-                # Very gentle horizontal wind push
-                wind_force = np.array([self.simulation.wind_vector[0] * 0.05, 0.0])
-            
-            # Safety check for mass
-            if self.simulation.rocket.mass <= 0:
-                self.simulation.rocket.mass = self.simulation.rocket.dry_mass
-            
-            # Total force and acceleration
-            total_force = thrust + drag + gravity + wind_force
-            acceleration = total_force / self.simulation.rocket.mass
+            # Advance the simulation in its own fixed steps up to this frame's time
+            frame_end = self.sim_time + self.time_step
+            while self.simulation.time < frame_end:
+                self.simulation.step()
             
-            # Burn propellant during engine burn
-            if time <= self.simulation.engine.burn_time:
-                # Reduce mass as propellant burns (simple linear model)
-                propellant_used = (time / self.simulation.engine.burn_time) * 0.012
-                self.simulation.rocket.mass = self.simulation.rocket.dry_mass + 0.012 - propellant_used
-            
-            # Update velocity and position
-            self.simulation.rocket.velocity += acceleration * self.time_step
-            self.simulation.rocket.position += self.simulation.rocket.velocity * self.time_step
-            
-            # Record history
-            self.simulation.time_history.append(time)
-            self.simulation.position_history.append(self.simulation.rocket.position.copy())
-            self.simulation.velocity_history.append(self.simulation.rocket.velocity.copy())
-            
-            # Check for landing (ground or tree height)
-            landing = self.simulation.check_landing_location()
-            tree_height = 6.0  # meters above ground
-            
-            # Determine landing altitude based on location
-            if landing == "trees":
-                landing_altitude = tree_height
-            else:
-                landing_altitude = 0.0
-            
-            if self.simulation.rocket.position[1] <= landing_altitude:
-                # Stop rocket at appropriate height
-                self.simulation.rocket.position[1] = landing_altitude
-                self.simulation.rocket.velocity[1] = 0  # Stop falling
-                
+            if self.simulation.landed:
                 # Record landing position and show marker (only once)
                 if not self.show_landing_marker:
                     self.landing_position = self.simulation.rocket.position.copy()
+                    self.landing_zone = self.simulation.check_landing_location()
                     self.landing_time = self.sim_time
                     self.show_landing_marker = True
                 
                 # Continue simulation for a few seconds to show landing
-                if landing == "trees":
+                if self.landing_zone == "trees":
                     # Wait 2 seconds to show tree landing, then go to recovery
                     if self.sim_time - self.landing_time > 2.0:
                         self.state = "recovery"
                         self.rocket_tree_x = self.simulation.rocket.position[0] - 54.85
-                        self.rocket_tree_height = tree_height
+                        self.rocket_tree_height = self.simulation.rocket.position[1]  # Height it caught at
                         self.baseball_attempts = 0
                         return  # Stop simulation updates
                 else:
@@ -921,7 +864,7 @@ class VisualRocketGame:
                         self.collected_energy = 0
                         return  # Stop simulation updates
             
-            self.sim_time += self.time_step
+            self.sim_time = frame_end
     
     def handle_events(self):
         for event in pygame.event.get():
@@ -2,7 +2,15 @@ import pygame
 import numpy as np
 import math
 import random
+import os
+import sys
+import hashlib
+import queue
+import threading
+from collections import OrderedDict, deque
 from rocket_simulation import RocketSimulation, ENGINES
+from apogee_table import ApogeeTable
+from flight_recording import FlightArchive, trim_recordings
 
 # Initialize Pygame
 pygame.init()
@@ -12,6 +20,20 @@ pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
+MAX_PHYSICS_STEPS = 20  # Catch-up cap per rendered frame; a longer stall is dropped
+HISTORY_LIMIT = 600  # Flight samples kept for the live display
+# Every flight is appended here as a binary recording for the replay screen;
+# only the newest MAX_RECORDINGS flights are kept
+RECORDINGS_PATH = os.path.join(os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share")),
+                               "rocket_game", "flight_recordings.rkf")
+MAX_RECORDINGS = 50
+
+# Background music track for each game state (other states keep the current track)
+STATE_MUSIC = {
+    "menu": "menu",
+    "flying": "flight",
+    "time_travel": "time_travel",
+}
 
 # Colors
 BLACK = (0, 0, 0)
@@ -30,158 +52,207 @@ LIME_GREEN = (50, 205, 50)
 SILVER = (192, 192, 192)
 GOLD = (255, 215, 0)
 
+SAMPLE_RATE = 22050  # Hz, matches the mixer
+
+# Sound effect synthesis: each function maps a time vector (seconds) to a
+# mono waveform in the -1..1 range.
+def synth_rocket_launch(t):
+    # White noise for engine roar
+    noise = np.random.uniform(-0.3, 0.3, t.size)
+    # Low frequency rumble
+    rumble = 0.4 * np.sin(2 * np.pi * 80 * t) * np.exp(-t * 0.5)
+    # High frequency whoosh
+    whoosh = 0.2 * np.sin(2 * np.pi * 400 * t) * np.exp(-t * 2.0)
+    return noise + rumble + whoosh
+
+def synth_countdown_beep(t):
+    return 0.3 * np.sin(2 * np.pi * 800 * t) * np.exp(-t * 8)
+
+def synth_collect_sound(t):
+    # Crystal/energy pickup
+    ding = 0.4 * np.sin(2 * np.pi * 1200 * t) * np.exp(-t * 4)
+    ding += 0.2 * np.sin(2 * np.pi * 1600 * t) * np.exp(-t * 6)
+    return ding
+
+def synth_time_travel_sound(t, delay=1000):
+    # Magical whoosh with rising frequency
+    freq = 200 + 800 * t
+    magic = 0.3 * np.sin(2 * np.pi * freq * t) * (1 - t/1.5)
+    # Reverb-like feedback from `delay` samples earlier (sample i > delay),
+    # computed a block at a time: each block only reads finished samples
+    for start in range(delay + 1, t.size, delay):
+        end = min(start + delay, t.size)
+        magic[start:end] += 0.1 * magic[start - delay:end - delay]
+    return magic
+
+def synth_baseball_hit(t):
+    # Sharp crack sound
+    return 0.5 * np.random.uniform(-1, 1, t.size) * np.exp(-t * 15)
+
+def synth_parachute_deploy(t):
+    # Soft whoosh
+    return 0.2 * np.sin(2 * np.pi * 120 * t) * np.exp(-t * 2)
+
+def synth_game_over_sound(t):
+    # Dramatic downward spiral
+    freq = 400 * np.exp(-t * 2)  # Falling frequency
+    drama = 0.4 * np.sin(2 * np.pi * freq * t) * (1 - t/2.0)
+    # Add some dissonance
+    drama += 0.2 * np.sin(2 * np.pi * freq * 0.7 * t) * (1 - t/2.0)
+    return drama
+
+def synth_menu_click(t):
+    return 0.3 * np.sin(2 * np.pi * 600 * t) * np.exp(-t * 20)
+
+def synth_wind_ambient(t):
+    # Soft wind noise
+    return 0.1 * np.random.uniform(-1, 1, t.size) * np.sin(2 * np.pi * 0.5 * t)
+
+def synth_dinosaur_roar(t):
+    # Deep roar with harmonics
+    roar = 0.4 * np.sin(2 * np.pi * 120 * t) * np.exp(-t * 0.8)
+    roar += 0.2 * np.sin(2 * np.pi * 240 * t) * np.exp(-t * 1.2)
+    roar += 0.1 * np.random.uniform(-0.5, 0.5, t.size)  # Add growl texture
+    return roar
+
+def synth_robot_beep(t):
+    # Electronic beeping
+    beep = 0.3 * np.sin(2 * np.pi * 880 * t) * np.exp(-t * 5)
+    beep += 0.2 * np.sin(2 * np.pi * 1760 * t) * np.exp(-t * 8)
+    return beep
+
+# Effect name -> (duration in seconds, synthesis function)
+SOUND_EFFECTS = {
+    'rocket_launch': (2.0, synth_rocket_launch),
+    'countdown_beep': (0.3, synth_countdown_beep),
+    'collect_sound': (0.5, synth_collect_sound),
+    'time_travel_sound': (1.5, synth_time_travel_sound),
+    'baseball_hit': (0.2, synth_baseball_hit),
+    'parachute_deploy': (0.8, synth_parachute_deploy),
+    'game_over_sound': (2.0, synth_game_over_sound),
+    'menu_click': (0.1, synth_menu_click),
+    'wind_ambient': (3.0, synth_wind_ambient),
+    'dinosaur_roar': (1.5, synth_dinosaur_roar),
+    'robot_beep': (0.4, synth_robot_beep),
+}
+
+def synth_menu_music(t):
+    # Peaceful ambient menu music: soft pad chords
+    chord = 0.1 * np.sin(2 * np.pi * 220 * t)  # A3
+    chord += 0.08 * np.sin(2 * np.pi * 277.18 * t)  # C#4
+    chord += 0.06 * np.sin(2 * np.pi * 329.63 * t)  # E4
+    # Add some subtle movement
+    chord *= (1 + 0.2 * np.sin(2 * np.pi * 0.1 * t))
+    return chord
+
+def synth_flight_music(t):
+    # Driving bassline
+    bass = 0.15 * np.sin(2 * np.pi * 110 * t)  # A2
+    # Exciting melody
+    melody_freq = 440 + 100 * np.sin(2 * np.pi * 0.5 * t)
+    melody = 0.1 * np.sin(2 * np.pi * melody_freq * t)
+    # Add some percussion-like hits on every beat
+    percussion = np.where((t * 4).astype(int) % 4 == 0, 0.05 * np.exp(-(t % 0.25) * 20), 0.0)
+    return bass + melody + percussion
+
+def synth_time_travel_music(t):
+    # Ethereal pads with modulation
+    pad1 = 0.08 * np.sin(2 * np.pi * 333 * t) * (1 + 0.3 * np.sin(2 * np.pi * 0.3 * t))
+    pad2 = 0.06 * np.sin(2 * np.pi * 444 * t) * (1 + 0.2 * np.sin(2 * np.pi * 0.7 * t))
+    # Add some sparkle
+    sparkle = 0.04 * np.sin(2 * np.pi * 1333 * t) * np.sin(2 * np.pi * 0.1 * t)
+    return pad1 + pad2 + sparkle
+
+MUSIC_TRACKS = {
+    'menu': synth_menu_music,
+    'flight': synth_flight_music,
+    'time_travel': synth_time_travel_music,
+}
+
+def synthesize(synth, duration, sample_rate=SAMPLE_RATE):
+    """Run a synthesis function over `duration` seconds of samples"""
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    return synth(t)
+
+def to_stereo_int16(wave):
+    """Mono float waveform -> stereo int16 buffer for pygame.sndarray"""
+    return (np.repeat(wave[:, np.newaxis], 2, axis=1) * 32767).astype(np.int16)
+
+# Synthesized buffers are cached here between runs
+SOUND_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+                               "rocket_game", "sounds")
+
+def synthesis_key(name, synth, duration, sample_rate=SAMPLE_RATE):
+    """Hash of everything that determines a synthesized buffer
+    
+    Includes the synthesis function's bytecode, constants and defaults, so
+    editing a sound's formula invalidates its cached buffer.
+    """
+    code = synth.__code__
+    params = (name, duration, sample_rate, code.co_code, code.co_consts, synth.__defaults__)
+    return hashlib.sha256(repr(params).encode()).hexdigest()[:16]
+
+def load_or_synthesize(name, synth, duration, cache_dir=SOUND_CACHE_DIR):
+    """Stereo int16 buffer for a sound, memory-mapped from the cache when possible
+    
+    Returns (buffer, synthesized) where synthesized is False on a cache hit.
+    """
+    if cache_dir is None:
+        return to_stereo_int16(synthesize(synth, duration)), True
+    
+    path = os.path.join(cache_dir, f"{name}-{synthesis_key(name, synth, duration)}.npy")
+    try:
+        return np.load(path, mmap_mode='r'), False
+    except (OSError, ValueError):
+        pass
+    
+    buffer = to_stereo_int16(synthesize(synth, duration))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write under a temporary name so a crash never leaves a partial file
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as f:
+            np.save(f, buffer)
+        os.replace(temporary, path)
+    except OSError:
+        pass  # The cache is only an optimization
+    return buffer, True
+
 class SoundManager:
-    def __init__(self):
+    MUSIC_CACHE_SIZE = 3  # Generated music tracks kept ready to play
+    
+    def __init__(self, cache_dir=SOUND_CACHE_DIR):
         self.sounds_enabled = True
         self.music_enabled = False  # Disabled background music
         self.volume = 0.7
         self.current_music = None
+        self.current_music_channel = None
+        self.pending_music = None  # Requested track that is still being generated
+        self.cache_dir = cache_dir  # None disables the on-disk sound cache
+        self.synthesized_count = 0  # Buffers that missed the cache
+        
+        # Music tracks are generated on a background thread so switching
+        # tracks never blocks a frame
+        self.music_cache = OrderedDict()  # music_type -> pygame Sound
+        self._music_buffers = {}  # Finished by the worker, not yet turned into Sounds
+        self._music_queued = set()
+        self._music_lock = threading.Lock()
+        self._music_requests = queue.Queue()
+        self._music_worker = threading.Thread(target=self._music_worker_loop, daemon=True)
+        self._music_worker.start()
         
         # Create synthesized sound effects
         self.create_sound_effects()
         
+        if self.music_enabled:
+            self.prefetch_music("menu")
+        
     def create_sound_effects(self):
         """Create synthesized sound effects using pygame"""
-        import numpy as np
-        
-        # Rocket launch sound (whoosh with engine roar)
-        duration = 2.0
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        
-        # Create rocket launch sound
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            t = float(i) / sample_rate
-            # White noise for engine roar
-            noise = np.random.uniform(-0.3, 0.3)
-            # Low frequency rumble
-            rumble = 0.4 * np.sin(2 * np.pi * 80 * t) * np.exp(-t * 0.5)
-            # High frequency whoosh
-            whoosh = 0.2 * np.sin(2 * np.pi * 400 * t) * np.exp(-t * 2.0)
-            
-            sound = noise + rumble + whoosh
-            arr[i] = [sound, sound]
-        
-        # Convert to pygame sound
-        arr = (arr * 32767).astype(np.int16)
-        self.rocket_launch = pygame.sndarray.make_sound(arr)
-        
-        # Countdown beep
-        frames = int(0.3 * sample_rate)
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            t = float(i) / sample_rate
-            beep = 0.3 * np.sin(2 * np.pi * 800 * t) * np.exp(-t * 8)
-            arr[i] = [beep, beep]
-        arr = (arr * 32767).astype(np.int16)
-        self.countdown_beep = pygame.sndarray.make_sound(arr)
-        
-        # Collection sound (crystal/energy pickup)
-        frames = int(0.5 * sample_rate)
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            t = float(i) / sample_rate
-            ding = 0.4 * np.sin(2 * np.pi * 1200 * t) * np.exp(-t * 4)
-            ding += 0.2 * np.sin(2 * np.pi * 1600 * t) * np.exp(-t * 6)
-            arr[i] = [ding, ding]
-        arr = (arr * 32767).astype(np.int16)
-        self.collect_sound = pygame.sndarray.make_sound(arr)
-        
-        # Time travel sound (magical whoosh)
-        frames = int(1.5 * sample_rate)
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            t = float(i) / sample_rate
-            freq = 200 + 800 * t  # Rising frequency
-            magic = 0.3 * np.sin(2 * np.pi * freq * t) * (1 - t/1.5)
-            # Add some reverb-like effect
-            if i > 1000:
-                magic += 0.1 * arr[i-1000][0]
-            arr[i] = [magic, magic]
-        arr = (arr * 32767).astype(np.int16)
-        self.time_travel_sound = pygame.sndarray.make_sound(arr)
-        
-        # Baseball hit sound
-        frames = int(0.2 * sample_rate)
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            t = float(i) / sample_rate
-            # Sharp crack sound
-            crack = 0.5 * np.random.uniform(-1, 1) * np.exp(-t * 15)
-            arr[i] = [crack, crack]
-        arr = (arr * 32767).astype(np.int16)
-        self.baseball_hit = pygame.sndarray.make_sound(arr)
-        
-        # Parachute deploy sound
-        frames = int(0.8 * sample_rate)
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            t = float(i) / sample_rate
-            # Soft whoosh
-            whoosh = 0.2 * np.sin(2 * np.pi * 120 * t) * np.exp(-t * 2)
-            arr[i] = [whoosh, whoosh]
-        arr = (arr * 32767).astype(np.int16)
-        self.parachute_deploy = pygame.sndarray.make_sound(arr)
-        
-        # Game over sound (dramatic downward spiral)
-        frames = int(2.0 * sample_rate)
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            t = float(i) / sample_rate
-            freq = 400 * np.exp(-t * 2)  # Falling frequency
-            drama = 0.4 * np.sin(2 * np.pi * freq * t) * (1 - t/2.0)
-            # Add some dissonance
-            drama += 0.2 * np.sin(2 * np.pi * freq * 0.7 * t) * (1 - t/2.0)
-            arr[i] = [drama, drama]
-        arr = (arr * 32767).astype(np.int16)
-        self.game_over_sound = pygame.sndarray.make_sound(arr)
-        
-        # Menu click sound
-        frames = int(0.1 * sample_rate)
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            t = float(i) / sample_rate
-            click = 0.3 * np.sin(2 * np.pi * 600 * t) * np.exp(-t * 20)
-            arr[i] = [click, click]
-        arr = (arr * 32767).astype(np.int16)
-        self.menu_click = pygame.sndarray.make_sound(arr)
-        
-        # Wind ambient sound
-        frames = int(3.0 * sample_rate)
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            t = float(i) / sample_rate
-            # Soft wind noise
-            wind = 0.1 * np.random.uniform(-1, 1) * np.sin(2 * np.pi * 0.5 * t)
-            arr[i] = [wind, wind]
-        arr = (arr * 32767).astype(np.int16)
-        self.wind_ambient = pygame.sndarray.make_sound(arr)
-        
-        # Dinosaur roar
-        frames = int(1.5 * sample_rate)
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            t = float(i) / sample_rate
-            # Deep roar with harmonics
-            roar = 0.4 * np.sin(2 * np.pi * 120 * t) * np.exp(-t * 0.8)
-            roar += 0.2 * np.sin(2 * np.pi * 240 * t) * np.exp(-t * 1.2)
-            roar += 0.1 * np.random.uniform(-0.5, 0.5)  # Add growl texture
-            arr[i] = [roar, roar]
-        arr = (arr * 32767).astype(np.int16)
-        self.dinosaur_roar = pygame.sndarray.make_sound(arr)
-        
-        # Robot beep
-        frames = int(0.4 * sample_rate)
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            t = float(i) / sample_rate
-            # Electronic beeping
-            beep = 0.3 * np.sin(2 * np.pi * 880 * t) * np.exp(-t * 5)
-            beep += 0.2 * np.sin(2 * np.pi * 1760 * t) * np.exp(-t * 8)
-            arr[i] = [beep, beep]
-        arr = (arr * 32767).astype(np.int16)
-        self.robot_beep = pygame.sndarray.make_sound(arr)
+        for name, (duration, synth) in SOUND_EFFECTS.items():
+            buffer, synthesized = load_or_synthesize(name, synth, duration, self.cache_dir)
+            self.synthesized_count += synthesized
+            setattr(self, name, pygame.sndarray.make_sound(buffer))
         
     def play_sound(self, sound_name):
         """Play a sound effect"""
@@ -195,75 +266,96 @@ class SoundManager:
         except AttributeError:
             pass  # Sound doesn't exist
     
+    def create_background_music_buffer(self, music_type, duration=30.0):
+        """Stereo int16 buffer of looping background music"""
+        if music_type in MUSIC_TRACKS:
+            buffer, synthesized = load_or_synthesize(f"music_{music_type}", MUSIC_TRACKS[music_type],
+                                                     duration, self.cache_dir)
+            self.synthesized_count += synthesized
+            return buffer
+        return to_stereo_int16(np.zeros(int(duration * SAMPLE_RATE)))
+    
     def create_background_music(self, music_type, duration=30.0):
         """Create looping background music"""
-        import numpy as np
-        
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
-        
-        if music_type == "menu":
-            # Peaceful ambient menu music
-            for i in range(frames):
-                t = float(i) / sample_rate
-                # Soft pad chords
-                chord = 0.1 * np.sin(2 * np.pi * 220 * t)  # A3
-                chord += 0.08 * np.sin(2 * np.pi * 277.18 * t)  # C#4
-                chord += 0.06 * np.sin(2 * np.pi * 329.63 * t)  # E4
-                # Add some subtle movement
-                chord *= (1 + 0.2 * np.sin(2 * np.pi * 0.1 * t))
-                arr[i] = [chord, chord]
-                
-        elif music_type == "flight":
-            # Exciting flight music
-            for i in range(frames):
-                t = float(i) / sample_rate
-                # Driving bassline
-                bass = 0.15 * np.sin(2 * np.pi * 110 * t)  # A2
-                # Exciting melody
-                melody_freq = 440 + 100 * np.sin(2 * np.pi * 0.5 * t)
-                melody = 0.1 * np.sin(2 * np.pi * melody_freq * t)
-                # Add some percussion-like hits
-                if int(t * 4) % 4 == 0:  # Every beat
-                    percussion = 0.05 * np.exp(-(t % 0.25) * 20)
-                else:
-                    percussion = 0
-                music = bass + melody + percussion
-                arr[i] = [music, music]
-                
-        elif music_type == "time_travel":
-            # Mystical time travel ambient
-            for i in range(frames):
-                t = float(i) / sample_rate
-                # Ethereal pads with modulation
-                pad1 = 0.08 * np.sin(2 * np.pi * 333 * t) * (1 + 0.3 * np.sin(2 * np.pi * 0.3 * t))
-                pad2 = 0.06 * np.sin(2 * np.pi * 444 * t) * (1 + 0.2 * np.sin(2 * np.pi * 0.7 * t))
-                # Add some sparkle
-                sparkle = 0.04 * np.sin(2 * np.pi * 1333 * t) * np.sin(2 * np.pi * 0.1 * t)
-                music = pad1 + pad2 + sparkle
-                arr[i] = [music, music]
-        
-        # Convert to pygame sound
-        arr = (arr * 32767).astype(np.int16)
-        return pygame.sndarray.make_sound(arr)
+        return pygame.sndarray.make_sound(self.create_background_music_buffer(music_type, duration))
     
-    def play_background_music(self, music_type):
-        """Generate and play background music"""
+    def prefetch_music(self, music_type):
+        """Queue a music track for generation on the background worker (only while music is on)"""
         if not self.music_enabled:
             return
-            
-        # Stop current music
-        if hasattr(self, 'current_music_channel'):
+        with self._music_lock:
+            if (music_type in self.music_cache or music_type in self._music_buffers or
+                music_type in self._music_queued):
+                return
+            self._music_queued.add(music_type)
+        self._music_requests.put(music_type)
+    
+    def _music_worker_loop(self):
+        while True:
+            music_type = self._music_requests.get()
+            try:
+                buffer = self.create_background_music_buffer(music_type)
+            except Exception:
+                # Keep the worker alive; the track can be requested again later
+                with self._music_lock:
+                    self._music_queued.discard(music_type)
+                continue
+            with self._music_lock:
+                self._music_buffers[music_type] = buffer
+                self._music_queued.discard(music_type)
+    
+    def _ready_music(self, music_type):
+        """The track's Sound if it has been generated, otherwise None (never blocks)"""
+        if music_type in self.music_cache:
+            self.music_cache.move_to_end(music_type)
+            return self.music_cache[music_type]
+        with self._music_lock:
+            buffer = self._music_buffers.pop(music_type, None)
+        if buffer is None:
+            return None
+        
+        sound = pygame.sndarray.make_sound(buffer)
+        self.music_cache[music_type] = sound
+        while len(self.music_cache) > self.MUSIC_CACHE_SIZE:
+            self.music_cache.popitem(last=False)
+        return sound
+    
+    def _start_music(self, sound):
+        sound.set_volume(self.volume * 0.3)  # Lower volume for background
+        self.current_music_channel = sound.play(loops=-1)  # Loop forever
+    
+    def stop_music(self):
+        if self.current_music_channel is not None:
             self.current_music_channel.stop()
-            
-        # Create and play new music
-        if music_type != self.current_music:
-            music_sound = self.create_background_music(music_type)
-            music_sound.set_volume(self.volume * 0.3)  # Lower volume for background
-            self.current_music_channel = music_sound.play(loops=-1)  # Loop forever
-            self.current_music = music_type
-            
+            self.current_music_channel = None
+    
+    def play_background_music(self, music_type):
+        """Switch to a background music track
+        
+        If the track is not generated yet it is queued, and the music stays
+        silent until update() finds it ready.
+        """
+        if not self.music_enabled or music_type == self.current_music:
+            return
+        
+        self.stop_music()
+        self.current_music = music_type
+        sound = self._ready_music(music_type)
+        if sound is None:
+            self.pending_music = music_type
+            self.prefetch_music(music_type)
+        else:
+            self.pending_music = None
+            self._start_music(sound)
+    
+    def update(self):
+        """Start a pending music track once the worker has generated it"""
+        if self.pending_music is not None:
+            sound = self._ready_music(self.pending_music)
+            if sound is not None:
+                self.pending_music = None
+                self._start_music(sound)
+    
     def toggle_sounds(self):
         """Toggle sound effects on/off"""
         self.sounds_enabled = not self.sounds_enabled
@@ -271,42 +363,276 @@ class SoundManager:
     def toggle_music(self):
         """Toggle background music on/off"""
         self.music_enabled = not self.music_enabled
-        if not self.music_enabled:
-            pygame.mixer.music.stop()
+        if self.music_enabled:
+            self.prefetch_music("menu")
+        else:
+            self.stop_music()
+            self.current_music = None
+            self.pending_music = None
     
     def set_volume(self, volume):
         """Set master volume (0.0 to 1.0)"""
         self.volume = max(0.0, min(1.0, volume))
 
-class Particle:
-    def __init__(self, x, y, vx, vy, life, color):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.life = life
-        self.max_life = life
-        self.color = color
-        self.size = random.uniform(2, 5)
+class TextRenderer:
+    """Caches fonts by size and rendered text surfaces by (text, size, color)"""
+    MAX_SURFACES = 256  # Rendered strings kept (least recently used are dropped)
+    
+    def __init__(self, max_surfaces=MAX_SURFACES):
+        self.max_surfaces = max_surfaces
+        self.fonts = {}  # size -> pygame Font
+        self.surfaces = OrderedDict()  # cache key -> rendered Surface
+    
+    def font(self, size):
+        if size not in self.fonts:
+            self.fonts[size] = pygame.font.Font(None, size)
+        return self.fonts[size]
+    
+    def _cached(self, key, build):
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = build()
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_surfaces:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+    
+    def render(self, text, size, color):
+        """Antialiased text surface, rendered once per (text, size, color)"""
+        return self._cached((text, size, color),
+                            lambda: self.font(size).render(text, True, color))
+    
+    def render_outline(self, text, size, outline_color, width=2):
+        """The text stamped at every offset within `width` pixels, as one surface
+        
+        The result is `width` pixels larger than the plain text on every side.
+        """
+        def build():
+            stamp = self.render(text, size, outline_color)
+            outline = pygame.Surface((stamp.get_width() + 2 * width, stamp.get_height() + 2 * width),
+                                     pygame.SRCALPHA)
+            for dx in range(-width, width + 1):
+                for dy in range(-width, width + 1):
+                    if dx != 0 or dy != 0:
+                        outline.blit(stamp, (width + dx, width + dy))
+            return outline
+        return self._cached(("outline", text, size, outline_color, width), build)
+    
+    def render_outlined(self, text, size, color, outline_color, width=2):
+        """Text in `color` over its pre-composited outline"""
+        def build():
+            surface = self.render_outline(text, size, outline_color, width).copy()
+            surface.blit(self.render(text, size, color), (width, width))
+            return surface
+        return self._cached(("outlined", text, size, color, outline_color, width), build)
+
+# Particle base colours: red flames and smoke grays (spawned colours snap to the nearest)
+PARTICLE_PALETTE = [RED] + [(gray, gray, gray) for gray in (200, 208, 216, 224, 232, 240, 248, 255)]
+
+class ParticleAtlas:
+    """Pre-rendered particle circles for every palette colour, fade level and radius
+    
+    Cells are laid out on one colour-keyed surface so a whole frame of
+    particles can be drawn with a single Surface.blits call.
+    """
+    RADII = (2, 3, 4, 5)
+    FADE_LEVELS = 32
+    COLORKEY = (255, 0, 255)
+    _default = None
+    
+    def __init__(self, palette=PARTICLE_PALETTE, radii=RADII, fade_levels=FADE_LEVELS):
+        self.palette = np.array(palette, dtype=float)
+        self.radii = radii
+        self.fade_levels = fade_levels
+        cell = 2 * max(radii)
+        rows = len(palette) * fade_levels
+        
+        surface = pygame.Surface((cell * len(radii), cell * rows))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(self.COLORKEY)
+        surface.set_colorkey(self.COLORKEY)
+        
+        self.areas = []  # Cell rect by (color_index * fade_levels + level) * len(radii) + radius_index
+        for row in range(rows):
+            color_index, level = divmod(row, fade_levels)
+            color = (self.palette[color_index] * level / (fade_levels - 1)).astype(int).tolist()
+            for column, radius in enumerate(radii):
+                pygame.draw.circle(surface, color, (column * cell + radius, row * cell + radius), radius)
+                self.areas.append(pygame.Rect(column * cell, row * cell, 2 * radius, 2 * radius))
+        self.surface = surface
+        
+        self._radius_index = np.zeros(max(radii) + 1, dtype=int)
+        self._radius_index[list(radii)] = np.arange(len(radii))
+    
+    @classmethod
+    def default(cls):
+        """Shared atlas for the default palette, built on first use"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+    
+    def nearest_color(self, colors):
+        """Palette index of the closest entry for each RGB row"""
+        distance = np.abs(np.asarray(colors, dtype=float)[:, None, :] - self.palette[None, :, :]).sum(axis=2)
+        return np.argmin(distance, axis=1)
+    
+    def draw(self, screen, centers, radii, color_index, fade):
+        """Blit one circle per particle; returns the rect they cover"""
+        radii = np.clip(radii, self.radii[0], self.radii[-1])
+        level = np.rint(fade * (self.fade_levels - 1)).astype(int)
+        cells = (color_index * self.fade_levels + level) * len(self.radii) + self._radius_index[radii]
+        left = centers[:, 0] - radii
+        top = centers[:, 1] - radii
+        areas = self.areas
+        surface = self.surface
+        screen.blits([(surface, (x, y), areas[cell])
+                      for x, y, cell in zip(left.tolist(), top.tolist(), cells.tolist())], doreturn=False)
+        
+        x, y = int(left.min()), int(top.min())
+        width = int((left + 2 * radii).max()) - x
+        height = int((top + 2 * radii).max()) - y
+        return pygame.Rect(x, y, width, height).clip(screen.get_rect())
+
+class ParticlePool:
+    """Particles held in fixed-capacity NumPy arrays (one row per slot)
+    
+    Dead slots are reused by later spawns; when every slot is live, new
+    particles are dropped.
+    """
+    CAPACITY = 4096
+    GRAVITY = 0.1  # pixels per frame per frame
+    
+    def __init__(self, capacity=CAPACITY, atlas=None):
+        self.capacity = capacity
+        self.atlas = atlas  # Defaults to ParticleAtlas.default() on first draw
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.life = np.zeros(capacity, dtype=int)
+        self.max_life = np.ones(capacity, dtype=int)
+        self.color = np.zeros((capacity, 3))  # Base colour as spawned
+        self.color_index = np.zeros(capacity, dtype=int)  # Nearest atlas palette entry
+        self.fade = np.ones(capacity)  # Remaining life fraction
+        self.size = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+    
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+    
+    def clear(self):
+        self.alive[:] = False
+    
+    def _atlas(self):
+        if self.atlas is None:
+            self.atlas = ParticleAtlas.default()
+        return self.atlas
+    
+    def spawn(self, x, y, vx, vy, life, color):
+        """Add particles from equal-length arrays (color is one RGB row per particle)"""
+        slots = np.flatnonzero(~self.alive)[:len(life)]
+        count = slots.size
+        self.position[slots, 0] = x[:count]
+        self.position[slots, 1] = y[:count]
+        self.velocity[slots, 0] = vx[:count]
+        self.velocity[slots, 1] = vy[:count]
+        self.life[slots] = life[:count]
+        self.max_life[slots] = life[:count]
+        self.color[slots] = color[:count]
+        self.color_index[slots] = self._atlas().nearest_color(color[:count])
+        self.fade[slots] = 1.0
+        self.size[slots] = np.random.uniform(2, 5, count)
+        self.alive[slots] = True
     
     def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.1  # gravity
-        self.life -= 1
-        
-        # Fade color based on life
-        alpha = self.life / self.max_life
-        self.current_color = (
-            int(self.color[0] * alpha),
-            int(self.color[1] * alpha),
-            int(self.color[2] * alpha)
-        )
+        """Cull expired particles, then move, apply gravity, age and fade the rest"""
+        self.alive &= self.life > 0
+        live = np.flatnonzero(self.alive)
+        self.position[live] += self.velocity[live]
+        self.velocity[live, 1] += self.GRAVITY
+        self.life[live] -= 1
+        self.fade[live] = self.life[live] / self.max_life[live]
+    
+    def draw(self, screen):
+        """Draw the visible particles; returns the rect they cover (None if there are none)"""
+        visible = np.flatnonzero(self.alive & (self.life > 0))
+        if not visible.size:
+            return None
+        return self._atlas().draw(screen, self.position[visible].astype(int), self.size[visible].astype(int),
+                                  self.color_index[visible], self.fade[visible])
+
+class TrajectoryTrail:
+    """Flight trail drawn incrementally and faded by alpha
+    
+    Each new point draws only the segment joining it to the previous one.
+    Segments are drawn onto an open alpha surface; every CHUNK_SECONDS the
+    part of it holding new segments is cut out into a chunk, and chunks fade
+    by lowering their surface alpha instead of being redrawn, until they are
+    dropped. Fading follows elapsed time, so the trail looks the same at any
+    frame rate, and the per-frame cost does not grow with the length of the
+    trail. The points themselves are kept in a bounded deque.
+    """
+    MAX_POINTS = 4096
+    FADE_RATE = 120  # Alpha removed per second (0 keeps the whole flight path)
+    CHUNK_SECONDS = 8 / 60
+    
+    def __init__(self, size, color=YELLOW, width=2, max_points=MAX_POINTS, fade_rate=FADE_RATE):
+        self.color = color
+        self.width = width
+        self.fade_rate = fade_rate
+        self.points = deque(maxlen=max_points)
+        self.chunks = deque()  # [surface, rect, alpha], oldest first
+        self._open = pygame.Surface(size, pygame.SRCALPHA)
+        self._open_bounds = None  # Area holding the segments not yet cut into a chunk
+        self._open_age = 0.0  # Seconds since the open segments were last cut into a chunk
+    
+    def __len__(self):
+        return len(self.points)
+    
+    def clear(self):
+        self.points.clear()
+        self.chunks.clear()
+        self._open.fill((0, 0, 0, 0))
+        self._open_bounds = None
+        self._open_age = 0.0
+    
+    def add(self, point):
+        """Extend the trail to a new screen position"""
+        if self.points:
+            rect = pygame.draw.line(self._open, self.color, self.points[-1], point, self.width)
+            self._open_bounds = rect if self._open_bounds is None else self._open_bounds.union(rect)
+        self.points.append(point)
+    
+    def fade(self, elapsed):
+        """Age the trail by `elapsed` seconds"""
+        if not self.fade_rate:
+            return
+        for chunk in self.chunks:
+            chunk[2] -= self.fade_rate * elapsed
+            chunk[0].set_alpha(max(round(chunk[2]), 0))
+        while self.chunks and self.chunks[0][2] <= 0:
+            self.chunks.popleft()
+        
+        self._open_age += elapsed
+        if self._open_age >= self.CHUNK_SECONDS - 1e-9:  # Tolerate rounding in summed frame times
+            self._open_age = 0.0
+            if self._open_bounds is not None:
+                bounds = self._open_bounds
+                self.chunks.append([self._open.subsurface(bounds).copy(), bounds, 255])
+                self._open.fill((0, 0, 0, 0), bounds)
+                self._open_bounds = None
     
     def draw(self, screen):
-        if self.life > 0:
-            pygame.draw.circle(screen, self.current_color, 
-                             (int(self.x), int(self.y)), int(self.size))
+        """Blit the trail; returns the rect it covers (None if nothing has been drawn)"""
+        covered = None
+        for surface, rect, alpha in self.chunks:
+            drawn = screen.blit(surface, rect)
+            covered = drawn if covered is None else covered.union(drawn)
+        if self._open_bounds is not None:
+            drawn = screen.blit(self._open, self._open_bounds.topleft, self._open_bounds)
+            covered = drawn if covered is None else covered.union(drawn)
+        return covered
 
 class RocketSprite:
     def __init__(self, x, y):
@@ -314,7 +640,7 @@ class RocketSprite:
         self.y = y
         self.angle = 0
         self.scale = 1.0
-        self.exhaust_particles = []
+        self.exhaust_particles = ParticlePool()
         self.parachute_deployed = False
         
     def draw_rocket(self, screen):
@@ -326,7 +652,7 @@ class RocketSprite:
             (self.x + 3 * self.scale, self.y + 10 * self.scale),
             (self.x + 3 * self.scale, self.y - 10 * self.scale)
         ]
-        pygame.draw.polygon(screen, BLUE, rocket_points)
+        bounds = pygame.draw.polygon(screen, BLUE, rocket_points)
         
         # Red nose cone
         nose_points = [
@@ -334,7 +660,7 @@ class RocketSprite:
             (self.x - 3 * self.scale, self.y - 10 * self.scale),
             (self.x + 3 * self.scale, self.y - 10 * self.scale)
         ]
-        pygame.draw.polygon(screen, RED, nose_points)
+        bounds.union_ip(pygame.draw.polygon(screen, RED, nose_points))
         
         # Fins
         fin_points = [
@@ -342,20 +668,21 @@ class RocketSprite:
             (self.x - 8 * self.scale, self.y + 15 * self.scale),
             (self.x - 3 * self.scale, self.y + 10 * self.scale)
         ]
-        pygame.draw.polygon(screen, GRAY, fin_points)
+        bounds.union_ip(pygame.draw.polygon(screen, GRAY, fin_points))
         
         fin_points_right = [
             (self.x + 3 * self.scale, self.y + 8 * self.scale),
             (self.x + 8 * self.scale, self.y + 15 * self.scale),
             (self.x + 3 * self.scale, self.y + 10 * self.scale)
         ]
-        pygame.draw.polygon(screen, GRAY, fin_points_right)
+        bounds.union_ip(pygame.draw.polygon(screen, GRAY, fin_points_right))
+        return bounds
         
     def draw_parachute(self, screen):
         if self.parachute_deployed:
             # Parachute canopy (semi-circle)
             parachute_radius = 25
-            pygame.draw.arc(screen, RED, 
+            bounds = pygame.draw.arc(screen, RED, 
                           (self.x - parachute_radius, self.y - 50 - parachute_radius,
                            parachute_radius * 2, parachute_radius * 2),
                           0, math.pi, 3)
@@ -363,60 +690,71 @@ class RocketSprite:
             # Parachute lines
             for i in range(-2, 3):
                 line_x = self.x + i * 8
-                pygame.draw.line(screen, WHITE, 
-                               (line_x, self.y - 50), (self.x, self.y - 15), 1)
+                bounds.union_ip(pygame.draw.line(screen, WHITE, 
+                               (line_x, self.y - 50), (self.x, self.y - 15), 1))
+            return bounds
     
     def add_exhaust_particle(self, engine_burning=False):
         if not self.parachute_deployed:
             # Add red exhaust particles (flames) when engine is burning
             if engine_burning:
-                for _ in range(5):
-                    px = self.x + random.uniform(-3, 3)
-                    py = self.y + 15
-                    pvx = random.uniform(-2, 2)
-                    pvy = random.uniform(3, 8)
-                    life = random.randint(15, 30)
-                    color = RED  # Red flames
-                    self.exhaust_particles.append(Particle(px, py, pvx, pvy, life, color))
+                count = 5
+                self.exhaust_particles.spawn(
+                    self.x + np.random.uniform(-3, 3, count),
+                    np.full(count, self.y + 15),
+                    np.random.uniform(-2, 2, count),
+                    np.random.uniform(3, 8, count),
+                    np.random.randint(15, 31, count),
+                    np.tile(RED, (count, 1)))  # Red flames
                 
                 # Add white smoke particles for launch effect
-                for _ in range(8):
-                    px = self.x + random.uniform(-5, 5)
-                    py = self.y + 18 + random.uniform(0, 10)
-                    pvx = random.uniform(-3, 3)
-                    pvy = random.uniform(1, 4)
-                    life = random.randint(40, 80)
-                    # White smoke with some gray variation
-                    gray_val = random.randint(200, 255)
-                    color = (gray_val, gray_val, gray_val)
-                    self.exhaust_particles.append(Particle(px, py, pvx, pvy, life, color))
+                count = 8
+                # White smoke with some gray variation
+                gray_val = np.random.randint(200, 256, count)
+                self.exhaust_particles.spawn(
+                    self.x + np.random.uniform(-5, 5, count),
+                    self.y + 18 + np.random.uniform(0, 10, count),
+                    np.random.uniform(-3, 3, count),
+                    np.random.uniform(1, 4, count),
+                    np.random.randint(40, 81, count),
+                    np.repeat(gray_val[:, None], 3, axis=1))
     
     def update_particles(self):
-        self.exhaust_particles = [p for p in self.exhaust_particles if p.life > 0]
-        for particle in self.exhaust_particles:
-            particle.update()
+        self.exhaust_particles.update()
     
     def draw_particles(self, screen):
-        for particle in self.exhaust_particles:
-            particle.draw(screen)
+        """Draw the particles; returns the rect they cover (None if there are none)"""
+        return self.exhaust_particles.draw(screen)
+
+# States whose frames can be presented as dirty rectangles over the static background
+DIRTY_RECT_STATES = {"menu", "countdown", "flying", "results"}
 
 class VisualRocketGame:
-    def __init__(self):
+    def __init__(self, dirty_rects=False, max_fps=FPS, recordings_path=RECORDINGS_PATH, time_scale=1.0,
+                 max_recordings=MAX_RECORDINGS):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Estes Alpha III Rocket Simulation v2.0 - Time Travel Edition")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.text = TextRenderer()
+        self.font = self.text.font(36)
+        self.small_font = self.text.font(24)
         
         # Initialize sound manager
         self.sound_manager = SoundManager()
         
+        # Precomputed apogee/landing predictions for the menu
+        self.apogee_table = ApogeeTable.load_or_build()
+        
         # Game state
-        self.state = "menu"  # menu, countdown, flying, recovery, time_travel, results
+        self.state = "menu"  # menu, countdown, flying, recovery, throwing, rocket_falling, time_travel, results
         self.rocket_sprite = None
         self.simulation = None
         self.sim_time = 0
-        self.time_step = 0.033  # ~30 FPS simulation steps for faster falling
+        self.time_step = 0.01  # Fixed physics step (simulated seconds), same as RocketSimulation.dt
+        self.time_scale = time_scale  # Simulated seconds per real second (1.0 = real time)
+        self.max_fps = max_fps  # Render rate cap (0 = uncapped)
+        self.physics_accumulator = 0.0  # Simulated time owed to the physics
+        self.physics_alpha = 0.0  # Fraction of a step between the last two physics states
         self.scale_factor = 2.5  # pixels per meter (much bigger field)
         
         # Manual parachute control
@@ -429,6 +767,7 @@ class VisualRocketGame:
         
         # Landing variables
         self.landing_position = None
+        self.landing_zone = None  # "field" or "trees", classified once at landing
         self.landing_time = 0
         self.show_landing_marker = False
         
@@ -447,8 +786,42 @@ class VisualRocketGame:
         self.rocket_tree_height = 6
         self.baseball_player_x = 100  # Player position in baseball game
         
+        # Throw and rocket-fall animations (the "throwing" and "rocket_falling" states)
+        self.throw_duration = 2500  # ms
+        self.throw_start_time = 0
+        self.throw_hit = False
+        self.throw_hit_time = 0
+        self.fall_duration = 1500  # ms
+        self.fall_start_time = 0
+        self._baseball_scene = None
+        self._baseball_scene_key = None
+        
+        # Flight recordings and the replay screen (recordings_path=None disables saving)
+        self.recordings_path = recordings_path
+        self.max_recordings = max_recordings
+        self.recordings = None  # FlightArchive being replayed
+        self.replay = None  # FlightRecording being replayed
+        self.replay_index = 0
+        self.replay_time = 0.0
+        self.replay_paused = False
+        self._replay_path = []  # Screen points of the whole recorded flight
+        
         # Animation variables
-        self.trajectory_points = []
+        self.trail = TrajectoryTrail((SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+        # Pre-rendered backgrounds (see get_static_background / get_gradient)
+        self._background = None
+        self._background_key = None
+        self._gradient_cache = {}
+        
+        # Dirty-rectangle presentation: only the regions drawn this frame and
+        # last frame are restored from the background and sent to the display
+        self.dirty_rects_enabled = dirty_rects
+        self.frame_rects = []
+        self._last_frame_rects = []
+        self._full_redraw = True
+        self._drawn_state = None
+        self._menu_signature = None
         
         # Time travel mini-game variables
         self.time_era = "present"  # present, past, future
@@ -479,44 +852,94 @@ class VisualRocketGame:
         self.player_won = False
         self.win_start_time = 0
         
+    def get_gradient(self, top_color, bottom_color):
+        """Full-screen vertical gradient, rendered once per colour pair and screen size"""
+        width, height = self.screen.get_size()
+        key = (top_color, bottom_color, width, height)
+        if key not in self._gradient_cache:
+            surface = pygame.Surface((width, height)).convert()
+            for y in range(height):
+                color_ratio = y / height
+                color = tuple(int(top * (1 - color_ratio) + bottom * color_ratio)
+                              for top, bottom in zip(top_color, bottom_color))
+                pygame.draw.line(surface, color, (0, y), (width, y))
+            self._gradient_cache[key] = surface
+        return self._gradient_cache[key]
+    
+    def get_static_background(self):
+        """Sky, ground, field and trees, rebuilt only when the scale or screen size changes"""
+        key = (self.scale_factor, self.screen.get_size())
+        if self._background_key != key:
+            surface = self.get_gradient((135, 206, 235), (255, 255, 255)).copy()
+            self.render_scenery(surface)
+            self._background = surface
+            self._background_key = key
+        return self._background
+    
     def draw_background(self):
-        # Sky gradient
-        for y in range(SCREEN_HEIGHT):
-            color_ratio = y / SCREEN_HEIGHT
-            r = int(135 * (1 - color_ratio) + 255 * color_ratio)
-            g = int(206 * (1 - color_ratio) + 255 * color_ratio)
-            b = int(235 * (1 - color_ratio) + 255 * color_ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-        
+        background = self.get_static_background()
+        if self._full_redraw:
+            self.screen.blit(background, (0, 0))
+            return
+        # Erase last frame's sprites by restoring the background under them
+        for rect in self._last_frame_rects:
+            self.screen.blit(background, rect, rect)
+    
+    def mark_dirty(self, rect):
+        """Record a screen region drawn this frame (no-op for None)"""
+        if rect is not None:
+            self.frame_rects.append(rect)
+    
+    def begin_frame(self):
+        """Decide whether this frame can be presented with dirty rectangles"""
+        self.frame_rects = []
+        self._full_redraw = (not self.dirty_rects_enabled or
+                             self.state != self._drawn_state or
+                             self.state not in DIRTY_RECT_STATES)
+        if self._full_redraw:
+            self._last_frame_rects = []
+            self._menu_signature = None
+    
+    def present_frame(self):
+        """Flip the whole screen, or update just the regions touched this frame and last"""
+        if self._full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._last_frame_rects + self.frame_rects)
+        self._last_frame_rects = self.frame_rects
+        self._drawn_state = self.state
+    
+    def render_scenery(self, surface):
         # Ground
         ground_y = SCREEN_HEIGHT - 100
-        pygame.draw.rect(self.screen, GREEN, (0, ground_y, SCREEN_WIDTH, 100))
+        pygame.draw.rect(surface, GREEN, (0, ground_y, SCREEN_WIDTH, 100))
         
         # Football field - match simulation coordinates (109.7m field length)
         field_half_width = 109.7 * self.scale_factor / 2  # Half field width in pixels
         field_start_x = SCREEN_WIDTH // 2 - field_half_width
         field_end_x = SCREEN_WIDTH // 2 + field_half_width
         field_width_pixels = field_half_width * 2
-        pygame.draw.rect(self.screen, (0, 150, 0), 
+        pygame.draw.rect(surface, (0, 150, 0), 
                         (field_start_x, ground_y, field_width_pixels, 100))
         
         # Field lines
         num_lines = 5
         for i in range(num_lines):
             x = field_start_x + i * (field_width_pixels / (num_lines - 1))
-            pygame.draw.line(self.screen, WHITE, (x, ground_y), (x, ground_y + 100), 2)
+            pygame.draw.line(surface, WHITE, (x, ground_y), (x, ground_y + 100), 2)
         
         # Trees - fewer trees, more spaced out
         for x in range(0, int(field_start_x), 60):
-            self.draw_tree(x + 30, ground_y)
+            self.draw_tree(x + 30, ground_y, surface)
         for x in range(int(field_end_x), SCREEN_WIDTH, 60):
-            self.draw_tree(x + 30, ground_y)
+            self.draw_tree(x + 30, ground_y, surface)
     
-    def draw_tree(self, x, ground_y):
+    def draw_tree(self, x, ground_y, surface=None):
+        surface = surface or self.screen
         # Tree trunk
-        pygame.draw.rect(self.screen, BROWN, (x - 5, ground_y - 40, 10, 40))
+        pygame.draw.rect(surface, BROWN, (x - 5, ground_y - 40, 10, 40))
         # Tree foliage
-        pygame.draw.circle(self.screen, DARK_GREEN, (x, ground_y - 60), 20)
+        pygame.draw.circle(surface, DARK_GREEN, (x, ground_y - 60), 20)
     
     def draw_baseball(self, screen, x, y, size=5):
         # Draw baseball with white base and red stitching
@@ -605,6 +1028,15 @@ class VisualRocketGame:
                 pygame.draw.line(screen, YELLOW, (x, y), (spark_x, spark_y), 2)
     
     def draw_menu(self):
+        # The menu is static until a setting changes
+        signature = (self.selected_engine, self.wind_speed, self.wind_direction,
+                     self.sound_manager.sounds_enabled, self.sound_manager.music_enabled,
+                     self.sound_manager.volume)
+        if not self._full_redraw and signature == self._menu_signature:
+            return
+        self._menu_signature = signature
+        self.mark_dirty(self.screen.get_rect())
+        
         self.screen.fill(SKY_BLUE)
         
         # Title
@@ -628,6 +1060,13 @@ class VisualRocketGame:
             text = self.small_font.render(spec, True, BLACK)
             self.screen.blit(text, (70, 230 + i * 25))
         
+        # Predicted flight from the lookup table (no simulation needed)
+        apogee, _, landing = self.apogee_table.query(self.selected_engine, self.wind_speed, self.wind_direction)
+        prediction_color = GREEN if landing == "field" else RED
+        prediction_text = self.small_font.render(
+            f"Predicted Apogee: {apogee:.0f}m ({apogee*3.28:.0f}ft), Landing: {landing.upper()}", True, prediction_color)
+        self.screen.blit(prediction_text, (70, 305))
+        
         # Wind conditions
         wind_text = self.small_font.render(f"Wind: {self.wind_speed:.1f} m/s from {self.wind_direction:.0f}° (RANDOMIZED)", True, BLACK)
         self.screen.blit(wind_text, (50, 350))
@@ -659,6 +1098,13 @@ class VisualRocketGame:
         volume_text = self.small_font.render(f"Volume: {int(self.sound_manager.volume * 100)}% (Press -/+ to adjust)", True, BLACK)
         self.screen.blit(volume_text, (50, 675))
         
+        music_status = "ON" if self.sound_manager.music_enabled else "OFF"
+        music_text = self.small_font.render(f"Music: {music_status} (Press M to toggle)", True, BLACK)
+        self.screen.blit(music_text, (50, 700))
+        
+        replay_text = self.small_font.render("Press P to replay recorded flights", True, BLACK)
+        self.screen.blit(replay_text, (50, 725))
+        
         # Draw preview rocket
         preview_rocket = RocketSprite(SCREEN_WIDTH//2, 600)
         preview_rocket.scale = 2.0
@@ -685,98 +1131,59 @@ class VisualRocketGame:
                 countdown_text = str(seconds_left)
                 color = RED if seconds_left <= 3 else BLACK
                 # Large countdown display
-                big_font = pygame.font.Font(None, 120)
-                text = big_font.render(countdown_text, True, color)
+                text = self.text.render(countdown_text, 120, color)
                 text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-                self.screen.blit(text, text_rect)
+                self.mark_dirty(self.screen.blit(text, text_rect))
             else:
                 # BLAST OFF! with fun effects
-                countdown_text = "BLAST OFF!!!"
-                
-                # Pulsing and scaling effect (keep font size reasonable)
-                pulse = 1.0 + 0.2 * math.sin(pygame.time.get_ticks() * 0.02)
-                font_size = int(100 * pulse)  # Smaller base size
-                big_font = pygame.font.Font(None, font_size)
-                
-                # Rainbow color cycling
-                time_factor = pygame.time.get_ticks() * 0.01
-                r = int(128 + 127 * math.sin(time_factor))
-                g = int(128 + 127 * math.sin(time_factor + 2))
-                b = int(128 + 127 * math.sin(time_factor + 4))
-                color = (r, g, b)
-                
-                # Simple centered text without complex glow effects
-                text = big_font.render(countdown_text, True, color)
-                text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-                
-                # Simple outline effect
-                outline_color = (255, 255, 255)  # White outline
-                for dx in [-2, -1, 0, 1, 2]:
-                    for dy in [-2, -1, 0, 1, 2]:
-                        if dx != 0 or dy != 0:
-                            outline_text = big_font.render(countdown_text, True, outline_color)
-                            outline_rect = outline_text.get_rect(center=(SCREEN_WIDTH//2 + dx, SCREEN_HEIGHT//2 + dy))
-                            self.screen.blit(outline_text, outline_rect)
-                
-                # Main text on top
-                self.screen.blit(text, text_rect)
+                self.draw_blast_off_text()
             
             # Draw rocket at launch position
             if self.rocket_sprite:
                 self.rocket_sprite.x = SCREEN_WIDTH // 2
                 self.rocket_sprite.y = SCREEN_HEIGHT - 100
-                self.rocket_sprite.draw_rocket(self.screen)
+                self.mark_dirty(self.rocket_sprite.draw_rocket(self.screen))
         elif elapsed < self.countdown_duration + self.blast_off_duration:
             # Show BLAST OFF!!! for 2 seconds after countdown
-            countdown_text = "BLAST OFF!!!"
-            
-            # Pulsing and scaling effect (keep font size reasonable)
-            pulse = 1.0 + 0.2 * math.sin(pygame.time.get_ticks() * 0.02)
-            font_size = int(100 * pulse)  # Smaller base size
-            big_font = pygame.font.Font(None, font_size)
-            
-            # Rainbow color cycling
-            time_factor = pygame.time.get_ticks() * 0.01
-            r = int(128 + 127 * math.sin(time_factor))
-            g = int(128 + 127 * math.sin(time_factor + 2))
-            b = int(128 + 127 * math.sin(time_factor + 4))
-            color = (r, g, b)
-            
-            # Simple centered text without complex glow effects
-            text = big_font.render(countdown_text, True, color)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-            
-            # Simple outline effect
-            outline_color = (255, 255, 255)  # White outline
-            for dx in [-2, -1, 0, 1, 2]:
-                for dy in [-2, -1, 0, 1, 2]:
-                    if dx != 0 or dy != 0:
-                        outline_text = big_font.render(countdown_text, True, outline_color)
-                        outline_rect = outline_text.get_rect(center=(SCREEN_WIDTH//2 + dx, SCREEN_HEIGHT//2 + dy))
-                        self.screen.blit(outline_text, outline_rect)
-            
-            # Main text on top
-            self.screen.blit(text, text_rect)
+            self.draw_blast_off_text()
             
             # Draw rocket at launch position
             if self.rocket_sprite:
                 self.rocket_sprite.x = SCREEN_WIDTH // 2
                 self.rocket_sprite.y = SCREEN_HEIGHT - 100
-                self.rocket_sprite.draw_rocket(self.screen)
+                self.mark_dirty(self.rocket_sprite.draw_rocket(self.screen))
         else:
             # BLAST OFF finished, start flight
             self.state = "flying"
+            self.sound_manager.prefetch_music("time_travel")
             # Play rocket launch sound when flight begins
             if not getattr(self, '_launch_sound_played', False):
                 self.sound_manager.play_sound('rocket_launch')
                 self._launch_sound_played = True
     
-    def draw_flight(self):
+    def draw_blast_off_text(self):
+        # Pulsing and scaling effect (keep font size reasonable)
+        pulse = 1.0 + 0.2 * math.sin(pygame.time.get_ticks() * 0.02)
+        font_size = int(100 * pulse)  # Smaller base size
+        
+        # Rainbow color cycling
+        time_factor = pygame.time.get_ticks() * 0.01
+        r = int(128 + 127 * math.sin(time_factor))
+        g = int(128 + 127 * math.sin(time_factor + 2))
+        b = int(128 + 127 * math.sin(time_factor + 4))
+        color = (r, g, b)
+        
+        # Centered text over a white outline composited once per size
+        text = self.text.render_outlined("BLAST OFF!!!", font_size, color, WHITE)
+        text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
+        self.mark_dirty(self.screen.blit(text, text_rect))
+    
+    def draw_flight(self, frame_time=1.0 / FPS):
         self.draw_background()
         
         # Get current rocket position from simulation
         if self.simulation and len(self.simulation.position_history) > 0:
-            current_pos = self.simulation.position_history[-1]
+            current_pos = self.interpolated_position()
             
             # Separate scale factors for horizontal and vertical
             ground_level = SCREEN_HEIGHT - 100
@@ -787,11 +1194,9 @@ class VisualRocketGame:
             
             # Check landing status first to determine proper visual height
             if self.simulation:
-                landing_zone = self.simulation.check_landing_location()
-                
                 # If rocket has landed, use fixed visual positions
                 if self.show_landing_marker:
-                    if landing_zone == "trees":
+                    if self.landing_zone == "trees":
                         # Rocket is stuck in trees - show at tree height
                         screen_y = ground_level - 60  # Tree height visual position
                     else:
@@ -825,29 +1230,28 @@ class VisualRocketGame:
                     self.rocket_sprite.parachute_deployed = True
                 
                 self.rocket_sprite.update_particles()
-                self.rocket_sprite.draw_particles(self.screen)
-                self.rocket_sprite.draw_rocket(self.screen)
-                self.rocket_sprite.draw_parachute(self.screen)
-            
-            # Simple trajectory trail (only add points if rocket is still moving)
-            if (len(self.simulation.velocity_history) == 0 or 
-                np.linalg.norm(self.simulation.velocity_history[-1]) > 0.1):  # Only if moving
-                self.trajectory_points.append((screen_x, screen_y))
-                if len(self.trajectory_points) > 100:
-                    self.trajectory_points.pop(0)
+                self.mark_dirty(self.rocket_sprite.draw_particles(self.screen))
+                self.mark_dirty(self.rocket_sprite.draw_rocket(self.screen))
+                self.mark_dirty(self.rocket_sprite.draw_parachute(self.screen))
+            
+            # Trajectory trail (only add points if rocket is still moving)
+            self.trail.fade(frame_time)
+            if len(self.simulation.velocity_history) == 0:
+                self.trail.add((screen_x, screen_y))
+            else:
+                vx, vy = self.simulation.velocity_history[-1]
+                if vx * vx + vy * vy > 0.01:  # Only if moving faster than 0.1 m/s
+                    self.trail.add((screen_x, screen_y))
             
             # Draw trajectory trail
-            if len(self.trajectory_points) > 1:
-                pygame.draw.lines(self.screen, YELLOW, False, self.trajectory_points, 2)
+            self.mark_dirty(self.trail.draw(self.screen))
         
         # Draw landing marker if rocket has landed
         if self.show_landing_marker and self.landing_position is not None:
             landing_screen_x = SCREEN_WIDTH // 2 + (self.landing_position[0] - 54.85) * self.scale_factor
             
             # Check if landing is in trees or field
-            field_start = 0
-            field_end = 109.7
-            is_in_field = field_start <= self.landing_position[0] <= field_end
+            is_in_field = self.landing_zone == "field"
             
             if is_in_field:
                 # Landing marker at ground level for field landing
@@ -858,8 +1262,8 @@ class VisualRocketGame:
             
             # Pulsing landing marker
             pulse = int(20 * (1 + math.sin(pygame.time.get_ticks() * 0.01)))
-            pygame.draw.circle(self.screen, RED, (int(landing_screen_x), int(landing_screen_y)), 15 + pulse, 3)
-            pygame.draw.circle(self.screen, WHITE, (int(landing_screen_x), int(landing_screen_y)), 5)
+            self.mark_dirty(pygame.draw.circle(self.screen, RED, (int(landing_screen_x), int(landing_screen_y)), 15 + pulse, 3))
+            self.mark_dirty(pygame.draw.circle(self.screen, WHITE, (int(landing_screen_x), int(landing_screen_y)), 5))
             
             # Landing text positioning
             if is_in_field:
@@ -869,9 +1273,9 @@ class VisualRocketGame:
                 landing_text = "STUCK IN TREES!"
                 text_color = RED
             
-            rendered_text = self.small_font.render(landing_text, True, text_color)
+            rendered_text = self.text.render(landing_text, 24, text_color)
             text_rect = rendered_text.get_rect(center=(int(landing_screen_x), int(landing_screen_y - 40)))
-            self.screen.blit(rendered_text, text_rect)
+            self.mark_dirty(self.screen.blit(rendered_text, text_rect))
             
             # Don't draw separate landed rocket - main rocket sprite handles landing
         
@@ -890,7 +1294,7 @@ class VisualRocketGame:
         if self.simulation and len(self.simulation.position_history) > 0:
             current_pos = self.simulation.position_history[-1]
             current_vel = self.simulation.velocity_history[-1] if len(self.simulation.velocity_history) > 0 else np.array([0, 0])
-            speed = np.linalg.norm(current_vel)
+            speed = math.hypot(current_vel[0], current_vel[1])
             
             info_texts.extend([
                 f"Altitude: {current_pos[1]:.0f}m ({current_pos[1]*3.28:.0f}ft)",
@@ -916,29 +1320,41 @@ class VisualRocketGame:
                 phase = "🪂 PARACHUTE DESCENT"
                 phase_color = GREEN
             
-            phase_text = self.small_font.render(phase, True, phase_color)
-            self.screen.blit(phase_text, (SCREEN_WIDTH - 250, 10))
+            phase_text = self.text.render(phase, 24, phase_color)
+            self.mark_dirty(self.screen.blit(phase_text, (SCREEN_WIDTH - 250, 10)))
         
         for i, text in enumerate(info_texts):
-            rendered = self.small_font.render(text, True, BLACK)
-            self.screen.blit(rendered, (10, 10 + i * 25))
+            rendered = self.text.render(text, 24, BLACK)
+            self.mark_dirty(self.screen.blit(rendered, (10, 10 + i * 25)))
+    
+    def get_baseball_scene(self):
+        """Sky, ground, tree and stuck rocket, rebuilt only when the rocket's tree changes"""
+        key = (self.rocket_tree_x, self.rocket_tree_height, self.screen.get_size())
+        if self._baseball_scene_key != key:
+            surface = pygame.Surface(self.screen.get_size()).convert()
+            surface.fill(SKY_BLUE)
+            
+            # Ground and trees
+            ground_y = SCREEN_HEIGHT - 100
+            pygame.draw.rect(surface, GREEN, (0, ground_y, SCREEN_WIDTH, 100))
+            
+            # Draw trees with stuck rocket
+            tree_x = SCREEN_WIDTH // 2 + self.rocket_tree_x
+            self.draw_tree(tree_x, ground_y, surface)
+            
+            # Draw stuck rocket in tree at proper height
+            rocket_screen_height = ground_y - self.rocket_tree_height * 13  # Convert meters to pixels (increased multiplier for better visibility)
+            stuck_rocket = RocketSprite(tree_x + 10, rocket_screen_height)
+            stuck_rocket.scale = 0.8
+            stuck_rocket.draw_rocket(surface)
+            
+            self._baseball_scene = surface
+            self._baseball_scene_key = key
+        return self._baseball_scene
     
     def draw_baseball_game(self):
-        self.screen.fill(SKY_BLUE)
-        
-        # Ground and trees
+        self.screen.blit(self.get_baseball_scene(), (0, 0))
         ground_y = SCREEN_HEIGHT - 100
-        pygame.draw.rect(self.screen, GREEN, (0, ground_y, SCREEN_WIDTH, 100))
-        
-        # Draw trees with stuck rocket
-        tree_x = SCREEN_WIDTH // 2 + self.rocket_tree_x
-        self.draw_tree(tree_x, ground_y)
-        
-        # Draw stuck rocket in tree at proper height
-        rocket_screen_height = ground_y - self.rocket_tree_height * 13  # Convert meters to pixels (increased multiplier for better visibility)
-        stuck_rocket = RocketSprite(tree_x + 10, rocket_screen_height)
-        stuck_rocket.scale = 0.8
-        stuck_rocket.draw_rocket(self.screen)
         
         # Player position (stick figure) - now moveable
         player_x = self.baseball_player_x
@@ -957,7 +1373,7 @@ class VisualRocketGame:
         pygame.draw.line(self.screen, RED, (player_x, player_y), (end_x, end_y), 3)
         
         # UI
-        title = self.font.render("ROCKET RECOVERY - BASEBALL THROW", True, BLACK)
+        title = self.text.render("ROCKET RECOVERY - BASEBALL THROW", 36, BLACK)
         self.screen.blit(title, (50, 50))
         
         info_texts = [
@@ -969,34 +1385,24 @@ class VisualRocketGame:
         ]
         
         for i, text in enumerate(info_texts):
-            rendered = self.small_font.render(text, True, BLACK)
+            rendered = self.text.render(text, 24, BLACK)
             self.screen.blit(rendered, (50, 100 + i * 30))
         
         # Distance indicator - calculate from player position to tree
         tree_screen_x = SCREEN_WIDTH // 2 + self.rocket_tree_x
         distance_pixels = abs(tree_screen_x - self.baseball_player_x)
         distance_meters = distance_pixels / 10  # Rough conversion to meters for display
-        dist_text = self.small_font.render(f"Distance to rocket: {distance_meters:.0f}m", True, RED)
+        dist_text = self.text.render(f"Distance to rocket: {distance_meters:.0f}m", 24, RED)
         self.screen.blit(dist_text, (50, 250))
     
     def draw_time_travel_game(self):
         # Background based on era
         if self.time_era == "past":
             # Prehistoric background - dark green/brown
-            for y in range(SCREEN_HEIGHT):
-                color_ratio = y / SCREEN_HEIGHT
-                r = int(50 * (1 - color_ratio) + 100 * color_ratio)
-                g = int(100 * (1 - color_ratio) + 150 * color_ratio)
-                b = int(0 * (1 - color_ratio) + 50 * color_ratio)
-                pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+            self.screen.blit(self.get_gradient((50, 100, 0), (100, 150, 50)), (0, 0))
         elif self.time_era == "future":
             # Futuristic background - dark blue/purple
-            for y in range(SCREEN_HEIGHT):
-                color_ratio = y / SCREEN_HEIGHT
-                r = int(20 * (1 - color_ratio) + 80 * color_ratio)
-                g = int(20 * (1 - color_ratio) + 50 * color_ratio)
-                b = int(80 * (1 - color_ratio) + 150 * color_ratio)
-                pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+            self.screen.blit(self.get_gradient((20, 20, 80), (80, 50, 150)), (0, 0))
         else:
             # Present day - normal sky
             self.screen.fill(SKY_BLUE)
@@ -1119,9 +1525,7 @@ class VisualRocketGame:
                 # YOU WIN text with pulsing effect
                 pulse = 1.0 + 0.3 * math.sin(pygame.time.get_ticks() * 0.01)
                 font_size = int(120 * pulse)
-                big_font = pygame.font.Font(None, font_size)
-                
-                win_text = big_font.render("YOU WIN!!!", True, GOLD)
+                win_text = self.text.render("YOU WIN!!!", font_size, GOLD)
                 win_rect = win_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
                 self.screen.blit(win_text, win_rect)
                 
@@ -1143,7 +1547,6 @@ class VisualRocketGame:
             # Game over text with pulsing effect
             pulse = 1.0 + 0.3 * math.sin(pygame.time.get_ticks() * 0.01)
             font_size = int(80 * pulse)
-            big_font = pygame.font.Font(None, font_size)
             
             # Determine cause of death
             if self.time_era == "past":
@@ -1153,7 +1556,7 @@ class VisualRocketGame:
                 death_cause = "DESTROYED BY ROBOT!"
                 death_color = BLUE
             
-            game_over_text = big_font.render("GAME OVER", True, RED)
+            game_over_text = self.text.render("GAME OVER", font_size, RED)
             cause_text = self.font.render(death_cause, True, death_color)
             restart_text = self.small_font.render("Press SPACEBAR to start over at rocket launch", True, WHITE)
             
@@ -1166,167 +1569,240 @@ class VisualRocketGame:
             self.screen.blit(cause_text, cause_rect)
             self.screen.blit(restart_text, restart_rect)
     
-    def animate_baseball_throw(self):
+    def stuck_rocket_position(self):
+        """Screen position the thrown baseball has to reach to hit the rocket"""
+        rocket_x = SCREEN_WIDTH // 2 + self.rocket_tree_x
+        rocket_y = SCREEN_HEIGHT - 100 - self.rocket_tree_height * 13  # Match the visual height
+        return rocket_x, rocket_y
+    
+    def baseball_position(self):
+        """Screen position of the thrown baseball, or None once it has landed"""
+        t = (pygame.time.get_ticks() - self.throw_start_time) / 2000.0
+        if t > 1.0:
+            return None
+        player_x = self.baseball_player_x
+        player_y = SCREEN_HEIGHT - 120
+        
+        # Calculate trajectory
+        angle_rad = math.radians(self.baseball_angle)
+        initial_v = self.baseball_power * 30
+        vx = initial_v * math.cos(angle_rad)
+        vy = initial_v * math.sin(angle_rad)
+        
+        x = player_x + vx * t * 100
+        y = player_y - (vy * t * 100 - 0.5 * 980 * t * t)
+        if y >= SCREEN_HEIGHT:
+            return None
+        return x, y
+    
+    def update_throw(self):
+        """Check the baseball for a hit, and leave the throwing state when it is over"""
+        ball = self.baseball_position()
+        if ball is not None and not self.throw_hit:
+            rocket_x, rocket_y = self.stuck_rocket_position()
+            distance = math.sqrt((ball[0] - rocket_x)**2 + (ball[1] - rocket_y)**2)
+            if distance < 20:
+                self.throw_hit = True
+                self.throw_hit_time = pygame.time.get_ticks()
+                self.sound_manager.play_sound('baseball_hit')
+        
+        if pygame.time.get_ticks() - self.throw_start_time >= self.throw_duration:
+            if self.throw_hit:
+                # Show the rocket falling out of the tree
+                self.state = "rocket_falling"
+                self.fall_start_time = pygame.time.get_ticks()
+            elif self.baseball_attempts >= self.max_attempts:
+                self.state = "results"
+            else:
+                self.state = "recovery"
+    
+    def draw_throw(self):
         # Baseball trajectory animation with hit effects
-        start_time = pygame.time.get_ticks()
-        hit_occurred = False
-        hit_time = 0
-        
-        while pygame.time.get_ticks() - start_time < 2500:  # 2.5 second animation
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return False
-            
-            self.draw_baseball_game()
-            
-            # Animate baseball
-            t = (pygame.time.get_ticks() - start_time) / 2000.0
-            if t <= 1.0:
-                player_x = self.baseball_player_x
-                player_y = SCREEN_HEIGHT - 120
+        self.draw_baseball_game()
+        
+        ball = self.baseball_position()
+        if ball is not None:
+            # Draw baseball with stitching
+            self.draw_baseball(self.screen, ball[0], ball[1], 5)
+        
+        # Show hit effects
+        if self.throw_hit:
+            time_since_hit = pygame.time.get_ticks() - self.throw_hit_time
+            if time_since_hit < 500:  # Show effect for 0.5 seconds
+                rocket_x, rocket_y = self.stuck_rocket_position()
+                # Draw impact burst
+                burst_size = int(time_since_hit / 10)
+                for i in range(8):
+                    angle = i * math.pi / 4
+                    end_x = rocket_x + math.cos(angle) * burst_size
+                    end_y = rocket_y + math.sin(angle) * burst_size
+                    pygame.draw.line(self.screen, YELLOW, (rocket_x, rocket_y), (end_x, end_y), 3)
                 
-                # Calculate trajectory
-                angle_rad = math.radians(self.baseball_angle)
-                initial_v = self.baseball_power * 30
-                vx = initial_v * math.cos(angle_rad)
-                vy = initial_v * math.sin(angle_rad)
-                
-                x = player_x + vx * t * 100
-                y = player_y - (vy * t * 100 - 0.5 * 980 * t * t)
-                
-                if y < SCREEN_HEIGHT:
-                    # Draw baseball with stitching
-                    self.draw_baseball(self.screen, x, y, 5)
-                    
-                    # Check for hit near rocket position
-                    rocket_x = SCREEN_WIDTH // 2 + self.rocket_tree_x
-                    rocket_y = SCREEN_HEIGHT - 100 - self.rocket_tree_height * 13  # Match the visual height
-                    
-                    distance = math.sqrt((x - rocket_x)**2 + (y - rocket_y)**2)
-                    if distance < 20 and not hit_occurred:
-                        hit_occurred = True
-                        hit_time = pygame.time.get_ticks()
-                        self.sound_manager.play_sound('baseball_hit')
-            
-            # Show hit effects
-            if hit_occurred:
-                time_since_hit = pygame.time.get_ticks() - hit_time
-                if time_since_hit < 500:  # Show effect for 0.5 seconds
-                    # Flash effect
-                    flash_alpha = 255 - (time_since_hit / 500) * 255
-                    # Draw impact burst
-                    burst_size = int(time_since_hit / 10)
-                    for i in range(8):
-                        angle = i * math.pi / 4
-                        end_x = rocket_x + math.cos(angle) * burst_size
-                        end_y = rocket_y + math.sin(angle) * burst_size
-                        pygame.draw.line(self.screen, YELLOW, (rocket_x, rocket_y), (end_x, end_y), 3)
-                    
-                    # Hit text
-                    hit_text = self.font.render("HIT!", True, RED)
-                    self.screen.blit(hit_text, (rocket_x - 20, rocket_y - 50))
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
-        
-        return hit_occurred
+                # Hit text
+                hit_text = self.text.render("HIT!", 36, RED)
+                self.screen.blit(hit_text, (rocket_x - 20, rocket_y - 50))
     
     def start_flight(self):
         self.state = "countdown"
         self.countdown_start_time = pygame.time.get_ticks()
-        self.simulation = RocketSimulation(self.selected_engine, self.wind_speed, self.wind_direction)
+        # The parachute is deployed by the player (SPACE), never automatically
+        self.simulation = RocketSimulation(self.selected_engine, self.wind_speed, self.wind_direction,
+                                           history_limit=HISTORY_LIMIT, auto_parachute=False)
+        self.simulation.start_recording()
+        self.simulation.reset()
         self.rocket_sprite = RocketSprite(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
         self.sim_time = 0
-        self.trajectory_points = []
+        self.physics_accumulator = 0.0
+        self.physics_alpha = 0.0
+        self.trail.clear()
         
         # Reset sound flags
         self._launch_sound_played = False
         self._prev_countdown_second = 0
         
+        # Generate the flight music while the countdown runs
+        self.sound_manager.prefetch_music("flight")
+        
         # Reset manual parachute control
         self.manual_parachute_triggered = False
         
         # Reset landing variables
         self.landing_position = None
+        self.landing_zone = None  # "field" or "trees", classified once at landing
         self.landing_time = 0
         self.show_landing_marker = False
+    
+    def save_flight_recording(self):
+        """Append the flight that just landed to the recordings file"""
+        if self.recordings_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.recordings_path)), exist_ok=True)
+            self.simulation.save_recording(self.recordings_path)
+            trim_recordings(self.recordings_path, self.max_recordings, slack=self.max_recordings // 4)
+        except OSError:
+            pass  # Recording is optional; the flight goes on
+    
+    def start_replay(self):
+        """Open the recordings file and replay its newest flight"""
+        if self.recordings_path is None or not os.path.exists(self.recordings_path):
+            return
+        try:
+            self.recordings = FlightArchive(self.recordings_path)
+        except (OSError, ValueError):
+            return
+        if len(self.recordings) == 0:
+            return
+        self.load_replay(len(self.recordings) - 1)
+        self.state = "replay"
+        self.sound_manager.play_sound('menu_click')
+    
+    def load_replay(self, index):
+        """Show recording `index` of the archive from its launch"""
+        self.replay_index = index
+        self.replay = self.recordings[index]
+        self.replay_time = 0.0
+        self.replay_paused = False
+        
+        # The whole path is mapped to the screen once, with the flight view's scales
+        records = self.replay.records
+        x = SCREEN_WIDTH // 2 + (records["x"].astype(float) - 54.85) * self.scale_factor
+        y = self.flight_screen_y(records["y"].astype(float))
+        self._replay_path = list(zip(x.tolist(), y.tolist()))
+    
+    def flight_screen_y(self, altitude):
+        """Screen y for an altitude (scalar or array) in the flight view
+        
+        Altitudes that would leave the top of the screen are drawn with a
+        smaller vertical scale, as in draw_flight.
+        """
+        ground_level = SCREEN_HEIGHT - 100
+        screen_y = ground_level - altitude * 0.8
+        return np.where(screen_y < 50, ground_level - altitude * 0.3, screen_y)
+    
+    def update_replay(self, frame_time):
+        """Advance the replay clock at the same pace as a live flight"""
+        if not self.replay_paused:
+            self.replay_time = min(self.replay.duration, self.replay_time + frame_time * self.time_scale)
+    
+    def draw_replay(self):
+        self.draw_background()
+        replay = self.replay
+        x, y, vx, vy = replay.state_at(self.replay_time)
+        screen_x = SCREEN_WIDTH // 2 + (x - 54.85) * self.scale_factor
+        screen_y = float(self.flight_screen_y(y))
+        
+        # Path flown so far
+        flown = int(np.searchsorted(replay.times, self.replay_time, side="right"))
+        points = self._replay_path[:flown] + [(screen_x, screen_y)]
+        if len(points) > 1:
+            pygame.draw.lines(self.screen, YELLOW, False, points, 2)
+        
+        rocket = RocketSprite(screen_x, screen_y)
+        rocket.parachute_deployed = replay.parachute_deployed(self.replay_time)
+        rocket.draw_rocket(self.screen)
+        rocket.draw_parachute(self.screen)
         
-        # Start simulation
-        self.simulation.rocket.position = np.array([54.85, 0.0])  # Center of field
-        self.simulation.rocket.velocity = np.array([0.0, 0.0])
-        self.simulation.rocket.mass = self.simulation.rocket.dry_mass + 0.012
+        # Flight info
+        info_texts = [
+            f"REPLAY {self.replay_index + 1}/{len(self.recordings)}" + ("  (PAUSED)" if self.replay_paused else ""),
+            f"Engine: {replay.engine}   Wind: {replay.wind_speed:.1f} m/s from {replay.wind_direction:.0f}°",
+            f"Time: {self.replay_time:.1f}/{replay.duration:.1f}s",
+            f"Altitude: {y:.0f}m ({y*3.28:.0f}ft)   Max: {replay.max_altitude:.0f}m",
+            f"Speed: {math.hypot(vx, vy):.1f} m/s",
+        ]
+        for i, text in enumerate(info_texts):
+            self.screen.blit(self.text.render(text, 24, BLACK), (20, 20 + i * 25))
+        
+        # Scrub bar
+        bar = pygame.Rect(50, SCREEN_HEIGHT - 40, SCREEN_WIDTH - 100, 12)
+        pygame.draw.rect(self.screen, WHITE, bar)
+        if replay.duration > 0:
+            filled = bar.copy()
+            filled.width = int(bar.width * self.replay_time / replay.duration)
+            pygame.draw.rect(self.screen, RED, filled)
+        pygame.draw.rect(self.screen, BLACK, bar, 1)
+        help_text = self.text.render("SPACE: pause   LEFT/RIGHT: scrub 1s   HOME: restart   UP/DOWN: other flights   ESC: menu", 24, BLACK)
+        self.screen.blit(help_text, help_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)))
+    
+    def advance_physics(self, frame_time):
+        """Run as many fixed physics steps as `frame_time` real seconds call for"""
+        self.physics_accumulator += frame_time * self.time_scale
+        steps = 0
+        while self.physics_accumulator >= self.time_step and self.state == "flying":
+            if steps == MAX_PHYSICS_STEPS:
+                # Too far behind (slow machine or a stall): drop the backlog
+                self.physics_accumulator = 0.0
+                break
+            self.update_simulation()
+            self.physics_accumulator -= self.time_step
+            steps += 1
+        self.physics_alpha = min(self.physics_accumulator / self.time_step, 1.0)
+    
+    def interpolated_position(self):
+        """Rocket position blended between the last two physics states for drawing"""
+        positions = self.simulation.position_history
+        if len(positions) < 2:
+            return positions[-1]
+        return positions[-2] + (positions[-1] - positions[-2]) * self.physics_alpha
     
     def update_simulation(self):
         if self.simulation and self.state == "flying":
             # Run one physics step
-            time = self.sim_time
+            self.simulation.step(self.time_step)
+            self.sim_time = self.simulation.time
             
-            # Parachute deployment is now manual only (handled in event handler)
-            # No automatic deployment - player must press spacebar
-            
-            # Calculate forces
-            thrust = self.simulation.thrust_force(time)
-            drag = self.simulation.drag_force(self.simulation.rocket.velocity)
-            gravity = np.array([0.0, -self.simulation.rocket.mass * self.simulation.g])
-            
-            # Add wind force throughout flight (horizontal only)
-            wind_force = np.array([0.0, 0.0])
-            if time <= self.simulation.engine.burn_time:
-                # Light wind during powered flight
-                wind_force = np.array([self.simulation.wind_vector[0] * 0.02, 0.0])
-            elif self.simulation.rocket.parachute_deployed:
-                # Stronger wind force during parachute descent
-                wind_force = np.array([self.simulation.wind_vector[0] * 0.05, 0.0])
-            else:
-                # Medium wind force during unpowered flight (no parachute)
-                wind_force = np.array([self.simulation.wind_vector[0] * 0.03, 0.0])
-            
-            # Safety check for mass
-            if self.simulation.rocket.mass <= 0:
-                self.simulation.rocket.mass = self.simulation.rocket.dry_mass
-            
-            # Total force and acceleration
-            total_force = thrust + drag + gravity + wind_force
-            acceleration = total_force / self.simulation.rocket.mass
-            
-            # Burn propellant during engine burn
-            if time <= self.simulation.engine.burn_time:
-                # Reduce mass as propellant burns (simple linear model)
-                propellant_used = (time / self.simulation.engine.burn_time) * 0.012
-                self.simulation.rocket.mass = self.simulation.rocket.dry_mass + 0.012 - propellant_used
-            
-            # Update velocity and position
-            self.simulation.rocket.velocity += acceleration * self.time_step
-            self.simulation.rocket.position += self.simulation.rocket.velocity * self.time_step
-            
-            # Record history
-            self.simulation.time_history.append(time)
-            self.simulation.position_history.append(self.simulation.rocket.position.copy())
-            self.simulation.velocity_history.append(self.simulation.rocket.velocity.copy())
-            
-            # Check for landing (ground or tree height)
-            landing = self.simulation.check_landing_location()
-            tree_height = 6.0  # meters above ground
-            
-            # Determine landing altitude based on location
-            if landing == "trees":
-                landing_altitude = tree_height
-            else:
-                landing_altitude = 0.0
-            
-            if self.simulation.rocket.position[1] <= landing_altitude:
-                # Stop rocket at appropriate height
-                self.simulation.rocket.position[1] = landing_altitude
-                self.simulation.rocket.velocity = np.array([0.0, 0.0])  # Stop all movement (horizontal and vertical)
-                
+            if self.simulation.landed:
                 # Record landing position and show marker (only once)
                 if not self.show_landing_marker:
                     self.landing_position = self.simulation.rocket.position.copy()
+                    self.landing_zone = self.simulation.check_landing_location()
                     self.landing_time = self.sim_time
                     self.show_landing_marker = True
+                    self.save_flight_recording()
                 
                 # Continue simulation for a few seconds to show landing
-                if landing == "trees":
+                if self.landing_zone == "trees":
                     # Wait 2 seconds to show tree landing, then go to recovery
                     if self.sim_time - self.landing_time > 2.0:
                         self.state = "recovery"
@@ -1336,10 +1812,9 @@ class VisualRocketGame:
                         max_tree_offset = (SCREEN_WIDTH // 2) - 200
                         min_tree_offset = -(SCREEN_WIDTH // 2) + 200
                         self.rocket_tree_x = max(min_tree_offset, min(max_tree_offset, raw_tree_x))
-                        self.rocket_tree_height = tree_height
+                        self.rocket_tree_height = self.simulation.rocket.position[1]  # Height it caught at
                         self.baseball_attempts = 0
                         self.baseball_player_x = 100  # Reset player position for baseball game
-                        return  # Stop simulation updates
                 else:
                     # Wait 3 seconds to show successful field landing
                     if self.sim_time - self.landing_time > 3.0:
@@ -1347,9 +1822,6 @@ class VisualRocketGame:
                         self.time_era = "present"
                         self.collected_crystals = 0
                         self.collected_energy = 0
-                        return  # Stop simulation updates
-            
-            self.sim_time += self.time_step
     
     def handle_events(self):
         for event in pygame.event.get():
@@ -1385,15 +1857,36 @@ class VisualRocketGame:
                     elif event.key == pygame.K_s:
                         # Toggle sound effects
                         self.sound_manager.toggle_sounds()
+                    elif event.key == pygame.K_m:
+                        # Toggle background music
+                        self.sound_manager.toggle_music()
                     elif event.key == pygame.K_MINUS or event.key == pygame.K_KP_MINUS:
                         # Decrease volume
                         self.sound_manager.set_volume(self.sound_manager.volume - 0.1)
                     elif event.key == pygame.K_PLUS or event.key == pygame.K_KP_PLUS or event.key == pygame.K_EQUALS:
                         # Increase volume
                         self.sound_manager.set_volume(self.sound_manager.volume + 0.1)
+                    elif event.key == pygame.K_p:
+                        self.start_replay()
                     elif event.key == pygame.K_ESCAPE or event.key == pygame.K_q:
                         return False  # Quit game
                 
+                elif self.state == "replay":
+                    if event.key == pygame.K_SPACE:
+                        self.replay_paused = not self.replay_paused
+                    elif event.key == pygame.K_LEFT:
+                        self.replay_time = max(0.0, self.replay_time - 1.0)
+                    elif event.key == pygame.K_RIGHT:
+                        self.replay_time = min(self.replay.duration, self.replay_time + 1.0)
+                    elif event.key == pygame.K_HOME:
+                        self.replay_time = 0.0
+                    elif event.key == pygame.K_UP:
+                        self.load_replay((self.replay_index - 1) % len(self.recordings))
+                    elif event.key == pygame.K_DOWN:
+                        self.load_replay((self.replay_index + 1) % len(self.recordings))
+                    elif event.key == pygame.K_ESCAPE:
+                        self.state = "menu"
+                
                 elif self.state == "flying":
                     if event.key == pygame.K_SPACE:
                         # Manual parachute deployment
@@ -1401,8 +1894,7 @@ class VisualRocketGame:
                             not self.simulation.rocket.parachute_deployed and
                             self.sim_time > self.simulation.engine.burn_time):  # Only after engine burn
                             self.manual_parachute_triggered = True
-                            self.simulation.rocket.parachute_deployed = True
-                            self.simulation.rocket.flight_phase = "descent"
+                            self.simulation.deploy_parachute()
                             self.sound_manager.play_sound('parachute_deploy')
                 
                 elif self.state == "recovery":
@@ -1490,20 +1982,11 @@ class VisualRocketGame:
         return True
     
     def throw_baseball(self):
+        """Start a throw; the throwing state animates it and checks for a hit"""
         self.baseball_attempts += 1
-        
-        # Run animation and get whether hit occurred
-        hit_occurred = self.animate_baseball_throw()
-        
-        # If hit occurred during animation, show rocket falling
-        if hit_occurred:
-            self.animate_rocket_falling()
-            self.state = "time_travel"  # Go to time travel after successful recovery
-            self.time_era = "present"
-            self.collected_crystals = 0
-            self.collected_energy = 0
-        elif self.baseball_attempts >= self.max_attempts:
-            self.state = "results"
+        self.state = "throwing"
+        self.throw_start_time = pygame.time.get_ticks()
+        self.throw_hit = False
     
     def update_time_travel(self):
         # Skip updates if game over
@@ -1700,10 +2183,11 @@ class VisualRocketGame:
         self.rocket_sprite = None
         self.simulation = None
         self.sim_time = 0
-        self.trajectory_points = []
+        self.trail.clear()
         
         # Reset landing variables
         self.landing_position = None
+        self.landing_zone = None  # "field" or "trees", classified once at landing
         self.landing_time = 0
         self.show_landing_marker = False
         
@@ -1748,79 +2232,113 @@ class VisualRocketGame:
         self.wind_speed = random.uniform(0.5, 8.0)
         self.wind_direction = random.randint(0, 23) * 15
     
-    def animate_rocket_falling(self):
+    def update_rocket_falling(self):
+        """Go on to time travel once the rocket has fallen out of the tree"""
+        if pygame.time.get_ticks() - self.fall_start_time >= self.fall_duration:
+            self.state = "time_travel"  # Go to time travel after successful recovery
+            self.time_era = "present"
+            self.collected_crystals = 0
+            self.collected_energy = 0
+    
+    def draw_rocket_falling(self):
         """Show rocket falling from tree after being hit"""
-        start_time = pygame.time.get_ticks()
         ground_y = SCREEN_HEIGHT - 100
         tree_x = SCREEN_WIDTH // 2 + self.rocket_tree_x
         
         # Starting position in tree
         start_y = ground_y - self.rocket_tree_height * 13  # Match the visual height
         
-        while pygame.time.get_ticks() - start_time < 1500:  # 1.5 second fall
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return
-            
-            # Draw background and trees (but not the stuck rocket)
+        # Draw background and trees (but not the stuck rocket)
+        self.draw_background()
+        
+        # Draw trees with NO stuck rocket
+        self.draw_tree(tree_x, ground_y)
+        
+        # Draw player at current position
+        player_x = self.baseball_player_x
+        player_y = ground_y - 20
+        pygame.draw.circle(self.screen, (255, 220, 177), (player_x, player_y - 10), 8)  # Head
+        pygame.draw.line(self.screen, BLACK, (player_x, player_y - 2), (player_x, player_y + 15), 3)  # Body
+        pygame.draw.line(self.screen, BLACK, (player_x - 8, player_y + 5), (player_x + 8, player_y + 5), 3)  # Arms
+        pygame.draw.line(self.screen, BLACK, (player_x - 5, player_y + 15), (player_x + 5, player_y + 15), 3)  # Legs
+        
+        # Calculate falling rocket position
+        t = (pygame.time.get_ticks() - self.fall_start_time) / 1500.0
+        if t <= 1.0:
+            # Simple gravity fall
+            fall_distance = 0.5 * 981 * (t * 1.5)**2  # gravity in cm/s^2, 1.5 sec fall time
+            rocket_y = start_y + fall_distance
+            rocket_y = min(rocket_y, ground_y)  # Don't go below ground
+            
+            # Draw ONLY the falling rocket (no duplicate)
+            falling_rocket = RocketSprite(tree_x + 10, rocket_y)
+            falling_rocket.scale = 0.8
+            falling_rocket.draw_rocket(self.screen)
+    
+    def run_frame(self, frame_time):
+        """Handle input, then update and draw one frame
+        
+        frame_time is the real time in seconds since the previous frame.
+        Returns False once the player has asked to quit.
+        """
+        running = self.handle_events()
+        
+        # Background music follows the game state without blocking the frame
+        if self.state in STATE_MUSIC:
+            self.sound_manager.play_background_music(STATE_MUSIC[self.state])
+        self.sound_manager.update()
+        
+        if self.state == "flying":
+            self.advance_physics(frame_time)
+        else:
+            self.physics_accumulator = 0.0
+        
+        # Time-driven animations
+        if self.state == "throwing":
+            self.update_throw()
+        elif self.state == "rocket_falling":
+            self.update_rocket_falling()
+        elif self.state == "replay":
+            self.update_replay(frame_time)
+        
+        self.begin_frame()
+        if self.state == "menu":
+            self.draw_menu()
+        elif self.state == "countdown":
+            self.draw_countdown()
+        elif self.state == "flying":
+            self.draw_flight(frame_time)
+        elif self.state == "recovery":
+            self.draw_baseball_game()
+        elif self.state == "throwing":
+            self.draw_throw()
+        elif self.state == "rocket_falling":
+            self.draw_rocket_falling()
+        elif self.state == "replay":
+            self.draw_replay()
+        elif self.state == "time_travel":
+            self.update_time_travel()
+            self.draw_time_travel_game()
+        elif self.state == "results":
             self.draw_background()
-            
-            # Draw trees with NO stuck rocket
-            self.draw_tree(tree_x, ground_y)
-            
-            # Draw player at current position
-            player_x = self.baseball_player_x
-            player_y = ground_y - 20
-            pygame.draw.circle(self.screen, (255, 220, 177), (player_x, player_y - 10), 8)  # Head
-            pygame.draw.line(self.screen, BLACK, (player_x, player_y - 2), (player_x, player_y + 15), 3)  # Body
-            pygame.draw.line(self.screen, BLACK, (player_x - 8, player_y + 5), (player_x + 8, player_y + 5), 3)  # Arms
-            pygame.draw.line(self.screen, BLACK, (player_x - 5, player_y + 15), (player_x + 5, player_y + 15), 3)  # Legs
-            
-            # Calculate falling rocket position
-            t = (pygame.time.get_ticks() - start_time) / 1500.0
-            if t <= 1.0:
-                # Simple gravity fall
-                fall_distance = 0.5 * 981 * (t * 1.5)**2  # gravity in cm/s^2, 1.5 sec fall time
-                rocket_y = start_y + fall_distance
-                rocket_y = min(rocket_y, ground_y)  # Don't go below ground
-                
-                # Draw ONLY the falling rocket (no duplicate)
-                falling_rocket = RocketSprite(tree_x + 10, rocket_y)
-                falling_rocket.scale = 0.8
-                falling_rocket.draw_rocket(self.screen)
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            result_text = self.font.render("Mission Complete! Press SPACE for new flight", True, BLACK)
+            result_rect = result_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
+            self.mark_dirty(self.screen.blit(result_text, result_rect))
+        
+        self.present_frame()
+        return running
     
     def run(self):
         running = True
+        frame_time = 0.0  # Real seconds taken by the previous frame
         
         while running:
-            running = self.handle_events()
-            
-            if self.state == "menu":
-                self.draw_menu()
-            elif self.state == "countdown":
-                self.draw_countdown()
-            elif self.state == "flying":
-                self.update_simulation()
-                self.draw_flight()
-            elif self.state == "recovery":
-                self.draw_baseball_game()
-            elif self.state == "time_travel":
-                self.update_time_travel()
-                self.draw_time_travel_game()
-            elif self.state == "results":
-                self.draw_background()
-                result_text = self.font.render("Mission Complete! Press SPACE for new flight", True, BLACK)
-                result_rect = result_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-                self.screen.blit(result_text, result_rect)
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            running = self.run_frame(frame_time)
+            frame_time = self.clock.tick(self.max_fps) / 1000.0
         
         pygame.quit()
 
 if __name__ == "__main__":
-    game = VisualRocketGame()
+    game = VisualRocketGame(dirty_rects="--dirty-rects" in sys.argv,
+                            time_scale=2.0 if "--fast" in sys.argv else 1.0)
     game.run()
\ No newline at end of file
@@ -2,6 +2,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 import random
 import math
+import hashlib
+from time import perf_counter
+from collections import namedtuple
+from trajectory_store import TrajectoryStore, NullTrajectoryStore
+from integrators import rk4_step, rk45_step, error_norm, find_root
+from flight_results import FlightResultWriter
+from flight_recording import FlightRecorder
+from field_geometry import FieldGeometry
 
 class RocketEngine:
     def __init__(self, name, total_impulse, average_thrust, burn_time, delay):
@@ -12,8 +20,9 @@ class RocketEngine:
         self.delay = delay  # seconds
 
 class Rocket:
-    def __init__(self, mass=0.034, diameter=0.0248, length=0.311, cd=0.3):
+    def __init__(self, mass=0.034, diameter=0.0248, length=0.311, cd=0.3, propellant_mass=0.012):
         self.dry_mass = mass  # kg (34g converted)
+        self.propellant_mass = propellant_mass  # kg (estimated)
         self.diameter = diameter  # meters (24.8mm converted)
         self.length = length  # meters (31.1cm converted)
         self.cd = cd  # drag coefficient (estimated for model rocket)
@@ -34,9 +43,42 @@ ENGINES = {
     'C': RocketEngine('C6-5', 10.0, 6.0, 1.667, 5.0)
 }
 
+# Bump when the equations of motion change, so precomputed results are rebuilt
+FLIGHT_MODEL_VERSION = 2
+
+# One state yielded by RocketSimulation.stream_flight; events are the step's
+# events from "burnout", "apogee", "parachute" and "landed" (empty otherwise)
+FlightSample = namedtuple("FlightSample", ["time", "x", "y", "vx", "vy", "events"])
+
+def simulation_fingerprint(sim=None):
+    """Short hash of the rocket, engine and environment parameters
+    
+    Anything precomputed from the simulator (lookup tables, caches) stores this
+    so it can tell when ENGINES or the Rocket parameters have changed. Given a
+    simulation, only its own rocket and engine are hashed; otherwise the
+    default rocket and every engine in ENGINES.
+    """
+    if sim is None:
+        sim = RocketSimulation()
+        engines = [engine for _, engine in sorted(ENGINES.items())]
+    else:
+        engines = [sim.engine]
+    rocket = sim.rocket
+    params = (
+        (rocket.dry_mass, rocket.propellant_mass, rocket.diameter, rocket.length, rocket.cd),
+        tuple((engine.name, engine.total_impulse, engine.average_thrust, engine.burn_time, engine.delay)
+              for engine in engines),
+        (sim.g, sim.air_density, sim.field.key()),
+        FLIGHT_MODEL_VERSION,
+    )
+    return hashlib.sha256(repr(params).encode()).hexdigest()[:16]
+
 class RocketSimulation:
-    def __init__(self, engine_type='B', wind_speed=0, wind_direction=0):
+    def __init__(self, engine_type='B', wind_speed=0, wind_direction=0, history_limit=None,
+                 integrator='euler', kernel='numpy', cache=None, auto_parachute=True,
+                 record_history=True, field=None):
         self.rocket = Rocket()
+        self.engine_type = engine_type
         self.engine = ENGINES[engine_type]
         self.wind_speed = wind_speed  # m/s
         self.wind_direction = wind_direction  # degrees (0 = east, 90 = north)
@@ -50,15 +92,70 @@ class RocketSimulation:
         self.air_density = 1.225  # kg/m^3 at sea level
         self.dt = 0.01  # time step in seconds
         
-        # Football field dimensions (120 yards x 53 yards including end zones)
-        self.field_length = 109.7  # meters
-        self.field_width = 48.8  # meters
-        self.tree_height = 10.0  # meters (estimated)
+        # Integration scheme: "euler" (fixed step), "rk4" (fixed step) or "rk45" (adaptive)
+        if integrator not in ("euler", "rk4", "rk45"):
+            raise ValueError(f"Unknown integrator: {integrator}")
+        self.integrator = integrator
+        
+        # Euler physics kernel: "numpy" (vector ops) or "scalar" (plain floats, much faster)
+        if kernel not in ("numpy", "scalar"):
+            raise ValueError(f"Unknown kernel: {kernel}")
+        self.kernel = kernel
+        
+        # Optional FlightCache shared between simulations
+        self.cache = cache
+        self.rtol = 1e-6  # rk45 relative tolerance
+        self.atol = 1e-6  # rk45 absolute tolerance
+        self.max_time = 300  # 5 minutes max
+        self.step_count = 0
+        
+        # Deploy the parachute at apogee + engine delay; when False it is only
+        # deployed by calling deploy_parachute()
+        self.auto_parachute = auto_parachute
+        
+        # Stepping state (see reset() and step())
+        self.time = 0.0
+        self.landed = False
+        self.max_altitude = 0.0
+        self.apogee_time = 0.0
+        self.parachute_time = math.nan
+        
+        # Flight recording (see start_recording)
+        self.recorder = None
+        self._record_block = 0
+        self._unrecorded = 0
+        
+        # Football field (120 yards x 53 yards including end zones) among the trees;
+        # the flight is in the vertical plane through the field's long axis (z = 0)
+        self.field = field if field is not None else FieldGeometry.default()
+        self.field_length = self.field.length  # meters
+        self.field_width = self.field.width  # meters
         
-        # Simulation data
-        self.time_history = []
-        self.position_history = []
-        self.velocity_history = []
+        # Simulation data (history_limit keeps only the newest samples; with
+        # record_history=False nothing is kept and only the summary survives)
+        if not record_history:
+            self.trajectory = NullTrajectoryStore()
+        elif history_limit is None:
+            self.trajectory = TrajectoryStore()
+        else:
+            self.trajectory = TrajectoryStore(history_limit, ring=True)
+    
+    @property
+    def tree_height(self):
+        """Height rockets outside the field catch at, away from taller trees"""
+        return self.field.default_height
+    
+    @property
+    def time_history(self):
+        return self.trajectory.times
+    
+    @property
+    def position_history(self):
+        return self.trajectory.positions
+    
+    @property
+    def velocity_history(self):
+        return self.trajectory.velocities
         
     def drag_force(self, velocity):
         """Calculate drag force based on velocity"""
@@ -81,77 +178,420 @@ class RocketSimulation:
             return np.array([0.0, self.engine.average_thrust])
         return np.array([0.0, 0.0])
     
+    def mass_at(self, time):
+        """Rocket mass, with the propellant burned off linearly during the engine burn"""
+        if time >= self.engine.burn_time:
+            return self.rocket.dry_mass
+        return self.rocket.dry_mass + self.rocket.propellant_mass * (1 - time / self.engine.burn_time)
+    
+    def landing_altitude(self, x):
+        """Height the rocket comes to rest at: the ground on the field, the branches elsewhere"""
+        return self.field.landing_height(x)
+    
+    def reset(self):
+        """Put the rocket on the pad (center of the field) ready for step()"""
+        self.rocket.position = np.array([self.field_length/2, 0.0])
+        self.rocket.velocity = np.array([0.0, 0.0])
+        self.rocket.mass = self.mass_at(0.0)
+        self.rocket.parachute_deployed = False
+        self.rocket.flight_phase = "launch"
+        self.time = 0.0
+        self.landed = False
+        self.max_altitude = 0.0
+        self.apogee_time = 0.0
+        self.step_count = 0
+        self.parachute_time = math.nan
+        self.trajectory.clear()
+        self.trajectory.append(self.time, self.rocket.position, self.rocket.velocity)
+        if self.recorder is not None:
+            self.recorder.clear()
+            self._unrecorded = 1
+    
+    def deploy_parachute(self, time=None):
+        """Open the parachute at `time` (default now); returns False if it was already open"""
+        if self.rocket.parachute_deployed:
+            return False
+        self.rocket.parachute_deployed = True
+        self.rocket.flight_phase = "descent"
+        self.parachute_time = self.time if time is None else time
+        return True
+    
+    def start_recording(self):
+        """Keep every sample of the flights step() runs from now on, for save_recording
+        
+        Needed when history_limit trims the trajectory. Samples are copied
+        from the trajectory in blocks, so recording adds almost nothing to a
+        step; recording stops at landing.
+        """
+        if isinstance(self.trajectory, NullTrajectoryStore):
+            raise ValueError("Cannot record a simulation created with record_history=False")
+        self.recorder = FlightRecorder()
+        self._record_block = min(256, self.trajectory.capacity)
+        self._unrecorded = len(self.trajectory)
+    
+    def _flush_recording(self):
+        """Copy the samples appended since the last flush into the recorder"""
+        count = self._unrecorded
+        if count:
+            self.recorder.extend(self.time_history[-count:], self.position_history[-count:],
+                                 self.velocity_history[-count:])
+            self._unrecorded = 0
+    
+    def save_recording(self, path, seed=-1, append=True):
+        """Write the flight as a binary recording (see flight_recording)
+        
+        Uses the samples kept since start_recording, or else the trajectory.
+        Recordings are appended to `path` unless append is False, so one
+        file can hold an archive of flights.
+        """
+        if self.recorder is not None:
+            self._flush_recording()
+            recorder = self.recorder
+        else:
+            recorder = FlightRecorder(max(len(self.trajectory), 1))
+            recorder.extend(self.time_history, self.position_history, self.velocity_history)
+        recorder.save(path, self.engine_type, self.wind_speed, self.wind_direction, self.dt,
+                      seed, self.parachute_time, append)
+    
+    def step(self, dt=None):
+        """Advance the flight by one Euler step of dt seconds (default self.dt)
+        
+        Returns the events that happened during the step, in order, from
+        "parachute", "burnout", "apogee" and "landed". Once landed the rocket
+        stays at rest and further steps only advance the clock.
+        """
+        dt = self.dt if dt is None else dt
+        rocket = self.rocket
+        events = []
+        
+        if self.landed:
+            self.time += dt
+            self.trajectory.append(self.time, rocket.position, rocket.velocity)
+            return events
+        
+        # Check for parachute deployment (at apogee + delay)
+        time = self.time
+        if (self.auto_parachute and not rocket.parachute_deployed and
+            time > self.engine.burn_time + self.engine.delay and
+            rocket.velocity[1] <= 0):
+            self.deploy_parachute()
+            events.append("parachute")
+        
+        # Calculate forces
+        rocket.mass = self.mass_at(time)
+        thrust = self.thrust_force(time)
+        drag = self.drag_force(rocket.velocity)
+        gravity = np.array([0.0, -rocket.mass * self.g])
+        
+        # Total force and acceleration
+        total_force = thrust + drag + gravity
+        acceleration = total_force / rocket.mass
+        
+        # Update velocity and position (Euler integration)
+        climbing = rocket.velocity[1] > 0
+        rocket.velocity += acceleration * dt
+        rocket.position += rocket.velocity * dt
+        self.step_count += 1
+        self.time = time + dt
+        
+        if time <= self.engine.burn_time < self.time:
+            if not rocket.parachute_deployed:
+                rocket.flight_phase = "coast"
+            events.append("burnout")
+        if climbing and rocket.velocity[1] <= 0:
+            events.append("apogee")
+        
+        # Track maximum altitude
+        if rocket.position[1] > self.max_altitude:
+            self.max_altitude = rocket.position[1]
+            self.apogee_time = self.time
+        
+        # Land on the ground, or in the branches outside the field (nothing
+        # to look up while the rocket is above the tallest tree)
+        if rocket.position[1] <= self.field.max_height:
+            floor = self.landing_altitude(rocket.position[0])
+            if rocket.position[1] <= floor:
+                rocket.position[1] = floor
+                rocket.velocity = np.array([0.0, 0.0])
+                self.landed = True
+                events.append("landed")
+        
+        self.trajectory.append(self.time, rocket.position, rocket.velocity)
+        if self.recorder is not None:
+            self._unrecorded += 1
+            if self._unrecorded >= self._record_block or self.landed:
+                self._flush_recording()
+        return events
+    
     def simulate_flight(self):
         """Run the complete flight simulation"""
-        time = 0.0
-        self.rocket.position = np.array([self.field_length/2, 0.0])  # Start at center of field
-        self.rocket.velocity = np.array([0.0, 0.0])
-        self.rocket.mass = self.rocket.dry_mass + 0.012  # Add propellant mass (estimated)
+        if self.cache is not None:
+            cached = self.cache.lookup(self)
+            if cached is not None:
+                return cached
         
-        # Clear history
-        self.time_history = []
-        self.position_history = []
-        self.velocity_history = []
+        if self.integrator != "euler":
+            result = self._simulate_flight_runge_kutta()
+        elif self.kernel == "scalar":
+            result = self._simulate_flight_scalar()
+        else:
+            result = self._simulate_flight_euler()
         
-        max_altitude = 0
-        apogee_time = 0
+        if self.cache is not None:
+            self.cache.store(self, result)
+        return result
+    
+    def stream_flight(self, every=1, interval=None):
+        """Run the flight, yielding FlightSample states as they are computed
+        
+        every keeps every Nth step and interval keeps at most one sample per
+        `interval` seconds of sim time (both may be given). The launch state,
+        steps with events and the final state are always yielded. Once the
+        generator is exhausted, max_altitude, apogee_time and
+        check_landing_location() hold the flight summary, as after
+        simulate_flight. The cache is not consulted, and the scalar kernel
+        streams through step(), which it matches exactly.
+        """
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        if self.integrator == "euler":
+            states = self._euler_states()
+        else:
+            states = self._runge_kutta_states()
+        
+        steps = 0
+        next_time = None
+        sample = None
+        for time, position, velocity, events in states:
+            sample = FlightSample(float(time), float(position[0]), float(position[1]),
+                                  float(velocity[0]), float(velocity[1]), events)
+            due = steps % every == 0 and (next_time is None or time >= next_time)
+            if due and interval is not None:
+                next_time = time + interval - 1e-9  # Tolerate accumulated dt rounding
+            if due or events:
+                yield sample
+                sample = None
+            steps += 1
+        
+        if sample is not None:
+            yield sample
+    
+    def _euler_states(self):
+        """Launch state, then (time, position, velocity, events) after each step()"""
+        self.reset()
+        rocket = self.rocket
+        yield self.time, rocket.position, rocket.velocity, ()
+        while not self.landed and self.time <= self.max_time:
+            events = self.step()
+            yield self.time, rocket.position, rocket.velocity, tuple(events)
+    
+    def _simulate_flight_euler(self):
+        """Run the Euler flight one step() at a time"""
+        self.reset()
+        while not self.landed and self.time <= self.max_time:
+            self.step()
+        return self.max_altitude, self.check_landing_location()
+    
+    def _simulate_flight_scalar(self):
+        """Run the Euler flight with the state held in plain floats
+        
+        Same model and update order as step(), but forces are computed
+        inline so no arrays are allocated per step.
+        """
+        dt = self.dt
+        dry_mass = self.rocket.dry_mass
+        propellant_mass = self.rocket.propellant_mass
+        drag_constant = 0.5 * self.air_density * self.rocket.cd * self.rocket.area
+        wind_x = float(self.wind_vector[0])
+        wind_y = float(self.wind_vector[1])
+        burn_time = self.engine.burn_time
+        average_thrust = self.engine.average_thrust
+        deploy_time = self.engine.burn_time + self.engine.delay
+        g = self.g
+        landing_height = self.field.landing_height
+        max_floor = self.field.max_height
+        record = self.trajectory.append_state
+        
+        self.reset()
+        time = 0.0
+        x, y = self.field_length/2, 0.0  # Start at center of field
+        vx, vy = 0.0, 0.0
+        max_altitude = 0.0
+        apogee_time = 0.0
+        steps = 0
+        landed = False
         
-        while True:
-            # Record current state
-            self.time_history.append(time)
-            self.position_history.append(self.rocket.position.copy())
-            self.velocity_history.append(self.rocket.velocity.copy())
+        while time <= self.max_time:
+            if (self.auto_parachute and not self.rocket.parachute_deployed and
+                time > deploy_time and vy <= 0):
+                self.deploy_parachute(time)
+            
+            # Propellant burns off linearly
+            if time >= burn_time:
+                mass = dry_mass
+            else:
+                mass = dry_mass + propellant_mass * (1 - time / burn_time)
+            
+            # Drag relative to the wind
+            rx = vx - wind_x
+            ry = vy - wind_y
+            speed = math.sqrt(rx*rx + ry*ry)
+            if speed == 0:
+                drag_x = drag_y = 0.0
+            else:
+                drag_magnitude = drag_constant * speed**2
+                drag_x = drag_magnitude * (-rx / speed)
+                drag_y = drag_magnitude * (-ry / speed)
+            thrust = average_thrust if time <= burn_time else 0.0
             
-            # Track maximum altitude
-            if self.rocket.position[1] > max_altitude:
-                max_altitude = self.rocket.position[1]
+            vx += (drag_x / mass) * dt
+            vy += ((thrust + drag_y + -mass * g) / mass) * dt
+            x += vx * dt
+            y += vy * dt
+            steps += 1
+            time += dt
+            
+            if y > max_altitude:
+                max_altitude = y
                 apogee_time = time
             
+            # Ground on the field, branches elsewhere
+            if y <= max_floor:
+                floor = landing_height(x)
+                if y <= floor:
+                    y = floor
+                    vx = vy = 0.0
+                    landed = True
+            
+            record(time, x, y, vx, vy)
+            if landed:
+                break
+        
+        self.step_count = steps
+        self.time = time
+        self.landed = landed
+        self.max_altitude = np.float64(max_altitude)  # Same type as the NumPy kernel
+        self.apogee_time = apogee_time
+        self.rocket.mass = mass
+        self.rocket.position = np.array([x, y])
+        self.rocket.velocity = np.array([vx, vy])
+        return self.max_altitude, self.check_landing_location()
+    
+    def acceleration(self, time, velocity, powered):
+        """Acceleration from thrust (if powered), drag and gravity"""
+        mass = self.mass_at(time)
+        drag = self.drag_force(velocity)
+        thrust = self.engine.average_thrust if powered else 0.0
+        return np.array([drag[0] / mass,
+                         (thrust + drag[1]) / mass - self.g])
+    
+    def _simulate_flight_runge_kutta(self):
+        """Run the flight with RK4 or adaptive RK45 steps"""
+        for _ in self._runge_kutta_states():
+            pass
+        return self.max_altitude, self.check_landing_location()
+    
+    def _runge_kutta_states(self):
+        """Launch state, then (time, position, velocity, events) after each RK4/RK45 step
+        
+        Steps are cut so they end exactly at engine burnout and at the
+        parachute-delay time, the apogee is located where vertical velocity
+        crosses zero, and the landing is located where altitude crosses the
+        landing altitude instead of overshooting it.
+        """
+        self.reset()
+        time = 0.0
+        state = np.array([self.field_length/2, 0.0, 0.0, 0.0])  # [x, y, vx, vy]
+        
+        breakpoints = [self.engine.burn_time, self.engine.burn_time + self.engine.delay, self.max_time]
+        max_altitude = 0.0
+        apogee_time = 0.0
+        self.step_count = 0
+        h = self.dt
+        
+        def advance(state, time, h, powered):
+            derivatives = lambda t, y: np.concatenate((y[2:], self.acceleration(t, y[2:], powered)))
+            if self.integrator == "rk4":
+                return rk4_step(derivatives, time, state, h), 0.0
+            new_state, error = rk45_step(derivatives, time, state, h)
+            return new_state, error_norm(error, state, new_state, self.rtol, self.atol)
+        
+        yield time, state[:2], state[2:], ()
+        events = []
+        while time < self.max_time:
             # Check for parachute deployment (at apogee + delay)
-            if (not self.rocket.parachute_deployed and 
+            if (self.auto_parachute and not self.rocket.parachute_deployed and
                 time > self.engine.burn_time + self.engine.delay and
-                self.rocket.velocity[1] <= 0):
-                self.rocket.parachute_deployed = True
-                self.rocket.flight_phase = "descent"
+                state[3] <= 0):
+                self.deploy_parachute(time)
+                events.append("parachute")
             
-            # Calculate forces
-            thrust = self.thrust_force(time)
-            drag = self.drag_force(self.rocket.velocity)
-            gravity = np.array([0.0, -self.rocket.mass * self.g])
+            # Never step across a discontinuity
+            powered = time < self.engine.burn_time
+            next_break = min(b for b in breakpoints if b > time)
+            step = min(h, next_break - time)
             
-            # Total force and acceleration
-            total_force = thrust + drag + gravity
-            acceleration = total_force / self.rocket.mass
+            new_state, error = advance(state, time, step, powered)
+            if error > 1.0:
+                # Reject and retry with a smaller step
+                h = step * max(0.2, 0.9 * error ** -0.2)
+                continue
+            if self.integrator == "rk45":
+                h = step * min(5.0, max(0.2, 0.9 * error ** -0.2)) if error > 0 else step * 5.0
+            self.step_count += 1
             
-            # Update velocity and position (Euler integration)
-            self.rocket.velocity += acceleration * self.dt
-            self.rocket.position += self.rocket.velocity * self.dt
+            # Apogee: vertical velocity crosses zero within the step
+            if state[3] > 0 >= new_state[3]:
+                crossing = find_root(lambda s: advance(state, time, s, powered)[0][3],
+                                     0.0, step, state[3], new_state[3])
+                apex = advance(state, time, crossing, powered)[0]
+                if apex[1] > max_altitude:
+                    max_altitude = apex[1]
+                    apogee_time = time + crossing
+                events.append("apogee")
             
-            # Check for ground impact
-            if self.rocket.position[1] <= 0:
+            # Landing: altitude crosses the ground (or branch) height within the step
+            above = lambda y: y[1] - self.landing_altitude(y[0])
+            if new_state[1] <= self.field.max_height and above(new_state) <= 0 and time > 0:
+                crossing = find_root(lambda s: above(advance(state, time, s, powered)[0]),
+                                     0.0, step, above(state), above(new_state))
+                state = advance(state, time, crossing, powered)[0]
+                state[1] = self.landing_altitude(state[0])
+                state[2:] = 0.0
+                time += crossing
+                self.landed = True
+                self.trajectory.append(time, state[:2], state[2:])
+                events.append("landed")
                 break
-                
-            time += self.dt
             
-            # Safety check for runaway simulation
-            if time > 300:  # 5 minutes max
-                break
+            state = new_state
+            time = next_break if step == next_break - time else time + step
+            self.trajectory.append(time, state[:2], state[2:])
+            if time == self.engine.burn_time:
+                events.append("burnout")
+            
+            if state[1] > max_altitude:
+                max_altitude = state[1]
+                apogee_time = time
+            yield time, state[:2], state[2:], tuple(events)
+            events = []
         
-        return max_altitude, self.check_landing_location()
+        self.time = time
+        self.max_altitude = max_altitude
+        self.apogee_time = apogee_time
+        self.rocket.mass = self.mass_at(time)
+        self.rocket.position = state[:2].copy()
+        self.rocket.velocity = state[2:].copy()
+        if self.landed:
+            yield time, state[:2], state[2:], tuple(events)
     
     def check_landing_location(self):
         """Determine if rocket landed on field or in trees"""
-        final_x = self.rocket.position[0]
-        
-        # Check if within field boundaries
-        if 0 <= final_x <= self.field_length:
-            return "field"
-        else:
-            return "trees"
+        return "field" if self.field.in_field(self.rocket.position[0]) else "trees"
     
     def plot_trajectory(self):
         """Plot the rocket trajectory"""
-        positions = np.array(self.position_history)
+        positions = self.position_history
         
         plt.figure(figsize=(12, 8))
         plt.plot(positions[:, 0], positions[:, 1], 'b-', linewidth=2, label='Trajectory')
@@ -181,9 +621,9 @@ class RocketSimulation:
         plt.axis('equal')
         plt.show()
 
-def run_simulation(engine_type='B', wind_speed=2, wind_direction=270, show_plot=True):
-    """Run a single simulation"""
-    sim = RocketSimulation(engine_type, wind_speed, wind_direction)
+def run_simulation(engine_type='B', wind_speed=2, wind_direction=270, show_plot=True, cache=None):
+    """Run a single simulation (through `cache`, a FlightCache, if given)"""
+    sim = RocketSimulation(engine_type, wind_speed, wind_direction, cache=cache)
     max_altitude, landing = sim.simulate_flight()
     
     print(f"Engine: {engine_type}")
@@ -196,21 +636,67 @@ def run_simulation(engine_type='B', wind_speed=2, wind_direction=270, show_plot=
     
     return max_altitude, landing, sim.rocket.position[0]
 
-def run_multiple_simulations(engine_type='B', num_runs=100):
-    """Run multiple simulations with random wind conditions"""
+def run_multiple_simulations(engine_type='B', num_runs=100, results_path=None, seed=None, workers=1,
+                             chunk_size=65536, cache=None):
+    """Run multiple simulations with random wind conditions
+    
+    With results_path, each flight's inputs and outcome are written to a
+    columnar table (.npz, or .parquet with pyarrow), `chunk_size` rows at a
+    time; see flight_results. A seed makes the wind conditions repeatable.
+    
+    With workers > 1 the flights are run by monte_carlo.run_parallel_simulations
+    across that many processes. Its seeded shards draw different winds from
+    this serial loop, so a seed repeats within a mode but not across modes.
+    
+    `cache` (a FlightCache) serves repeated flights of the serial loop, such
+    as a seeded sweep run again; the batch-simulated parallel path skips it.
+    """
+    if workers > 1:
+        from monte_carlo import run_parallel_simulations  # monte_carlo imports this module
+        return run_parallel_simulations(engine_type, num_runs, seed=seed, workers=workers,
+                                        results_path=results_path, chunk_size=chunk_size).counts
+    
     results = {"field": 0, "trees": 0}
     altitudes = []
+    rng = random.Random(seed) if seed is not None else random
+    writer = FlightResultWriter(results_path, chunk_size) if results_path is not None else None
+    rows = {name: [] for name in ("wind_speed", "wind_direction", "max_altitude", "apogee_time",
+                                  "landing_x", "landing_zone", "steps", "wall_time")}
+    
+    def write_rows():
+        """Hand the buffered rows to the writer as one block of columns"""
+        count = len(rows["steps"])
+        writer.write(dict(rows, seed=np.full(count, -1 if seed is None else seed), shard=np.zeros(count),
+                          engine=np.full(count, engine_type)))
+        for column in rows.values():
+            column.clear()
     
     for i in range(num_runs):
         # Random wind conditions
-        wind_speed = random.uniform(0, 8)  # 0-8 m/s wind
-        wind_direction = random.uniform(0, 360)  # random direction
+        wind_speed = rng.uniform(0, 8)  # 0-8 m/s wind
+        wind_direction = rng.uniform(0, 360)  # random direction
         
-        sim = RocketSimulation(engine_type, wind_speed, wind_direction)
+        sim = RocketSimulation(engine_type, wind_speed, wind_direction, record_history=False, cache=cache)
+        start = perf_counter()
         altitude, landing = sim.simulate_flight()
+        wall_time = perf_counter() - start
         
         results[landing] += 1
         altitudes.append(altitude)
+        
+        if writer is not None:
+            for name, value in (("wind_speed", wind_speed), ("wind_direction", wind_direction),
+                                ("max_altitude", altitude), ("apogee_time", sim.apogee_time),
+                                ("landing_x", sim.rocket.position[0]), ("landing_zone", landing),
+                                ("steps", sim.step_count), ("wall_time", wall_time)):
+                rows[name].append(value)
+            if len(rows["steps"]) == writer.chunk_size:
+                write_rows()
+    
+    if writer is not None:
+        if rows["steps"]:
+            write_rows()
+        writer.close()
     
     print(f"\n=== Results for {num_runs} flights with Engine {engine_type} ===")
     print(f"Landed on field: {results['field']} ({results['field']/num_runs*100:.1f}%)")
@@ -221,10 +707,16 @@ def run_multiple_simulations(engine_type='B', num_runs=100):
     return results
 
 if __name__ == "__main__":
+    from flight_cache import FlightCache, FLIGHT_CACHE_DIR  # flight_cache imports this module
+    
+    # Seeded flights are cached on disk, so running the script again reuses them
+    cache = FlightCache(trajectory_budget=64 * 2**20, disk_dir=FLIGHT_CACHE_DIR)
+    
     # Run single simulation
     print("Single Flight Simulation:")
-    run_simulation('C', wind_speed=3, wind_direction=270)
+    run_simulation('C', wind_speed=3, wind_direction=270, cache=cache)
     
     # Run multiple simulations for each engine type
-    for engine in ['A', 'B', 'C']:
-        run_multiple_simulations(engine, 50)
\ No newline at end of file
+    for seed, engine in enumerate(['A', 'B', 'C']):
+        run_multiple_simulations(engine, 50, seed=seed, cache=cache)
+    print(f"Flight cache: {cache.stats()}")
\ No newline at end of file
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from apogee_table import ApogeeTable
+from batch_simulation import simulate_batch
+from field_geometry import FieldGeometry
+
+
+@pytest.fixture(scope="module")
+def table():
+    return ApogeeTable.build(speed_step=2.5, direction_step=45.0)
+
+
+def test_query_many_matches_query(table):
+    engines = np.array(['A', 'B', 'C', 'B'])
+    speeds = np.array([0.0, 3.3, 7.1, 9.9])
+    directions = np.array([0.0, 100.0, 215.0, 359.0])
+    altitude, landing_x, in_field = table.query_many(engines, speeds, directions)
+    for i in range(len(engines)):
+        one_altitude, one_landing_x, one_landing = table.query(engines[i], speeds[i], directions[i])
+        assert altitude[i] == pytest.approx(one_altitude)
+        assert landing_x[i] == pytest.approx(one_landing_x)
+        assert in_field[i] == (one_landing == "field")
+
+
+def test_unknown_engine_raises_key_error(table):
+    with pytest.raises(KeyError):
+        table.query('Z', 3.0, 90.0)
+    with pytest.raises(KeyError):
+        table.query_many(np.array(['A', 'Z']), 3.0, 90.0)
+    with pytest.raises(KeyError):
+        table.query_many('Z', np.array([1.0, 2.0]), 90.0)
+
+
+def test_table_classifies_with_its_field(tmp_path):
+    short = FieldGeometry(length=60.0)
+    table = ApogeeTable.build(speed_step=2.5, direction_step=45.0, field=short)
+    assert table.field is short
+    engines = np.array(['A', 'B', 'C', 'C', 'B'])
+    speeds = np.array([0.0, 2.5, 5.0, 7.5, 10.0])
+    directions = np.array([0.0, 0.0, 180.0, 0.0, 90.0])
+    _, landing_x, in_field = table.query_many(engines, speeds, directions)
+    np.testing.assert_array_equal(in_field, short.in_field(landing_x))
+    direct = simulate_batch(engines, speeds, directions, field=short)
+    np.testing.assert_array_equal(in_field, direct["in_field"])
+    for i in range(len(engines)):
+        assert table.query(engines[i], speeds[i], directions[i])[2] == direct["landing_zone"][i]
+
+    # Saved with its field: current for that field, stale for any other
+    path = str(tmp_path / "table.npz")
+    table.save(path)
+    assert ApogeeTable.load(path, short).is_current()
+    assert not ApogeeTable.load(path).is_current()
+
+
+def test_load_or_build_survives_an_unwritable_path(table, tmp_path, monkeypatch):
+    monkeypatch.setattr(ApogeeTable, "build", classmethod(lambda cls, field=None: table))
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    assert ApogeeTable.load_or_build(str(blocker / "apogee_table.npz")) is table  # Its directory is a file
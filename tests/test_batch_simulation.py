@@ -0,0 +1,26 @@
+import warnings
+import numpy as np
+import pytest
+from batch_simulation import simulate_batch
+from rocket_simulation import RocketSimulation
+
+
+def test_unknown_engine_raises_key_error():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # No divide-by-zero warnings from a missing burn time
+        with pytest.raises(KeyError, match="Z"):
+            simulate_batch(['Z', 'A'], 1.0, 0.0)
+        with pytest.raises(KeyError):
+            simulate_batch('Z', np.array([1.0, 2.0]), 0.0)
+
+
+def test_batch_matches_single_flights():
+    engines = np.array(['A', 'B', 'C'])
+    speeds = np.array([0.0, 3.0, 6.5])
+    directions = np.array([0.0, 90.0, 200.0])
+    results = simulate_batch(engines, speeds, directions)
+    for i in range(len(engines)):
+        sim = RocketSimulation(engines[i], speeds[i], directions[i], record_history=False)
+        altitude, landing = sim.simulate_flight()
+        assert results["max_altitude"][i] == pytest.approx(altitude, rel=1e-9)
+        assert results["landing_zone"][i] == landing
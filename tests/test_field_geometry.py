@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from batch_simulation import simulate_batch
+from field_geometry import FieldGeometry, Tree, TreeLine
+from rocket_simulation import RocketSimulation
+
+
+def tall_site():
+    """A site with a taller stand of woods and a taller tree, so boundary cells need exact tests"""
+    return FieldGeometry(tree_lines=[TreeLine([(-30, -40), (-5, -40), (-5, 40), (-30, 40)], height=12.0)],
+                         trees=[Tree(130.0, 5.0, height=15.0, canopy_radius=6.0)])
+
+
+@pytest.fixture(params=["default", "tall"])
+def field(request):
+    return FieldGeometry.default() if request.param == "default" else tall_site()
+
+
+def scalar_classify(field, x, z):
+    flags = np.vectorize(lambda a, b: field.in_field(a, b))(x, z)
+    heights = np.vectorize(field.landing_height, otypes=[float])(x, z)
+    return flags, heights
+
+
+@pytest.mark.parametrize("shape", [(7, 5), (3, 4, 5)])
+def test_classify_many_keeps_the_broadcast_shape(field, shape):
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-60.0, 170.0, shape)
+    z = rng.uniform(-80.0, 80.0, shape)
+    in_field, heights = field.classify_many(x, z)
+    assert in_field.shape == heights.shape == shape
+    expected_flags, expected_heights = scalar_classify(field, x, z)
+    np.testing.assert_array_equal(in_field, expected_flags)
+    np.testing.assert_array_equal(heights, expected_heights)
+
+
+def test_classify_many_broadcasts_x_against_z(field):
+    x = np.linspace(-60.0, 170.0, 47)[:, None]
+    z = np.linspace(-80.0, 80.0, 33)
+    in_field, heights = field.classify_many(x, z)
+    assert in_field.shape == heights.shape == (47, 33)
+    expected_flags, expected_heights = scalar_classify(field, *np.broadcast_arrays(x, z))
+    np.testing.assert_array_equal(in_field, expected_flags)
+    np.testing.assert_array_equal(heights, expected_heights)
+
+
+def test_zero_dimensional_input(field):
+    for x in (3.0, -3.0, 120.0, 130.0):
+        in_field, heights = field.classify_many(np.float64(x))
+        assert np.ndim(heights) == 0
+        assert bool(in_field) == field.in_field(x)
+        assert float(heights) == field.landing_height(x)
+        assert float(field.landing_heights(np.float64(x), np.float64(5.0))) == field.landing_height(x, 5.0)
+
+
+def test_taller_features_raise_the_landing_height():
+    field = tall_site()
+    assert field.landing_height(50.0) == 0.0
+    assert field.landing_height(-10.0) == 12.0
+    assert field.landing_height(130.0, 5.0) == 15.0
+    assert field.landing_height(130.0, 20.0) == field.default_height
+
+
+@pytest.mark.parametrize("wind_speed, wind_direction", [(0.0, 0.0), (4.0, 90.0), (7.5, 0.0), (9.0, 180.0)])
+def test_scalar_simulation_matches_batch(wind_speed, wind_direction):
+    field = tall_site()
+    results = simulate_batch('C', wind_speed, wind_direction, field=field)
+    for kernel in ('scalar', 'numpy'):
+        sim = RocketSimulation('C', wind_speed, wind_direction, kernel=kernel, field=field)
+        max_altitude, landing = sim.simulate_flight()
+        assert landing == results["landing_zone"][0]
+        assert sim.rocket.position[0] == pytest.approx(results["landing_x"][0], abs=1e-9)
+        assert max_altitude == pytest.approx(results["max_altitude"][0], rel=1e-12)
@@ -0,0 +1,114 @@
+import math
+import numpy as np
+import pytest
+from flight_cache import FlightCache
+from rocket_simulation import RocketSimulation, run_multiple_simulations
+
+FIELDS = ("max_altitude", "apogee_time", "time", "landed", "parachute_time", "step_count")
+
+
+def assert_same_flight(cached, fresh):
+    for name in FIELDS:
+        a, b = getattr(cached, name), getattr(fresh, name)
+        if isinstance(b, float) and math.isnan(b):
+            assert math.isnan(a), name
+        else:
+            assert a == b, name
+    assert cached.rocket.parachute_deployed == fresh.rocket.parachute_deployed
+    assert cached.rocket.mass == fresh.rocket.mass
+    np.testing.assert_array_equal(cached.rocket.position, fresh.rocket.position)
+    np.testing.assert_array_equal(cached.rocket.velocity, fresh.rocket.velocity)
+    assert cached.check_landing_location() == fresh.check_landing_location()
+
+
+@pytest.mark.parametrize("options", [{}, {"kernel": "scalar"}, {"integrator": "rk45"},
+                                     {"auto_parachute": False}])
+def test_cache_hit_matches_fresh_run(options):
+    cache = FlightCache(trajectory_budget=10**8)
+    RocketSimulation('B', 3.7, 60, cache=cache, **options).simulate_flight()
+
+    cached = RocketSimulation('B', 3.7, 60, cache=cache, **options)
+    result = cached.simulate_flight()
+    assert cache.hits == 1
+    fresh = RocketSimulation('B', 3.7, 60, **options)
+    assert result == fresh.simulate_flight()
+    assert_same_flight(cached, fresh)
+    np.testing.assert_array_equal(cached.time_history, fresh.time_history)
+    np.testing.assert_array_equal(cached.position_history, fresh.position_history)
+
+
+def test_disk_hit_matches_fresh_run(tmp_path):
+    RocketSimulation('C', 5.0, 10, cache=FlightCache(disk_dir=tmp_path, trajectory_budget=10**8)).simulate_flight()
+
+    cache = FlightCache(disk_dir=tmp_path)
+    cached = RocketSimulation('C', 5.0, 10, cache=cache)
+    result = cached.simulate_flight()
+    assert cache.disk_hits == 1
+    fresh = RocketSimulation('C', 5.0, 10)
+    assert result == fresh.simulate_flight()
+    assert_same_flight(cached, fresh)
+    np.testing.assert_array_equal(cached.position_history, fresh.position_history)
+
+
+@pytest.mark.parametrize("options", [{}, {"history_limit": 50}])
+def test_entry_without_trajectory_is_a_miss_for_history(tmp_path, options):
+    # The default budget keeps no trajectories, in memory or on disk
+    cache = FlightCache(disk_dir=tmp_path)
+    RocketSimulation('B', 3.7, 60, cache=cache, **options).simulate_flight()
+
+    for current in (cache, FlightCache(disk_dir=tmp_path)):
+        again = RocketSimulation('B', 3.7, 60, cache=current, **options)
+        again.simulate_flight()
+        assert current.hits == current.disk_hits == 0
+        fresh = RocketSimulation('B', 3.7, 60, **options)
+        fresh.simulate_flight()
+        assert len(again.position_history) == len(fresh.position_history) > 0
+        np.testing.assert_array_equal(again.position_history, fresh.position_history)
+
+
+def test_default_budget_serves_summary_only_runs():
+    cache = FlightCache()
+    RocketSimulation('B', 3.7, 60, cache=cache, record_history=False).simulate_flight()
+
+    cached = RocketSimulation('B', 3.7, 60, cache=cache, record_history=False)
+    result = cached.simulate_flight()
+    assert cache.hits == 1
+    fresh = RocketSimulation('B', 3.7, 60, record_history=False)
+    assert result == fresh.simulate_flight()
+    assert_same_flight(cached, fresh)
+
+
+def test_summary_only_run_does_not_serve_full_history():
+    cache = FlightCache(trajectory_budget=10**8)
+    RocketSimulation('B', 2.0, 0, cache=cache, record_history=False).simulate_flight()
+
+    full = RocketSimulation('B', 2.0, 0, cache=cache)
+    full.simulate_flight()
+    fresh = RocketSimulation('B', 2.0, 0)
+    fresh.simulate_flight()
+    assert len(full.position_history) == len(fresh.position_history) > 0
+    np.testing.assert_array_equal(full.position_history, fresh.position_history)
+
+
+def test_history_limit_is_part_of_the_key():
+    cache = FlightCache(trajectory_budget=10**8)
+    RocketSimulation('B', 2.0, 0, cache=cache, history_limit=50).simulate_flight()
+
+    full = RocketSimulation('B', 2.0, 0, cache=cache)
+    full.simulate_flight()
+    assert cache.hits == 0
+    limited = RocketSimulation('B', 2.0, 0, cache=cache, history_limit=50)
+    limited.simulate_flight()
+    assert cache.hits == 1
+    assert len(limited.position_history) == 50
+    np.testing.assert_array_equal(limited.position_history, full.position_history[-50:])
+
+
+def test_repeated_seeded_sweep_is_served_from_the_cache(tmp_path):
+    cache = FlightCache(disk_dir=tmp_path)
+    first = run_multiple_simulations('A', 20, seed=3, cache=cache)
+    assert cache.misses == 20 and cache.hits == 0
+
+    again = FlightCache(disk_dir=tmp_path)
+    assert run_multiple_simulations('A', 20, seed=3, cache=again) == first
+    assert again.hits == again.disk_hits == 20
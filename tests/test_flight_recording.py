@@ -0,0 +1,40 @@
+import numpy as np
+from flight_recording import FlightArchive, FlightRecorder, trim_recordings
+
+
+def record(path, count, wind_speed):
+    recorder = FlightRecorder()
+    times = np.arange(count) * 0.01
+    positions = np.stack([times, times * 2], axis=1)
+    recorder.extend(times, positions, positions)
+    recorder.save(path, "B", wind_speed, 90.0, 0.01)
+
+
+def test_trim_keeps_the_newest_flights(tmp_path):
+    path = str(tmp_path / "flights.rkf")
+    for i in range(10):
+        record(path, 5 + i, float(i))
+    assert trim_recordings(path, 4) == 6
+    archive = FlightArchive(path)
+    assert len(archive) == 4
+    assert [flight.wind_speed for flight in archive] == [6.0, 7.0, 8.0, 9.0]
+    assert [len(flight) for flight in archive] == [11, 12, 13, 14]
+    np.testing.assert_allclose(archive[-1].times, np.arange(14) * 0.01, rtol=1e-6)
+
+
+def test_trim_waits_for_the_slack(tmp_path):
+    path = str(tmp_path / "flights.rkf")
+    for i in range(5):
+        record(path, 3, float(i))
+    assert trim_recordings(path, 4, slack=1) == 0
+    record(path, 3, 5.0)
+    assert trim_recordings(path, 4, slack=1) == 2
+    assert len(FlightArchive(path)) == 4
+    assert trim_recordings(str(tmp_path / "missing.rkf"), 4) == 0
+
+
+def test_trim_to_nothing(tmp_path):
+    path = str(tmp_path / "flights.rkf")
+    record(path, 3, 1.0)
+    assert trim_recordings(path, 0) == 1
+    assert len(FlightArchive(path)) == 0
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from flight_results import COLUMN_NAMES, load_flight_results
+from rocket_simulation import RocketSimulation, run_multiple_simulations
+
+
+@pytest.mark.parametrize("chunk_size", [4, 100])
+def test_run_multiple_simulations_writes_every_flight(tmp_path, monkeypatch, chunk_size):
+    import flight_results
+    writes = []
+    original_write = flight_results.FlightResultWriter.write
+
+    def counting_write(writer, columns):
+        writes.append(len(columns["steps"]))
+        original_write(writer, columns)
+
+    monkeypatch.setattr(flight_results.FlightResultWriter, "write", counting_write)
+
+    path = tmp_path / "flights.npz"
+    counts = run_multiple_simulations('B', 10, results_path=str(path), seed=3, chunk_size=chunk_size)
+    table = load_flight_results(str(path))
+
+    assert sorted(table) == sorted(COLUMN_NAMES)
+    assert len(table["steps"]) == 10
+    assert writes == [min(chunk_size, 10 - i) for i in range(0, 10, chunk_size)]  # Whole chunks, not rows
+    assert int(np.count_nonzero(table["landing_zone"] == "field")) == counts["field"]
+    assert set(table["seed"]) == {3} and set(table["engine"]) == {'B'}
+
+    # Each row reproduces with a direct simulation
+    sim = RocketSimulation('B', table["wind_speed"][0], table["wind_direction"][0])
+    altitude, landing = sim.simulate_flight()
+    assert table["max_altitude"][0] == altitude
+    assert table["landing_zone"][0] == landing
+    assert table["steps"][0] == sim.step_count
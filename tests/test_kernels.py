@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from rocket_simulation import RocketSimulation
+
+CONDITIONS = [('A', 0.0, 0.0), ('B', 3.0, 30.0), ('C', 8.0, 0.0), ('C', 6.5, 200.0)]
+
+
+@pytest.mark.parametrize("engine, wind_speed, wind_direction", CONDITIONS)
+def test_scalar_kernel_matches_numpy_kernel(engine, wind_speed, wind_direction):
+    numpy_sim = RocketSimulation(engine, wind_speed, wind_direction, kernel='numpy')
+    scalar_sim = RocketSimulation(engine, wind_speed, wind_direction, kernel='scalar')
+    numpy_altitude, numpy_landing = numpy_sim.simulate_flight()
+    scalar_altitude, scalar_landing = scalar_sim.simulate_flight()
+
+    assert scalar_landing == numpy_landing
+    assert scalar_altitude == pytest.approx(numpy_altitude, rel=1e-12)
+    assert scalar_sim.step_count == numpy_sim.step_count
+    assert scalar_sim.landed and numpy_sim.landed
+    assert scalar_sim.apogee_time == pytest.approx(numpy_sim.apogee_time)
+    np.testing.assert_allclose(scalar_sim.rocket.position, numpy_sim.rocket.position, rtol=1e-9)
+    np.testing.assert_allclose(scalar_sim.position_history, numpy_sim.position_history, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("engine, wind_speed, wind_direction", CONDITIONS)
+def test_scalar_kernel_returns_numpy_kernel_types(engine, wind_speed, wind_direction):
+    numpy_sim = RocketSimulation(engine, wind_speed, wind_direction, kernel='numpy')
+    scalar_sim = RocketSimulation(engine, wind_speed, wind_direction, kernel='scalar')
+    numpy_result = numpy_sim.simulate_flight()
+    scalar_result = scalar_sim.simulate_flight()
+
+    assert [type(value) for value in scalar_result] == [type(value) for value in numpy_result]
+    for name in ("max_altitude", "apogee_time", "time", "step_count"):
+        assert type(getattr(scalar_sim, name)) is type(getattr(numpy_sim, name)), name
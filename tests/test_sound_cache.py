@@ -0,0 +1,86 @@
+import time
+import numpy as np
+import pytest
+from benchmark import load_game
+
+
+@pytest.fixture(scope="module")
+def game():
+    return load_game()
+
+
+def chirp(t, pitch=440.0):
+    return 0.5 * np.sin(2 * np.pi * pitch * t)
+
+
+def test_warm_load_matches_synthesis(game, tmp_path):
+    cold, synthesized = game.load_or_synthesize("chirp", chirp, 0.2, str(tmp_path))
+    assert synthesized
+    warm, synthesized = game.load_or_synthesize("chirp", chirp, 0.2, str(tmp_path))
+    assert not synthesized
+    assert isinstance(warm, np.memmap)
+    np.testing.assert_array_equal(warm, cold)
+    uncached, _ = game.load_or_synthesize("chirp", chirp, 0.2, None)
+    np.testing.assert_array_equal(warm, uncached)
+
+
+def test_changed_synthesis_misses_the_cache(game, tmp_path):
+    game.load_or_synthesize("chirp", chirp, 0.2, str(tmp_path))
+
+    def lower_chirp(t, pitch=220.0):
+        return 0.5 * np.sin(2 * np.pi * pitch * t)
+
+    buffer, synthesized = game.load_or_synthesize("chirp", lower_chirp, 0.2, str(tmp_path))
+    assert synthesized
+    np.testing.assert_array_equal(buffer, game.load_or_synthesize("chirp", lower_chirp, 0.2, None)[0])
+    _, synthesized = game.load_or_synthesize("chirp", chirp, 0.3, str(tmp_path))
+    assert synthesized  # Another duration
+
+
+def test_corrupt_cache_file_is_resynthesized(game, tmp_path):
+    game.load_or_synthesize("chirp", chirp, 0.2, str(tmp_path))
+    for path in tmp_path.iterdir():
+        path.write_bytes(b"not a numpy file")
+    buffer, synthesized = game.load_or_synthesize("chirp", chirp, 0.2, str(tmp_path))
+    assert synthesized
+    np.testing.assert_array_equal(buffer, game.load_or_synthesize("chirp", chirp, 0.2, None)[0])
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture(scope="module")
+def sounds(game, tmp_path_factory):
+    return game.SoundManager(cache_dir=str(tmp_path_factory.mktemp("sounds")))
+
+
+def test_prefetch_does_nothing_while_music_is_off(sounds):
+    sounds.music_enabled = False
+    sounds.prefetch_music("flight")
+    assert not sounds._music_queued
+    assert sounds._music_requests.empty()
+
+
+def test_music_worker_survives_a_failed_track(sounds, monkeypatch):
+    sounds.music_enabled = True
+    synthesize = sounds.create_background_music_buffer
+    failures = []
+
+    def fail_once(music_type, duration=30.0):
+        if not failures:
+            failures.append(music_type)
+            raise RuntimeError("synthesis failed")
+        return synthesize(music_type, duration)
+
+    monkeypatch.setattr(sounds, "create_background_music_buffer", fail_once)
+    sounds.prefetch_music("results")
+    wait_for(lambda: failures and not sounds._music_queued)
+    assert "results" not in sounds._music_buffers
+
+    sounds.prefetch_music("results")  # Queued again and generated by the same worker
+    wait_for(lambda: "results" in sounds._music_buffers)
+    assert sounds._music_worker.is_alive()
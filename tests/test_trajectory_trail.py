@@ -0,0 +1,35 @@
+import pytest
+from benchmark import load_game
+
+
+@pytest.fixture(scope="module")
+def game():
+    return load_game()
+
+
+def faded_alpha(game, fps, seconds=1.0):
+    """Alpha of the first chunk after `seconds` of a trail drawn at `fps`"""
+    trail = game.TrajectoryTrail((200, 200))
+    for frame in range(round(seconds * fps)):
+        trail.add((frame % 200, (frame * 7) % 200))
+        trail.fade(1.0 / fps)
+    return trail.chunks[0][2], trail.chunks[0][0].get_alpha()
+
+
+def test_fade_is_independent_of_frame_rate(game):
+    alpha_60, surface_alpha_60 = faded_alpha(game, 60)
+    for fps in (30, 120, 144):
+        alpha, surface_alpha = faded_alpha(game, fps)
+        # The first chunk is cut at most one frame later at lower rates
+        assert alpha == pytest.approx(alpha_60, abs=game.TrajectoryTrail.FADE_RATE / 30 + 1e-6)
+        assert abs(surface_alpha - surface_alpha_60) <= game.TrajectoryTrail.FADE_RATE / 30 + 1
+
+
+def test_trail_fades_out_after_its_lifetime(game):
+    trail = game.TrajectoryTrail((200, 200))
+    trail.add((0, 0))
+    trail.add((50, 50))
+    lifetime = 255 / game.TrajectoryTrail.FADE_RATE + game.TrajectoryTrail.CHUNK_SECONDS
+    for _ in range(round(lifetime * 90) + 2):
+        trail.fade(1.0 / 90)
+    assert not trail.chunks
@@ -0,0 +1,153 @@
+import numpy as np
+
+
+class TrajectoryStore:
+    """Flight history kept in preallocated contiguous float arrays.
+
+    In the default mode the arrays grow geometrically as samples are appended.
+    In ring mode the store keeps only the newest `capacity` samples; every
+    sample is written twice, `capacity` rows apart, so the live window is always
+    one contiguous slice and the history properties stay zero-copy views.
+    """
+
+    def __init__(self, capacity=1024, ring=False):
+        self.capacity = capacity
+        self.ring = ring
+        rows = capacity * 2 if ring else capacity
+        self._times = np.empty(rows)
+        self._positions = np.empty((rows, 2))
+        self._velocities = np.empty((rows, 2))
+        self._start = 0  # first live row (ring mode only)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+
+    def append(self, time, position, velocity):
+        """Record one sample (time in seconds, [x, y] position and velocity)"""
+        if self.ring:
+            if self._size < self.capacity:
+                index = self._size
+                self._size += 1
+            else:
+                index = self._start
+                self._start = (self._start + 1) % self.capacity
+            mirror = index + self.capacity
+            self._times[index] = self._times[mirror] = time
+            self._positions[index] = self._positions[mirror] = position
+            self._velocities[index] = self._velocities[mirror] = velocity
+            return
+
+        if self._size == self.capacity:
+            self._grow()
+        index = self._size
+        self._times[index] = time
+        self._positions[index] = position
+        self._velocities[index] = velocity
+        self._size += 1
+
+    def append_state(self, time, x, y, vx, vy):
+        """Record one sample given as plain floats"""
+        if self.ring:
+            self.append(time, (x, y), (vx, vy))
+            return
+
+        if self._size == self.capacity:
+            self._grow()
+        index = self._size
+        self._times[index] = time
+        positions = self._positions
+        positions[index, 0] = x
+        positions[index, 1] = y
+        velocities = self._velocities
+        velocities[index, 0] = vx
+        velocities[index, 1] = vy
+        self._size += 1
+
+    def extend(self, times, positions, velocities):
+        """Record many samples at once from arrays"""
+        if self.ring:
+            for sample in zip(times, positions, velocities):
+                self.append(*sample)
+            return
+
+        count = len(times)
+        while self._size + count > self.capacity:
+            self._grow()
+        end = self._size + count
+        self._times[self._size:end] = times
+        self._positions[self._size:end] = positions
+        self._velocities[self._size:end] = velocities
+        self._size = end
+
+    def _grow(self):
+        """Double the capacity, keeping the recorded samples"""
+        self.capacity *= 2
+        for name in ("_times", "_positions", "_velocities"):
+            old = getattr(self, name)
+            new = np.empty((self.capacity,) + old.shape[1:])
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def _window(self, array):
+        return array[self._start:self._start + self._size]
+
+    @property
+    def times(self):
+        return self._window(self._times)
+
+    @property
+    def positions(self):
+        return self._window(self._positions)
+
+    @property
+    def velocities(self):
+        return self._window(self._velocities)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the backing arrays"""
+        return self._times.nbytes + self._positions.nbytes + self._velocities.nbytes
+
+
+class NullTrajectoryStore:
+    """Stand-in for TrajectoryStore that records nothing
+
+    Used by summary-only simulations, which keep just the running apogee and
+    final state, so memory stays constant however long the flight runs.
+    """
+
+    capacity = 0
+    ring = False
+    nbytes = 0
+
+    def __len__(self):
+        return 0
+
+    def clear(self):
+        pass
+
+    def append(self, time, position, velocity):
+        pass
+
+    def append_state(self, time, x, y, vx, vy):
+        pass
+
+    def extend(self, times, positions, velocities):
+        pass
+
+    @property
+    def times(self):
+        return np.empty(0)
+
+    @property
+    def positions(self):
+        return np.empty((0, 2))
+
+    @property
+    def velocities(self):
+        return np.empty((0, 2))